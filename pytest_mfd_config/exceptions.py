@@ -5,3 +5,11 @@
 
 class PyTestMFDConfigException(Exception):
     """General pytest_mfd_config exceptions."""
+
+
+class SetupDeadlineExceededError(PyTestMFDConfigException):
+    """Raised if setup phase of host or switch did not finish within configured deadline."""
+
+
+class CircuitOpenError(PyTestMFDConfigException):
+    """Raised if connection attempt is rejected by circuit breaker due to repeated failures to the same endpoint."""
@@ -2,10 +2,11 @@
 # SPDX-License-Identifier: MIT
 """Pytest plugin for handling configuration."""
 
-import copy
+import json
 import logging
 import os
-from typing import Any, Optional, List, TYPE_CHECKING, Dict, Tuple
+import warnings
+from typing import Any, Callable, Optional, List, TYPE_CHECKING, Dict, Mapping, Tuple, Generator
 
 import pytest  # noqa: F401
 from _pytest.fixtures import FixtureRequest
@@ -14,7 +15,7 @@ from pydantic import SecretStr
 from mfd_common_libs import log_levels, add_logging_level
 from mfd_host import Host
 
-from pytest_mfd_config.exceptions import PyTestMFDConfigException
+from pytest_mfd_config.exceptions import PyTestMFDConfigException, SetupDeadlineExceededError
 from pytest_mfd_config.models.test_config import HostPairConnectionModel, SecretModel
 from pytest_mfd_config.models.topology import (
     SwitchModel,
@@ -27,10 +28,44 @@ from pytest_mfd_config.utils.config_utils import (
     load_test_config,
     get_item_by_name,
     Connections,
+    DegradedHosts,
     _log_config,
 )
+from pytest_mfd_config.utils.preflight import (
+    collect_endpoints,
+    probe_endpoints,
+    format_probe_table,
+    get_unreachable_required,
+)
+from pytest_mfd_config.utils.deadlines import setup_deadlines, parse_setup_deadlines, run_with_deadline
+from pytest_mfd_config.utils.circuit_breaker import circuit_breaker
+from pytest_mfd_config.utils.connection_registry import connection_registry, connection_fingerprint
+from pytest_mfd_config.utils.teardown import (
+    CloseFailure,
+    Resource,
+    close_resources,
+    host_resources,
+    power_mng_resources,
+    switch_resources,
+)
+from pytest_mfd_config.utils.leak_tracker import leak_tracker, format_open_counts
+from pytest_mfd_config.utils.keepalive import keepalive_monitor
+from pytest_mfd_config.utils.switches import LazySwitches, device_type_key, switch_device_types
+from pytest_mfd_config.utils.switch_ports import SwitchPortDetails, collect_switch_port_details
+from pytest_mfd_config.utils.power_mng import LazyPowerManagement, build_power_mng_kwargs, get_missing_init_parameters
+from pytest_mfd_config.utils.power_operations import BulkPower
+from pytest_mfd_config.utils.reconnect import HostReconnector
+from pytest_mfd_config.utils.fan_out import FanOut
+from pytest_mfd_config.utils.host_facts import HostFacts, invalidate_on_power_actions
+from pytest_mfd_config.utils.extra_data_sink import extra_data_sink
+from pytest_mfd_config.utils.queued_logging import DROP_POLICIES, queued_logging
+from pytest_mfd_config.utils.host_logs import host_log_router, log_owner
+from pytest_mfd_config.utils.connection_metrics import ConnectionMetrics, call_metrics
+from pytest_mfd_config.utils.secrets import LazySecrets, get_cipher, host_password_cache, is_fernet_token
 
 logger = logging.getLogger(__name__)
+failed_hosts_key = pytest.StashKey[Dict[str, str]]()
+close_failures_key = pytest.StashKey[List[CloseFailure]]()
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 add_logging_level(level_name="CMD", level_value=log_levels.CMD)
 add_logging_level(level_name="OUT", level_value=log_levels.OUT)
@@ -41,8 +76,13 @@ if TYPE_CHECKING:
     from mfd_powermanagement.base import PowerManagement
     from mfd_switchmanagement.base import Switch
     from pytest_mfd_config.models.topology import HostModel
+    from _pytest.config import Config
+    from _pytest.main import Session
     from _pytest.nodes import Item
+    from _pytest.terminal import TerminalReporter
     from _pytest.python import Metafunc
+    from _pytest.runner import CallInfo
+    from _pytest.reports import TestReport
 
 
 def pytest_addoption(parser: Any) -> None:
@@ -60,6 +100,254 @@ def pytest_addoption(parser: Any) -> None:
         help="Ability to overwrite test parameters without changing test_config.\n"
         "Format: test_name:param1=value1,param2_value2",
     )
+    parser.addoption(
+        "--preflight",
+        action="store_true",
+        default=False,
+        help="Probe reachability of every endpoint from topology before the session and print the results.",
+    )
+    parser.addoption(
+        "--preflight_timeout",
+        type=float,
+        default=3.0,
+        help="Time in seconds for opening single TCP connection during preflight probe.",
+    )
+    parser.addoption(
+        "--preflight_abort",
+        action="store_true",
+        default=False,
+        help="Abort the session before collection if any required endpoint is unreachable in preflight probe.",
+    )
+    parser.addoption(
+        "--setup_deadlines",
+        default=None,
+        help="Deadlines in seconds for setup phases of hosts and switches, keyed by connection type or phase name "
+        "(power_mng, switch, host, network_interfaces, default).\n"
+        "Format: RPyCConnection=60,SerialConnection=30,switch=120,default=300",
+    )
+    parser.addoption(
+        "--degraded_mode",
+        action="store_true",
+        default=False,
+        help="Don't fail the session when some hosts cannot be created. "
+        "Only tests which need unavailable hosts will be skipped.",
+    )
+    parser.addoption(
+        "--circuit_breaker_threshold",
+        type=int,
+        default=None,
+        help="Number of consecutive connection failures to the same endpoint (connection type, IP and port) "
+        "after which next attempts fail fast. Disabled by default.",
+    )
+    parser.addoption(
+        "--circuit_breaker_cooldown",
+        type=float,
+        default=60.0,
+        help="Time in seconds for which connection attempts to the endpoint fail fast after opening circuit breaker.",
+    )
+    parser.addoption(
+        "--reuse_connections",
+        action="store_true",
+        default=False,
+        help="Reuse live connections when connection for the same ConnectionModel is requested again.",
+    )
+    parser.addoption(
+        "--teardown_timeout",
+        type=float,
+        default=60.0,
+        help="Time in seconds for closing all connections opened by hosts and switches fixtures at the session end.",
+    )
+    parser.addoption(
+        "--track_leaks",
+        action="store_true",
+        default=False,
+        help="Track connections, power managements and switches created by plugin factories, log number of open "
+        "ones after every test and list the ones still open at the session end with their creation stack.",
+    )
+    parser.addoption(
+        "--keepalive_interval",
+        type=float,
+        default=None,
+        help="Time in seconds between keepalives sent in background via connections of hosts and switches. "
+        "Dropped connections are reconnected before the next test. Disabled by default.",
+    )
+    parser.addoption(
+        "--lazy_power_mng",
+        action="store_true",
+        default=False,
+        help="Create power management objects of hosts (and their connections) on first use instead of host setup.",
+    )
+    parser.addoption(
+        "--switches_creation",
+        choices=["serial", "concurrent"],
+        default="serial",
+        help="Create switches of switches fixture one by one (serial) or all at once (concurrent).",
+    )
+    parser.addoption(
+        "--extra_data_jsonl",
+        default=None,
+        help="Path to JSON Lines file into which extra_data of every test is written after the test, "
+        "independently of pytest-json-report.",
+    )
+    parser.addoption(
+        "--extra_data_max_record_size",
+        type=int,
+        default=None,
+        help="Maximal size in bytes of single record in --extra_data_jsonl file, "
+        "extra_data of bigger records is replaced by its size.",
+    )
+    parser.addoption(
+        "--extra_data_max_file_size",
+        type=int,
+        default=None,
+        help="Maximal size in bytes of --extra_data_jsonl file, records which don't fit are dropped.",
+    )
+    parser.addoption(
+        "--queued_logging",
+        action="store_true",
+        default=False,
+        help="Write MODULE_DEBUG, CMD and OUT records into --log-file by background thread through bounded queue, "
+        "instead of in the test thread.",
+    )
+    parser.addoption(
+        "--log_queue_size",
+        type=int,
+        default=10000,
+        help="Maximal number of records waiting for writing when --queued_logging is used.",
+    )
+    parser.addoption(
+        "--log_queue_drop",
+        choices=list(DROP_POLICIES),
+        default="new",
+        help="What to do when --queued_logging queue is full: drop the new record, drop the oldest queued record "
+        "or block until there is free place.",
+    )
+    parser.addoption(
+        "--host_logs_dir",
+        default=None,
+        help="Directory into which records of hosts and switches are written, one file per host or switch name. "
+        "Records below WARNING level are removed from --log-file.",
+    )
+    parser.addoption(
+        "--host_logs_max_bytes",
+        type=int,
+        default=100 * 1024 * 1024,
+        help="Size in bytes after which file in --host_logs_dir is rotated and compressed, 0 disables rotation.",
+    )
+    parser.addoption(
+        "--host_logs_backup_count",
+        type=int,
+        default=5,
+        help="Number of compressed rotated files kept per host or switch in --host_logs_dir.",
+    )
+    parser.addoption(
+        "--connection_metrics",
+        action="store_true",
+        default=False,
+        help="Collect count, latency histogram, bytes and failures of remote calls per host and connection type, "
+        "dumped as JSON in terminal summary.",
+    )
+
+
+def pytest_configure(config: "Config") -> None:
+    """
+    Configure session-wide mechanisms of plugin based on CLI options.
+
+    :param config: Pytest config
+    """
+    setup_deadlines.configure(parse_setup_deadlines(config.getoption("--setup_deadlines")))
+    circuit_breaker.configure(
+        threshold=config.getoption("--circuit_breaker_threshold"),
+        cooldown=config.getoption("--circuit_breaker_cooldown"),
+    )
+    connection_registry.configure(enabled=config.getoption("--reuse_connections"))
+    leak_tracker.configure(enabled=config.getoption("--track_leaks"))
+    call_metrics.configure(enabled=config.getoption("--connection_metrics"))
+    keepalive_monitor.configure(interval=config.getoption("--keepalive_interval"))
+    switch_device_types.configure(getattr(config, "cache", None))
+    extra_data_sink.configure(
+        config.getoption("--extra_data_jsonl"),
+        max_record_size=config.getoption("--extra_data_max_record_size"),
+        max_file_size=config.getoption("--extra_data_max_file_size"),
+        writer=not hasattr(config, "workerinput"),  # pytest-xdist workers pass records to controller in reports
+    )
+
+
+def pytest_unconfigure(config: "Config") -> None:
+    """
+    Forget connections registered by session-wide mechanisms of plugin.
+
+    :param config: Pytest config
+    """
+    connection_registry.configure(enabled=False)
+    leak_tracker.configure(enabled=False)
+    call_metrics.configure(enabled=False)
+    keepalive_monitor.configure(interval=None)
+    host_password_cache.clear()
+    extra_data_sink.stop()
+    host_log_router.configure(None)
+    queued_logging.stop()
+    queued_logging.dropped = 0
+
+
+def pytest_sessionstart(session: "Session") -> None:
+    """
+    Start per-host logs, queued logging and run preflight reachability probe of topology endpoints if requested.
+
+    :param session: Pytest session
+    """
+    config = session.config
+    logging_plugin = config.pluginmanager.get_plugin("logging-plugin")
+    if config.getoption("--host_logs_dir") and logging_plugin is not None:
+        host_log_router.configure(
+            config.getoption("--host_logs_dir"),
+            logging_plugin.log_file_handler,
+            max_bytes=config.getoption("--host_logs_max_bytes"),
+            backup_count=config.getoption("--host_logs_backup_count"),
+            worker_id=getattr(config, "workerinput", {}).get("workerid") or os.environ.get("PYTEST_XDIST_WORKER"),
+        )
+    if config.getoption("--queued_logging") and logging_plugin is not None:
+        # live logging handler is left synchronous, it suspends output capturing of the test thread while emitting
+        queued_logging.configure(
+            [logging_plugin.log_file_handler],
+            queue_size=config.getoption("--log_queue_size"),
+            policy=config.getoption("--log_queue_drop"),
+        )
+    if not (config.getoption("--preflight") or config.getoption("--preflight_abort")):
+        return
+    if hasattr(config, "workerinput"):
+        return  # pytest-xdist controller probes topology once for all workers
+    topology_path = config.getoption("--topology_config")
+    if not topology_path:
+        logger.warning("Preflight probe requested, but --topology_config was not passed, skipping.")
+        return
+
+    results = probe_endpoints(
+        collect_endpoints(TopologyModel(**load_config(topology_path))), timeout=config.getoption("--preflight_timeout")
+    )
+    table = format_probe_table(results)
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Preflight probe results:\n{table}")
+    terminal_reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if terminal_reporter is not None:
+        terminal_reporter.write_sep("=", "topology preflight")
+        terminal_reporter.write_line(table)
+
+    unreachable = get_unreachable_required(results)
+    if unreachable and config.getoption("--preflight_abort"):
+        pytest.exit(
+            "Preflight probe failed, unreachable required endpoints: "
+            + ", ".join(f"{result.endpoint.owner} {result.endpoint.kind} {result.endpoint}" for result in unreachable)
+        )
+
+
+def pytest_sessionfinish(session: "Session") -> None:
+    """
+    Write records waiting in logging queue and close per-host logs, before log file is closed.
+
+    :param session: Pytest session
+    """
+    host_log_router.stop()
+    queued_logging.stop()
 
 
 """Topology Config methods."""
@@ -113,89 +401,210 @@ def create_switch_from_model(switch_model: SwitchModel) -> "Switch":
     :param switch_model: SwitchModel (Pydantic) object
     :return: SwitchConnection object
     """
-    logger.log(level=log_levels.MODULE_DEBUG, msg="Preparing Switch object based on model.")
-
-    import mfd_switchmanagement  # noqa: F401
-    from mfd_switchmanagement import SSHSwitchConnection, CiscoAPIConnection
-
-    connection_classes = {"CiscoAPIConnection": CiscoAPIConnection, "SSHSwitchConnection": SSHSwitchConnection}
-
-    connection_type = switch_model.connection_type
-    assert any(
-        connection_type == con for con in connection_classes
-    ), f"Not supported switch connection type, choose one from {connection_classes.keys()}"
-
-    _ssh_key_file = switch_model.ssh_key_file
-    switch_details = {
-        "ip": switch_model.mng_ip_address,
-        "username": switch_model.mng_user if switch_model.mng_user else "",
-        "password": switch_model.mng_password.get_secret_value() if switch_model.mng_password else None,
-        "connection_type": connection_classes[connection_type],
-        "secret": switch_model.enable_password.get_secret_value() if switch_model.enable_password else "",
-        "ssh_key_file": str(_ssh_key_file) if _ssh_key_file else None,
-        "use_ssh_key": switch_model.use_ssh_key if switch_model.use_ssh_key else bool(_ssh_key_file),
-        "device_type": switch_model.device_type if switch_model.device_type else "autodetect",
-        "auth_timeout": switch_model.auth_timeout if switch_model.auth_timeout else 30,
-        "topology": switch_model,
-    }
-
-    switch_type = switch_model.switch_type
-    try:
-        switch_class = getattr(mfd_switchmanagement, switch_type)
-    except AttributeError:
-        raise NotImplementedError(f"Switch type: {switch_type} is not supported in mfd-switchmanagement module.")
-    logger.log(
-        level=log_levels.MODULE_DEBUG,
-        msg=f"Trying to connect to {switch_class.__name__} for switch IP: {switch_model.mng_ip_address} "
-        f"using {connection_type.upper()}...",
-    )
+    with log_owner(switch_model.name):
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Preparing Switch object based on model.")
+
+        import mfd_switchmanagement  # noqa: F401
+        from mfd_switchmanagement import SSHSwitchConnection, CiscoAPIConnection
+
+        connection_classes = {"CiscoAPIConnection": CiscoAPIConnection, "SSHSwitchConnection": SSHSwitchConnection}
+
+        connection_type = switch_model.connection_type
+        assert any(
+            connection_type == con for con in connection_classes
+        ), f"Not supported switch connection type, choose one from {connection_classes.keys()}"
+
+        # device type autodetected in previous runs is reused, so Netmiko detection is skipped
+        device_type_cache_key = device_type_key(switch_model)
+        cached_device_type = None
+        if not switch_model.device_type and connection_type == "SSHSwitchConnection":
+            cached_device_type = switch_device_types.get(device_type_cache_key)
+
+        _ssh_key_file = switch_model.ssh_key_file
+        switch_details = {
+            "ip": switch_model.mng_ip_address,
+            "username": switch_model.mng_user if switch_model.mng_user else "",
+            "password": switch_model.mng_password.get_secret_value() if switch_model.mng_password else None,
+            "connection_type": connection_classes[connection_type],
+            "secret": switch_model.enable_password.get_secret_value() if switch_model.enable_password else "",
+            "ssh_key_file": str(_ssh_key_file) if _ssh_key_file else None,
+            "use_ssh_key": switch_model.use_ssh_key if switch_model.use_ssh_key else bool(_ssh_key_file),
+            "device_type": (
+                switch_model.device_type if switch_model.device_type else cached_device_type or "autodetect"
+            ),
+            "auth_timeout": switch_model.auth_timeout if switch_model.auth_timeout else 30,
+            "topology": switch_model,
+        }
+
+        switch_type = switch_model.switch_type
+        try:
+            switch_class = getattr(mfd_switchmanagement, switch_type)
+        except AttributeError:
+            raise NotImplementedError(f"Switch type: {switch_type} is not supported in mfd-switchmanagement module.")
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Trying to connect to {switch_class.__name__} for switch IP: {switch_model.mng_ip_address} "
+            f"using {connection_type.upper()}...",
+        )
+
+        def _create() -> "Switch":
+            return run_with_deadline(
+                switch_class,
+                deadline=setup_deadlines.get("switch"),
+                description=f"Switch '{switch_model.name}' phase 'switch' ({switch_model.mng_ip_address})",
+                on_late_result=lambda switch: close_resources(switch_resources(switch), deadline=None),
+                **switch_details,
+            )
+
+        try:
+            switch = _create()
+        except Exception as e:
+            if cached_device_type is None:
+                raise
+            logger.warning(
+                f"Connecting to switch {switch_model.name} as cached device type '{cached_device_type}' failed "
+                f"({type(e).__name__}: {e}), detecting device type again."
+            )
+            switch_device_types.forget(device_type_cache_key)
+            switch_details["device_type"] = "autodetect"
+            switch = _create()
+
+        if switch_details["device_type"] == "autodetect":
+            resolved_device_type = getattr(getattr(switch, "_connection", None), "_resolved_device_type", None)
+            if resolved_device_type:
+                switch_device_types.set(device_type_cache_key, resolved_device_type)
+        host_log_router.register_address(switch_model.mng_ip_address, switch_model.name)
+        keepalive_monitor.register(switch, owner=switch_model.name, kind=f"switch {switch_type}")
+        return leak_tracker.track(switch, owner=switch_model.name, kind=f"switch {switch_type}")
+
+
+def _close_late(owner: str, description: str) -> Callable[[Any], None]:
+    """Get function closing connection established by setup worker after its deadline, so it does not leak."""
+
+    def _close(obj: Any) -> None:
+        close_resources([Resource(owner=owner, description=description, obj=obj)], deadline=None)
+
+    return _close
+
+
+def _close_late_host(owner: str, connections: List[Any], power_mng: Optional[Any]) -> Callable[[Host], None]:
+    """
+    Get function closing connections of Host object created after its deadline.
+
+    Connections and power management passed to the Host are closed by the caller on failure, only connections
+    opened by the Host object itself are closed.
+    """
+
+    def _close(host: Host) -> None:
+        owned = connections + [resource.obj for resource in power_mng_resources(owner, power_mng)]
+        resources = [resource for resource in host_resources(host) if all(resource.obj is not obj for obj in owned)]
+        close_resources(resources, deadline=None)
+
+    return _close
+
+
+def _record_close_failures(config: "Config", failures: List[CloseFailure]) -> None:
+    """Store connections which were not closed cleanly for terminal summary."""
+    if failures:
+        config.stash.setdefault(close_failures_key, []).extend(failures)
+
+
+@pytest.fixture(scope="session")
+def switches_by_name(topology: TopologyModel, request: FixtureRequest) -> Generator[LazySwitches, None, None]:
+    """
+    Get mapping of switch name to Switch (mfd-switchmanagement) object, connected on first access.
+
+    Only switches with 'instantiate' flag set to True are available.
+    Connected switches are disconnected at the end of the session.
+
+    :param topology: Fixture returning Topology model
+    :param request: Pytest fixture request
+    :return: LazySwitches mapping
+    """
+    switch_models = [switch_model for switch_model in topology.switches or [] if switch_model.instantiate]
+    lazy_switches = LazySwitches(switch_models, create_switch_from_model)
+
+    yield lazy_switches
 
-    return switch_class(**switch_details)
+    resources = [resource for switch in lazy_switches.created() for resource in switch_resources(switch)]
+    _record_close_failures(request.config, close_resources(resources, request.config.getoption("--teardown_timeout")))
 
 
 @pytest.fixture(scope="session")
-def switches(topology: TopologyModel) -> List["Switch"]:
+def switches(switches_by_name: LazySwitches, request: FixtureRequest) -> List["Switch"]:
     """
     Get list of Switch (mfd-switchmanagement) objects based on passed topology model.
 
     Only switches with 'instantiate' flag set to True will be returned.
+    Switches are created one by one or concurrently (--switches_creation) and disconnected at the end of the session.
 
-    :param topology: Fixture returning Topology model
+    :param switches_by_name: Fixture returning mapping of switch name to Switch object
+    :param request: Pytest fixture request
     :return: List of switches
     """
     logger.log(level=log_levels.MODULE_DEBUG, msg="Preparing Switches.")
-    switch_list = []
+    return switches_by_name.create_all(concurrent=request.config.getoption("--switches_creation") == "concurrent")
+
 
-    if not topology.switches:
-        return switch_list
+@pytest.fixture(scope="session")
+def switch_port_details(topology: TopologyModel, switches_by_name: LazySwitches) -> SwitchPortDetails:
+    """
+    Get port, VLAN, speed and link state of switch ports for all topology interfaces with 'switch_name'.
 
-    for switch_model in topology.switches:
-        if switch_model.instantiate:
-            switch_list.append(create_switch_from_model(switch_model))
+    Interfaces are grouped by switch, every switch is queried once per distinct port and MAC address
+    and switches are queried concurrently. Only switches with 'instantiate' flag set to True are queried.
 
-    return switch_list
+    :param topology: Fixture returning Topology model
+    :param switches_by_name: Fixture returning mapping of switch name to Switch object
+    :return: Mapping with (host name, interface id) as key and SwitchPortInfo as value
+    """
+    return collect_switch_port_details(
+        topology, switches_by_name.__getitem__, deadline=setup_deadlines.get("switch_ports")
+    )
 
 
 def get_connection_object(
     connection_model: "ConnectionModel",
     connection_list: List["AsyncConnection"] = None,
     relative_connection: "AsyncConnection" = None,
+    fresh: bool = False,
+    owner: Optional[str] = None,
 ) -> "AsyncConnection":
     """
     Create connection object from ConnectionModel.
 
+    When reusing of connections is enabled (--reuse_connections), live connection already established
+    for the same ConnectionModel is returned instead of creating new one.
+
     :param connection_model: ConnectionModel object.
     :param relative_connection: Optional object of relative connection, if passed connection_list won't be used
     :param connection_list: List of already established connection, optional, required for connections with relations
+    :param fresh: Establish new connection even if live one can be reused
+    :param owner: Name of host owning the connection, reported by leak tracker (--track_leaks),
+                  address of connection is used if not passed
     :return: Connection object.
     """
+    if owner is None:
+        owner = str(connection_model.ip_address or connection_model.mac_address or connection_model.connection_type)
     read_relative_connection = None if not relative_connection else relative_connection
     if read_relative_connection is None and connection_model.relative_connection_id:
         for connection in connection_list:
             if connection.model.connection_id == connection_model.relative_connection_id:
                 read_relative_connection = connection
                 break
-    return _establish_connection(connection_model, read_relative_connection)
+
+    def _create() -> "AsyncConnection":
+        connection = _establish_connection(connection_model, read_relative_connection)
+        host_log_router.register_address(getattr(connection, "_ip", None) or connection_model.ip_address, owner)
+        call_metrics.instrument(connection, owner=owner, kind=connection_model.connection_type)
+        keepalive_monitor.register(connection, owner=owner, kind=connection_model.connection_type)
+        return leak_tracker.track(connection, owner=owner, kind=connection_model.connection_type)
+
+    if not connection_registry.enabled:
+        return _create()
+    return connection_registry.acquire(
+        connection_fingerprint(connection_model, read_relative_connection), _create, fresh=fresh
+    )
 
 
 def _establish_connection(
@@ -211,10 +620,8 @@ def _establish_connection(
     import mfd_connect
 
     connection_class = getattr(mfd_connect, connection_model.connection_type)
-    options = copy.deepcopy(connection_model.connection_options) if connection_model.connection_options else {}
-    if connection_model.ip_address:
-        options["ip"] = str(connection_model.ip_address)
-    elif connection_model.mac_address:
+    options = dict(connection_model.constructor_kwargs)
+    if not connection_model.ip_address and connection_model.mac_address:
         from mfd_osd_control import OsdController
 
         osd_details: Dict[str, Any] = connection_model.osd_details.dict()
@@ -225,62 +632,131 @@ def _establish_connection(
             raise PyTestMFDConfigException(f"Passed OSD Host does not exist! {connection_model.osd_details}")
         options["ip"] = str(osd_controller.get_host_ip(connection_model.mac_address))
 
-    if options.get("password") is not None:
-        options["password"] = options.get("password").get_secret_value() if options.get("password") else ""
-    if "jump_host_password" in options:
-        options["jump_host_password"] = (
-            options.get("jump_host_password").get_secret_value() if options.get("jump_host_password") else ""
-        )
-
     options["model"] = connection_model
     if relative_connection:
         options["connection"] = relative_connection
 
-    for k, v in options.items():  # "import" mfd connect consts, like mfd_connect.util.EFI_SHELL_PROMPT_REGEX
-        if isinstance(v, str) and "mfd_connect" in v:
-            options[k] = eval(v)
-    return connection_class(**options)
+    if options.get("ip") is None:
+        return connection_class(**options)
+    endpoint = _breaker_endpoint(connection_model.connection_type, options)
+    return circuit_breaker.call(endpoint, connection_class, **options)
+
+
+def _breaker_endpoint(connection_type: str, options: Mapping[str, Any]) -> Tuple[str, Any, Any]:
+    """Get key of circuit breaker for endpoint of connection."""
+    return connection_type, options["ip"], options.get("port")
 
 
-def create_host_connections_from_model(host_model: "HostModel") -> List["AsyncConnection"]:
+def _connect_with_deadline(
+    host_model: "HostModel", conn: "ConnectionModel", connection_list: List["AsyncConnection"], fresh: bool
+) -> "AsyncConnection":
+    """Create connection of host, limited by setup deadline of its connection type."""
+    with circuit_breaker.attempt():
+        try:
+            return run_with_deadline(
+                get_connection_object,
+                conn,
+                connection_list,
+                fresh=fresh,
+                owner=host_model.name,
+                deadline=setup_deadlines.get(conn.connection_type),
+                description=f"Host '{host_model.name}' connection_id={conn.connection_id} "
+                f"({conn.connection_type}) phase 'connection'",
+                on_late_result=_close_late(host_model.name, f"{conn.connection_type} established after deadline"),
+            )
+        except SetupDeadlineExceededError as e:
+            # hung attempt is a failure of endpoint counted once, its late outcome is ignored,
+            # address resolved via OSD is not known here
+            if circuit_breaker.enabled and conn.constructor_kwargs.get("ip") is not None:
+                circuit_breaker.abandon(_breaker_endpoint(conn.connection_type, conn.constructor_kwargs), e)
+            raise
+
+
+def create_host_connections_from_model(host_model: "HostModel", fresh: bool = False) -> List["AsyncConnection"]:
     """
     Create host connections based on data from model.
 
+    If any connection fails, connections already established by this call are closed before the error is raised,
+    so retrying (e.g. host_reconnector) does not leak them.
+
     :param host_model: HostModel (Pydantic) object
+    :param fresh: Establish new connections even if live ones can be reused
     :return: list of RPC connections
     """
     logger.log(level=log_levels.MODULE_DEBUG, msg="Preparing Hosts Connections.")
     connection_list = []
+    fingerprints = set()
     for conn in host_model.connections:
-        connection_list.append(get_connection_object(conn, connection_list))
+        # connections of the same type and address form a pool, each of them must be a separate channel
+        fingerprint = connection_fingerprint(conn)
+        duplicated = fingerprint in fingerprints
+        fingerprints.add(fingerprint)
+        try:
+            connection_list.append(_connect_with_deadline(host_model, conn, connection_list, fresh or duplicated))
+        except Exception:
+            if connection_list:
+                logger.log(
+                    level=log_levels.MODULE_DEBUG,
+                    msg=f"Closing {len(connection_list)} connections of {host_model.name} established before failure.",
+                )
+                resources = [Resource(host_model.name, str(connection), connection) for connection in connection_list]
+                close_resources(resources, deadline=None)
+            raise
     return connection_list
 
 
-def create_power_mng_from_model(power_mng_model: PowerMngModel) -> "PowerManagement":
+def create_power_mng_from_model(
+    power_mng_model: PowerMngModel, owner: Optional[str] = None, lazy: bool = False
+) -> "PowerManagement":
     """
     Create PowerManagement subclass object based on data from model.
 
     :param power_mng_model: PowerMngModel object.
+    :param owner: Name of host owning the power management, reported by leak tracker (--track_leaks),
+                  address of power management is used if not passed
+    :param lazy: Return proxy which creates the object and its connection on first use,
+                 type and constructor parameters are still validated immediately
     :return: PowerManagement subclass object.
+    :raises PyTestMFDConfigException: if lazy and parameters required by constructor are not set in model
     """
+    if owner is None:
+        owner = str(power_mng_model.ip or power_mng_model.host or power_mng_model.power_mng_type)
     logger.log(level=log_levels.MODULE_DEBUG, msg="Preparing power management object.")
 
     import mfd_powermanagement
 
     power_mng_class = getattr(mfd_powermanagement, power_mng_model.power_mng_type)
 
-    init_method = power_mng_class.__init__
-    if hasattr(init_method, "__wrapped__"):
-        init_method = init_method.__wrapped__
-    init_args = init_method.__code__.co_varnames
+    power_mng_kwargs = build_power_mng_kwargs(power_mng_class, power_mng_model)
+    with_connection = power_mng_model.connection is not None and not issubclass(
+        power_mng_class, mfd_powermanagement.pdu.PDU
+    )
+
+    def _create() -> "PowerManagement":
+        kwargs = dict(power_mng_kwargs)
+        if with_connection:
+            kwargs["connection"] = get_connection_object(power_mng_model.connection, owner=owner)
+        return leak_tracker.track(
+            power_mng_class(**kwargs), owner=owner, kind=f"power_mng {power_mng_model.power_mng_type}"
+        )
 
-    power_mng_kwargs = {k: v for k, v in power_mng_model.dict().items() if k in init_args and v is not None}
-    if power_mng_model.connection is not None and not issubclass(power_mng_class, mfd_powermanagement.pdu.PDU):
-        power_mng_kwargs["connection"] = get_connection_object(power_mng_model.connection)
-    return power_mng_class(**power_mng_kwargs)
+    if not lazy:
+        return _create()
+    missing = get_missing_init_parameters(power_mng_class, [*power_mng_kwargs, "connection"])
+    if missing:
+        raise PyTestMFDConfigException(
+            f"Power management {power_mng_model.power_mng_type} of {owner} requires missing parameters: "
+            + ", ".join(sorted(missing))
+        )
+    return LazyPowerManagement(power_mng_class, _create)
 
 
-def create_host_from_model(host_model: "HostModel", cli_client: Optional["CliClient"] = None) -> Host:
+def create_host_from_model(
+    host_model: "HostModel",
+    cli_client: Optional["CliClient"] = None,
+    fresh: bool = False,
+    lazy_power_mng: bool = False,
+) -> Host:
     """
     Create host from model data.
 
@@ -289,47 +765,254 @@ def create_host_from_model(host_model: "HostModel", cli_client: Optional["CliCli
 
     CliClient used mostly when creating IPU Hosts manually (out of "hosts" fixture),
     when "instantiate" flag is set to False.
-    :return: Host object
+    :param fresh: Establish new connections even if live ones can be reused (--reuse_connections)
+    :param lazy_power_mng: Create power management object and its connection on first use (--lazy_power_mng)
+    :return: Host object, its topology has decrypted passwords of connections, cache of its facts is available
+             as `host.facts`
     """
-    # host_model = _decrypt_host_password(host_model) # todo fix decryption of host passwords
-    _connections = create_host_connections_from_model(host_model)
-
-    connections = Connections(_connections=_connections)
+    host_model = host_password_cache.get(host_model, _decrypt_host_password)
+    with log_owner(host_model.name):
+        _connections = create_host_connections_from_model(host_model, fresh=fresh)
 
-    power_mng = create_power_mng_from_model(host_model.power_mng) if host_model.power_mng else None
-    host = Host(
-        connection=_connections[0],
-        name=host_model.name,
-        cli_client=cli_client,
-        connections=connections,
-        power_mng=power_mng,
-        topology=host_model,
-    )
+        connections = Connections(_connections=_connections)
 
-    if host_model.network_interfaces:
-        host.refresh_network_interfaces()
-    return host
+        power_mng = None
+        try:
+            if host_model.power_mng:
+                power_mng = run_with_deadline(
+                    create_power_mng_from_model,
+                    host_model.power_mng,
+                    owner=host_model.name,
+                    lazy=lazy_power_mng,
+                    deadline=setup_deadlines.get("power_mng"),
+                    description=f"Host '{host_model.name}' phase 'power_mng' ({host_model.power_mng.power_mng_type})",
+                    on_late_result=lambda late: close_resources(
+                        power_mng_resources(host_model.name, late), deadline=None
+                    ),
+                )
+            host = run_with_deadline(
+                Host,
+                deadline=setup_deadlines.get("host"),
+                description=f"Host '{host_model.name}' connection_id={_connections[0].model.connection_id} "
+                "phase 'host'",
+                on_late_result=_close_late_host(host_model.name, _connections, power_mng),
+                connection=_connections[0],
+                name=host_model.name,
+                cli_client=cli_client,
+                connections=connections,
+                power_mng=power_mng,
+                topology=host_model,
+            )
+            host.facts = HostFacts(host, owner=host_model.name)
+            if power_mng is not None:
+                invalidate_on_power_actions(power_mng, host.facts.invalidate)
+
+            if host_model.network_interfaces:
+                run_with_deadline(
+                    host.refresh_network_interfaces,
+                    deadline=setup_deadlines.get("network_interfaces"),
+                    description=f"Host '{host_model.name}' phase 'network_interfaces'",
+                )
+        except Exception:
+            # e.g. in degraded mode the failed host stays out of teardown, its connections must not leak
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Closing connections of {host_model.name} after failure.")
+            resources = [Resource(host_model.name, str(connection), connection) for connection in _connections]
+            close_resources(resources + power_mng_resources(host_model.name, power_mng), deadline=None)
+            raise
+        return host
 
 
 @pytest.fixture(scope="session")
-def hosts(topology: TopologyModel) -> Dict[str, Host]:
+def hosts(topology: TopologyModel, request: FixtureRequest) -> Generator[Dict[str, Host], None, None]:
     """
     Get dictionary of Host objects with associated RPC(mfd-connect) connections based on passed Topology model.
 
     As a key `name` of host is considered.
     ONLY Hosts with instantiate value set to True will be created.
 
+    In degraded mode (--degraded_mode) hosts which failed during creation are recorded instead of failing the session
+    and DegradedHosts dictionary with successfully created hosts is returned.
+
+    Connections of hosts are closed concurrently at the end of the session.
+
     :param topology: Topology model object
+    :param request: Pytest fixture request
     :return: Dictionary with hosts when 'name' is key
     """
     logger.log(level=log_levels.MODULE_DEBUG, msg="Preparing Hosts based on unique names.")
+    degraded_mode = request.config.getoption("--degraded_mode")
     hosts_dict = dict()
+    failures = dict()
 
     for host_model in topology.hosts:
         if host_model.instantiate:
-            host = create_host_from_model(host_model=host_model)
+            try:
+                host = create_host_from_model(
+                    host_model=host_model, lazy_power_mng=request.config.getoption("--lazy_power_mng")
+                )
+            except Exception as e:
+                if not degraded_mode:
+                    raise
+                logger.warning(f"Host '{host_model.name}' cannot be created, tests requiring it will be skipped: {e}")
+                failures[host_model.name] = f"{type(e).__name__}: {e}"
+                continue
             hosts_dict[host.name] = host
-    return hosts_dict
+
+    if degraded_mode:
+        request.config.stash[failed_hosts_key] = failures
+        hosts_dict = DegradedHosts(hosts_dict, failures=failures)
+
+    yield hosts_dict
+
+    resources = [resource for host in hosts_dict.values() for resource in host_resources(host)]
+    _record_close_failures(request.config, close_resources(resources, request.config.getoption("--teardown_timeout")))
+
+
+@pytest.fixture(scope="session")
+def fan_out(hosts: Dict[str, Host]) -> FanOut:
+    """
+    Get helper running the same command or function on many hosts concurrently, with timeout per host.
+
+    Results are returned per host name, exceptions are collected in results instead of being raised.
+
+    :param hosts: Dictionary with Host objects where 'name' is key
+    :return: FanOut object
+    """
+    return FanOut(hosts)
+
+
+@pytest.fixture(scope="session")
+def connection_metrics(request: FixtureRequest) -> ConnectionMetrics:
+    """
+    Get statistics of remote calls made via connections created by plugin (--connection_metrics).
+
+    :param request: Pytest fixture request
+    :return: ConnectionMetrics object, its snapshot() returns statistics per host, connection type and method
+    """
+    if not call_metrics.enabled:
+        logger.warning("Connection metrics requested, but --connection_metrics was not passed, nothing is collected.")
+    return call_metrics
+
+
+@pytest.fixture(scope="session")
+def bulk_power(hosts: Dict[str, Host]) -> BulkPower:
+    """
+    Get helper powering off, powering on or power cycling many hosts concurrently.
+
+    Hosts sharing PDU are powered one by one, after powering on connections of hosts are awaited concurrently.
+
+    :param hosts: Dictionary with Host objects where 'name' is key
+    :return: BulkPower object
+    """
+    return BulkPower(hosts)
+
+
+@pytest.fixture(scope="session")
+def host_reconnector(hosts: Dict[str, Host]) -> HostReconnector:
+    """
+    Get helper re-establishing connections of many hosts concurrently, e.g. after reboot or driver reload.
+
+    New connections are swapped into existing Host and Connections objects, network interfaces are refreshed.
+
+    :param hosts: Dictionary with Host objects where 'name' is key
+    :return: HostReconnector object
+    """
+    return HostReconnector(hosts, lambda host_model: create_host_connections_from_model(host_model, fresh=True))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: "Item") -> None:
+    """
+    Reconnect connections dropped since previous test before the test uses them (--keepalive_interval).
+
+    :param item: A basic test invocation item of pytest
+    """
+    if keepalive_monitor.enabled:
+        keepalive_monitor.reconnect_dead()
+
+
+def pytest_runtest_logfinish(nodeid: str) -> None:
+    """
+    Log number of open objects created by plugin factories per owner and kind after every test (--track_leaks).
+
+    :param nodeid: Full node ID of the test
+    """
+    if leak_tracker.enabled:
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Open plugin-managed objects after {nodeid}: {format_open_counts(leak_tracker.open_counts())}",
+        )
+
+
+def pytest_terminal_summary(terminalreporter: "TerminalReporter") -> None:
+    """
+    Report hosts which were unavailable in degraded mode, endpoints for which circuit breaker was opened,
+    connections which were not closed cleanly, objects created by plugin factories which are still open,
+    reconnects of connections dropped during the session, records written into --extra_data_jsonl file,
+    log records dropped by --queued_logging, files written into --host_logs_dir and statistics of remote calls
+    (--connection_metrics).
+
+    :param terminalreporter: Pytest terminal reporter
+    """
+    failures = terminalreporter.config.stash.get(failed_hosts_key, {})
+    if failures:
+        terminalreporter.write_sep("=", "unavailable hosts (degraded mode)")
+        for name, reason in failures.items():
+            terminalreporter.write_line(f"{name}: {reason}")
+
+    if circuit_breaker.events:
+        terminalreporter.write_sep("=", "open circuit breakers")
+        for event in circuit_breaker.events:
+            terminalreporter.write_line(
+                f"{event.key}: opened after {event.failures} failures, last error: {event.error}"
+            )
+
+    close_failures = terminalreporter.config.stash.get(close_failures_key, [])
+    if close_failures:
+        terminalreporter.write_sep("=", "connections not closed cleanly")
+        for failure in close_failures:
+            terminalreporter.write_line(f"{failure.owner} {failure.description}: {failure.error}")
+
+    if leak_tracker.enabled:
+        open_objects = leak_tracker.open_objects(collect=True)
+        if open_objects:
+            terminalreporter.write_sep("=", "plugin-managed objects still open")
+            for entry in open_objects:
+                terminalreporter.write_line(f"{entry.owner} {entry.kind} {entry.description}, created at:")
+                terminalreporter.write_line(entry.stack.rstrip())
+
+    if keepalive_monitor.stats:
+        terminalreporter.write_sep("=", "keepalive reconnects")
+        for (owner, kind), stats in sorted(keepalive_monitor.stats.items()):
+            terminalreporter.write_line(
+                f"{owner} {kind}: {stats.reconnects} reconnects, {stats.failures} failed, "
+                f"latency avg {stats.average_latency:.2f}s max {stats.max_latency:.2f}s"
+            )
+
+    if extra_data_sink.writing:
+        extra_data_sink.flush()
+        stats = extra_data_sink.stats
+        terminalreporter.write_sep("=", "extra_data")
+        terminalreporter.write_line(
+            f"{extra_data_sink.path}: {stats.written} records ({stats.bytes_written} bytes) written, "
+            f"{stats.truncated} truncated, {stats.dropped} dropped"
+        )
+
+    if queued_logging.dropped:
+        terminalreporter.write_sep("=", "queued logging")
+        terminalreporter.write_line(
+            f"{queued_logging.dropped} log records dropped, logging queue was full "
+            f"(--log_queue_drop={queued_logging.policy})"
+        )
+
+    if host_log_router.stats:
+        terminalreporter.write_sep("=", "host logs")
+        for owner, stats in sorted(host_log_router.stats.items()):
+            terminalreporter.write_line(f"{owner}: {stats.records} records in {stats.path}")
+
+    if call_metrics.enabled:
+        terminalreporter.write_sep("=", "connection metrics")
+        terminalreporter.write_line(json.dumps(call_metrics.snapshot(), indent=2))
 
 
 """Test Config methods."""
@@ -399,16 +1082,31 @@ def connected_hosts(connected_pairs: list[HostPairConnectionModel], hosts: Dict[
     """
     Get list of tuples of connected host pairs.
 
+    In degraded mode pairs requiring unavailable hosts are dropped with warning, tests are skipped only if no pair
+    is available.
+
     :param connected_pairs: Pair of hosts
     :param hosts: Dictionary with Host objects where 'name' is key
     """
+    failures = getattr(hosts, "failures", {})
     connected_hosts = list()
+    dropped = []
     for pair in connected_pairs:
+        unavailable = [name for name in pair.hosts if name in failures]
+        if unavailable:
+            reason = f"Connected pair {pair.hosts} requires unavailable hosts: " + ", ".join(
+                f"'{name}' ({failures[name]})" for name in unavailable
+            )
+            warnings.warn(reason)
+            dropped.append(reason)
+            continue
         left = get_item_by_name(name=pair.hosts[0], list_of_objects=list(hosts.values()))
         right = get_item_by_name(name=pair.hosts[1], list_of_objects=list(hosts.values()))
         connected_hosts.append((left, right))
         if pair.bidirectional:
             connected_hosts.append((right, left))
+    if dropped and not connected_hosts:
+        pytest.skip("; ".join(dropped))
     return connected_hosts
 
 
@@ -504,32 +1202,57 @@ def extra_data(request):  # noqa:ANN001,ANN201
         raise
 
 
-@pytest.hookimpl(trylast=True)
-def pytest_runtest_call(item: "Item") -> None:
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: "Item", call: "CallInfo") -> Generator[None, Any, None]:
     """
-    Call to run the test for test item (the call phase).
+    Log extra data defined in test and attach it to report for --extra_data_jsonl file after the call phase.
 
-    The default implementation calls ``item.runtest()``.
+    Report is created also when test failed, so extra data collected before failure is kept.
+    Record is serialized immediately, so teardown of fixtures cannot change it.
 
-    Log stuff from extra data defined in test.
     :param item: A basic test invocation item of pytest
+    :param call: Information about the call phase
     """
+    outcome = yield
+    if call.when != "call":
+        return
     log_extra_data_after_test(item)
+    data = (getattr(item, "funcargs", None) or {}).get("extra_data")
+    if data and extra_data_sink.enabled:
+        report = outcome.get_result()
+        report.extra_data_record, report.extra_data_truncated = extra_data_sink.serialize(
+            {"nodeid": item.nodeid, "outcome": report.outcome, "duration": report.duration, "extra_data": data}
+        )
+
+
+def pytest_runtest_logreport(report: "TestReport") -> None:
+    """
+    Write record of test into --extra_data_jsonl file.
+
+    With pytest-xdist it is called in controller for reports received from workers, so only controller writes the file.
+    Record is removed from report once submitted, terminal reporter keeps reports until the end of the session.
+
+    :param report: Report of test phase
+    """
+    line = getattr(report, "extra_data_record", None)
+    if line is not None and extra_data_sink.writing:  # worker keeps record in report sent to controller
+        extra_data_sink.submit(line, truncated=getattr(report, "extra_data_truncated", False))
+        report.extra_data_record = None
 
 
 def log_extra_data_after_test(item: "Item") -> None:
-    """Add log with extra_data after test if data exists."""
-    data_to_log = getattr(item, "funcargs", {}).get("extra_data", {})
+    """Add log with extra_data after test if data exists, formatted only if debug logs are enabled."""
+    data_to_log = (getattr(item, "funcargs", None) or {}).get("extra_data", {})
     if data_to_log:
-        logger.debug(f"Extra data from test: {data_to_log}")
+        logger.debug("Extra data from test: %s", data_to_log)
 
 
-def _get_secrets(test_config: dict) -> dict[str, SecretModel]:
+def _get_secrets(test_config: dict) -> Mapping[str, SecretModel]:
     """
-    Get list of secrets from test config file.
+    Get secrets from test config file.
 
     :param test_config: Test config file
-    :return: List of secrets
+    :return: Read-only mapping of secret name to secret, decrypted on first access, empty if there are no secrets
     """
     secrets_dict = test_config.get("secrets", [])
     if secrets_dict:
@@ -537,25 +1260,30 @@ def _get_secrets(test_config: dict) -> dict[str, SecretModel]:
         return _decrypt_secrets(secrets_dict)
     else:
         logger.log(level=log_levels.MODULE_DEBUG, msg="There is no 'secrets' key in test config file.")
-        return {}
+        return LazySecrets([], _get_encryption_obj)
+
+
+def _is_encrypted_password(key: str, value: Any) -> bool:
+    """Check whether connection option is a password encrypted with Fernet."""
+    return "password" in key.lower() and isinstance(value, SecretStr) and is_fernet_token(value.get_secret_value())
 
 
 def _has_secret_password_fields(connections: Any) -> bool:
     """
-    Check whether any connection contains secret password fields.
+    Check whether any connection contains encrypted password fields.
+
+    Password fields are always SecretStr in model, only values in format of Fernet token are considered encrypted.
 
     :param connections: List of connection objects
-    :return: True if secret password fields are present, False otherwise
+    :return: True if encrypted password fields are present, False otherwise
     """
     for connection in connections:
         if connection.connection_options:
             for key, value in connection.connection_options.items():
-                # todo, password is always SecretStr from model point of view
-                # even it's not encrypted
-                if "password" in key.lower() and isinstance(value, SecretStr):
+                if _is_encrypted_password(key, value):
                     logger.log(
                         level=log_levels.MODULE_DEBUG,
-                        msg="Secret password field found in connection_options, decryption may be needed.",
+                        msg="Encrypted password field found in connection_options, decryption needed.",
                     )
                     return True
     return False
@@ -567,6 +1295,7 @@ def _decrypt_host_password(host_model: "HostModel") -> "HostModel":
 
     Any field containing 'password' in connection_options that is a Fernet-encrypted value
     will be decrypted and replaced with a new SecretStr containing the plaintext.
+    Plaintext passwords are kept as they are.
 
     :param host_model: HostModel object
     :return: HostModel with decrypted password fields in connection_options
@@ -583,12 +1312,14 @@ def _decrypt_host_password(host_model: "HostModel") -> "HostModel":
     cipher = _get_encryption_obj()
     updated_connections = []
     for connection in host_model.connections:
-        if not connection.connection_options:
+        if not connection.connection_options or not any(
+            _is_encrypted_password(key, value) for key, value in connection.connection_options.items()
+        ):
             updated_connections.append(connection)
             continue
         new_options = {}
         for key, value in connection.connection_options.items():
-            if "password" in key.lower() and isinstance(value, SecretStr):
+            if _is_encrypted_password(key, value):
                 logger.log(
                     level=log_levels.MODULE_DEBUG,
                     msg=f"Decrypting pwd in connection_options for host: {host_model.name}",
@@ -606,37 +1337,31 @@ def _get_encryption_obj() -> Fernet:
     """
     Get encryption object.
 
-    Create cryptography.Fernet object based on encryption key from environment variable.
+    Create cryptography.Fernet object based on encryption key from environment variable, object is reused per key.
 
     Fernet guarantees that a message encrypted using it cannot be manipulated or read without the key.
     Fernet is an implementation of symmetric (also known as “secret key”) authenticated cryptography.
     :return: Fernet object
     """
-    encryption_key = os.environ.get("AMBER_ENCRYPTION_KEY").encode("utf-8")
+    encryption_key = os.environ.get("AMBER_ENCRYPTION_KEY", "").encode("utf-8")
     if not encryption_key:
         raise PyTestMFDConfigException("AMBER_ENCRYPTION_KEY environment variable is not set.")
-    return Fernet(encryption_key)
+    return get_cipher(encryption_key)
 
 
-def _decrypt_secrets(secrets_dict: list[dict[str, str]]) -> dict[str, SecretModel]:
+def _decrypt_secrets(secrets_dict: list[dict[str, str]]) -> Mapping[str, SecretModel]:
     """
-    Decrypt secrets from secrets_dict.
+    Prepare secrets from secrets_dict for decryption.
+
+    Each secret is decrypted on first access and cached for the session.
 
     :param secrets_dict: List of secrets
-    :return: Decrypted secrets
+    :return: Read-only mapping of secret name to secret
     """
-    secrets = {}
-    cipher = _get_encryption_obj()
-    for secret in secrets_dict:
-        secret_name = secret.get("name")
-        secret_value = secret.get("value").encode("utf-8")
-        # Decrypt string back to plaintext
-        secret_value = cipher.decrypt(secret_value).decode()
-        secrets[secret_name] = SecretModel(name=secret_name, value=secret_value)
-    return secrets
+    return LazySecrets(secrets_dict, _get_encryption_obj)
 
 
 @pytest.fixture(scope="session")
-def secrets(test_config: dict) -> dict[str, SecretModel]:
-    """Get list of secrets."""
+def secrets(test_config: dict) -> Mapping[str, SecretModel]:
+    """Get secrets, decrypted on first access."""
     return _get_secrets(test_config)
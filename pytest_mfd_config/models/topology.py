@@ -13,7 +13,7 @@ import mfd_powermanagement
 import mfd_switchmanagement.connections
 import mfd_switchmanagement.vendors
 from mfd_typing.data_structures import IPUHostType
-from pydantic import SecretStr, field_validator, model_validator
+from pydantic import PrivateAttr, SecretStr, field_validator, model_validator
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_powermanagement.base import PowerManagement
@@ -35,6 +35,11 @@ from mfd_model.config import (
 )
 from mfd_model.config.models import SchemaMetadata  # noqa: F401
 
+from pytest_mfd_config.utils.connection_options import (
+    ConstructorKwargs,
+    build_constructor_kwargs,
+    resolve_connection_options,
+)
 from pytest_mfd_config.utils.exceptions import NotUniqueHostsNamesError
 
 logger = logging.getLogger(__name__)
@@ -44,6 +49,9 @@ add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG
 class ConnectionModel(ConnectionModelBase):
     """RPC Connection model to be used in pytest-mfd-config plugin."""
 
+    _constructor_kwargs: Optional[ConstructorKwargs] = PrivateAttr(default=None)
+    _constructor_kwargs_source: Optional[tuple] = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def ip_or_mac_address_is_required(self) -> ConnectionModel:
         """Check if ip address or mac address (with osd details) is passed for any connection except serial."""
@@ -55,6 +63,32 @@ class ConnectionModel(ConnectionModelBase):
             raise ValueError(f"IP Address or MAC Address (with osd_details) must be passed for {self.connection_type}")
         return self
 
+    @model_validator(mode="after")
+    def prepare_constructor_kwargs(self) -> ConnectionModel:
+        """Build template of connection constructor kwargs when model is validated."""
+        self._build_constructor_kwargs()
+        return self
+
+    @property
+    def constructor_kwargs(self) -> ConstructorKwargs:
+        """
+        Read-only template of connection constructor kwargs.
+
+        Template is rebuilt when IP address or connection options changed since it was built (model has no
+        validation of assignment), so connections are created from current values of the fields.
+        """
+        if self._constructor_kwargs is None or self._constructor_kwargs_source != self._source_of_constructor_kwargs():
+            self._build_constructor_kwargs()
+        return self._constructor_kwargs
+
+    def _source_of_constructor_kwargs(self) -> tuple:
+        """Get values of fields the template of constructor kwargs is built from."""
+        return self.ip_address, dict(self.connection_options or {})
+
+    def _build_constructor_kwargs(self) -> None:
+        self._constructor_kwargs_source = self._source_of_constructor_kwargs()
+        self._constructor_kwargs = build_constructor_kwargs(self)
+
     @field_validator("mac_address")
     @classmethod
     def check_is_valid_mac_address(cls: ConnectionModel, v: str) -> str | MACAddress | None:
@@ -80,6 +114,18 @@ class ConnectionModel(ConnectionModelBase):
 
         return v
 
+    @field_validator("connection_options")
+    @classmethod
+    def check_mfd_connect_references(cls: ConnectionModel, v: dict | None) -> dict | None:
+        """
+        Check that references to mfd_connect objects, like 'mfd_connect.util.EFI_SHELL_PROMPT_REGEX', exist.
+
+        References are kept as strings, so model stays serializable, resolved objects are put into constructor kwargs.
+        """
+        if v:
+            resolve_connection_options(v)
+        return v
+
 
 class PowerMngModel(PowerMngModelBase):
     """Power model."""
@@ -0,0 +1,232 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Circuit breaker for connection attempts to dead endpoints."""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+
+@dataclass
+class BreakerState:
+    """State of circuit breaker for single endpoint."""
+
+    failures: int = 0
+    opened_at: Optional[float] = None
+    last_error: Optional[str] = None
+    trial: bool = False
+
+
+@dataclass
+class BreakerAttempt:
+    """Attempt of connecting to endpoint, which can be abandoned by caller (e.g. after setup deadline)."""
+
+    abandoned: bool = False
+    recorded: bool = False
+
+
+_current_attempt: contextvars.ContextVar[Optional[BreakerAttempt]] = contextvars.ContextVar(
+    "breaker_attempt", default=None
+)
+
+
+@dataclass(frozen=True)
+class BreakerEvent:
+    """Event of opening circuit breaker for endpoint."""
+
+    key: Hashable
+    failures: int
+    error: Optional[str]
+
+
+class CircuitBreaker:
+    """
+    Session-wide circuit breaker keyed by endpoint (e.g. connection type, IP and port).
+
+    After `threshold` consecutive failures for the same key, breaker opens and further attempts fail fast
+    with CircuitOpenError for `cooldown` seconds. After cooldown single attempt is allowed (half-open state),
+    concurrent attempts keep failing fast until it finishes, its success closes breaker, its failure opens it again.
+    Every attempt is counted once: outcome of attempt abandoned by its caller (see `attempt` and `abandon`)
+    is ignored when it finishes later.
+    """
+
+    def __init__(
+        self, threshold: Optional[int] = None, cooldown: float = 60.0, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Init of CircuitBreaker.
+
+        :param threshold: Number of consecutive failures opening breaker, None or 0 disables breaker
+        :param cooldown: Time in seconds after which opened breaker allows next attempt
+        :param clock: Source of time
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._states: Dict[Hashable, BreakerState] = {}
+        self._lock = threading.Lock()
+        self.events: List[BreakerEvent] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Check if breaker is enabled."""
+        return bool(self.threshold)
+
+    def configure(self, threshold: Optional[int], cooldown: float) -> None:
+        """Set threshold and cooldown, reset states of all endpoints."""
+        with self._lock:
+            self.threshold = threshold
+            self.cooldown = cooldown
+            self._states.clear()
+            self.events.clear()
+
+    def check(self, key: Hashable) -> None:
+        """
+        Check if attempt for endpoint is allowed.
+
+        :param key: Key of endpoint
+        :raises CircuitOpenError: if breaker is opened for endpoint
+        """
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or state.opened_at is None:
+                return
+            remaining = self.cooldown - (self._clock() - state.opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"Circuit breaker is open for {key} after {state.failures} failures, "
+                    f"failing fast for next {remaining:.1f}s. Last error: {state.last_error}"
+                )
+            if state.trial:
+                raise CircuitOpenError(
+                    f"Circuit breaker is half-open for {key} after {state.failures} failures, "
+                    f"trial attempt is in progress. Last error: {state.last_error}"
+                )
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Circuit breaker half-open for {key}, allowing attempt.")
+            state.trial = True
+
+    @contextmanager
+    def attempt(self) -> Iterator[BreakerAttempt]:
+        """
+        Mark calls made in the block (also by worker threads started via deadlines helpers) as single attempt.
+
+        :return: Attempt, which can be abandoned by `abandon`
+        """
+        token = _current_attempt.set(BreakerAttempt())
+        try:
+            yield _current_attempt.get()
+        finally:
+            _current_attempt.reset(token)
+
+    def abandon(self, key: Hashable, error: BaseException) -> None:
+        """
+        Count current attempt as failure, its later outcome is ignored.
+
+        Nothing is counted if attempt already finished and was counted.
+
+        :param key: Key of endpoint
+        :param error: Reason of abandoning, e.g. SetupDeadlineExceededError
+        """
+        attempt = _current_attempt.get()
+        with self._lock:
+            if attempt is not None:
+                if attempt.recorded:
+                    return
+                attempt.abandoned = True
+            self._record_failure(key, error)
+
+    def record_success(self, key: Hashable) -> None:
+        """Close breaker for endpoint."""
+        with self._lock:
+            if self._count_attempt(key):
+                self._states.pop(key, None)
+
+    def record_failure(self, key: Hashable, error: BaseException) -> None:
+        """
+        Count failure for endpoint and open breaker if threshold is reached.
+
+        :param key: Key of endpoint
+        :param error: Exception raised by attempt
+        """
+        with self._lock:
+            if self._count_attempt(key):
+                self._record_failure(key, error)
+
+    def _count_attempt(self, key: Hashable) -> bool:
+        """Check if outcome of current attempt should be counted, mark it counted. Called with lock held."""
+        attempt = _current_attempt.get()
+        if attempt is None:
+            return True
+        if attempt.abandoned:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Ignoring outcome of abandoned attempt for {key}.")
+            return False
+        attempt.recorded = True
+        return True
+
+    def _record_failure(self, key: Hashable, error: BaseException) -> None:
+        """Count failure, open breaker when closed breaker reaches threshold or trial fails. Called with lock held."""
+        state = self._states.setdefault(key, BreakerState())
+        state.failures += 1
+        state.last_error = f"{type(error).__name__}: {error}"
+        if state.opened_at is not None:
+            if state.trial:  # failed trial opens breaker for next cooldown
+                state.trial = False
+                state.opened_at = self._clock()
+                logger.log(
+                    level=log_levels.MODULE_DEBUG,
+                    msg=f"Circuit breaker for {key} stays open, trial attempt failed: {state.last_error}",
+                )
+            return
+        if state.failures >= self.threshold:
+            state.opened_at = self._clock()
+            self.events.append(BreakerEvent(key=key, failures=state.failures, error=state.last_error))
+            logger.warning(
+                f"Circuit breaker opened for {key} after {state.failures} failures for {self.cooldown}s. "
+                f"Last error: {state.last_error}"
+            )
+
+    def call(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call function guarded by breaker of endpoint.
+
+        :param key: Key of endpoint
+        :param func: Function establishing connection to endpoint
+        :return: Value returned by function
+        :raises CircuitOpenError: if breaker is opened for endpoint
+        """
+        if not self.enabled:
+            return func(*args, **kwargs)
+        self.check(key)
+        try:
+            result = func(*args, **kwargs)
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            self.record_failure(key, e)
+            raise
+        except BaseException:
+            self._end_trial(key)
+            raise
+        self.record_success(key)
+        return result
+
+    def _end_trial(self, key: Hashable) -> None:
+        """Allow next trial attempt, when attempt was interrupted without result."""
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                state.trial = False
+
+
+circuit_breaker = CircuitBreaker()
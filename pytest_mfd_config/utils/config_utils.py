@@ -4,16 +4,18 @@
 
 import logging
 import re
-from dataclasses import dataclass, InitVar
+from dataclasses import dataclass, field, fields, InitVar
 from io import StringIO
 from pathlib import Path
-from typing import List, TYPE_CHECKING, Any, Optional
+from typing import List, TYPE_CHECKING, Any, Optional, Dict, NoReturn, Tuple
 
+import pytest
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from jinja2_workarounds import MultiLineInclude
 from mfd_common_libs import add_logging_level, log_levels
 from ruamel.yaml import YAML
 
+from .connection_pool import ConnectionPool
 from .exceptions import ObjectCantBeFoundError
 
 logger = logging.getLogger(__name__)
@@ -100,9 +102,23 @@ def get_item_by_name(name: str, list_of_objects: List[Any]) -> Any:
         raise ObjectCantBeFoundError(f"There is no object on the list named - {name}")
 
 
+def _connection_address(connection: Any) -> Optional[str]:
+    """Get address of endpoint of connection, None if connection has no address (e.g. local connection)."""
+    address = getattr(connection, "_ip", None)
+    if address is None:
+        model = getattr(connection, "model", None)
+        address = getattr(model, "ip_address", None) or getattr(model, "mac_address", None)
+    return str(address) if address is not None else None
+
+
 @dataclass
 class Connections:
-    """Class for instantiated connections."""
+    """
+    Class for instantiated connections.
+
+    Attribute of connection type holds the last connection of that type, connections of the same type and address
+    are available as pool, e.g. `connections.pool("rpyc")`.
+    """
 
     local: Optional["LocalConnection"] = None
     rpyc: Optional["RPyCConnection"] = None
@@ -113,7 +129,92 @@ class Connections:
     tunneled_ssh: Optional["TunneledSSHConnection"] = None
     telnet: Optional["TelnetConnection"] = None
     _connections: InitVar[List] = None
+    pools: Dict[Tuple[str, Optional[str]], ConnectionPool] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self, _connections: List):
+        grouped = {}
         for connection in _connections:
             setattr(self, str(connection), connection)
+            grouped.setdefault((str(connection), _connection_address(connection)), []).append(connection)
+        self.pools = {key: ConnectionPool(group) for key, group in grouped.items()}
+
+    def pool(self, name: str, policy: Optional[str] = None, address: Optional[str] = None) -> ConnectionPool:
+        """
+        Get pool of connections of type to the same address.
+
+        :param name: Type of connection, e.g. 'rpyc', 'ssh'
+        :param policy: Set selection policy of pool, 'round_robin' or 'least_busy'
+        :param address: Address of connections, address of connection in attribute of type is used if not passed
+        :return: ConnectionPool object
+        :raises KeyError: if there is no connection of type and address
+        """
+        if address is None:
+            address = _connection_address(getattr(self, name, None))
+        try:
+            pool = self.pools[(name, address)]
+        except KeyError:
+            available = sorted(f"{kind} {known}" if known else kind for kind, known in self.pools)
+            target = f"{name} connection to {address}" if address else f"{name} connection"
+            raise KeyError(f"There is no {target}, available: {available}") from None
+        if policy is not None:
+            pool.policy = policy
+        return pool
+
+    def all(self) -> List:  # noqa A003
+        """Get all connections, including connections not held by attribute of their type."""
+        connections = [getattr(self, item.name) for item in fields(self) if item.name != "pools"]
+        connections.extend(connection for pool in self.pools.values() for connection in pool)
+        distinct = []
+        for connection in connections:
+            if connection is not None and all(connection is not known for known in distinct):
+                distinct.append(connection)
+        return distinct
+
+    def replace(self, connections: List) -> None:
+        """
+        Replace all connections in place, e.g. after re-establishing them.
+
+        :param connections: List of new connections, connections of types not present in the list are cleared
+        """
+        for item in fields(self):
+            if item.name != "pools":
+                setattr(self, item.name, None)
+        self.__post_init__(connections)
+
+
+class DegradedHosts(dict):
+    """
+    Dictionary of successfully created Host objects, returned by `hosts` fixture in degraded mode.
+
+    Accessing host, which failed during creation, via `[]` or `get()` skips the test instead of raising KeyError
+    or returning default. Membership test (`in`), iteration, `keys()`, `values()` and `items()` cover only available
+    hosts, failed ones are listed in `failures`.
+    """
+
+    def __init__(self, *args, failures: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Init of DegradedHosts.
+
+        :param failures: Dictionary with name of failed host as key and reason of failure as value
+        """
+        super().__init__(*args, **kwargs)
+        self.failures = failures if failures is not None else {}
+
+    def __missing__(self, key: str) -> NoReturn:
+        if key in self.failures:
+            pytest.skip(f"Host '{key}' is unavailable: {self.failures[key]}")
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get host, skip the test if host failed during creation.
+
+        :param key: Name of host
+        :param default: Value returned for host not defined in topology
+        :return: Host object or default
+        """
+        if key in self.failures and key not in self:
+            self.__missing__(key)
+        return super().get(key, default)
@@ -0,0 +1,214 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Latency, traffic and failures of remote calls made via connections created by plugin."""
+
+import functools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+# methods of mfd-connect connections which reach the remote host
+REMOTE_CALLS = (
+    "execute_command",
+    "execute_powershell",
+    "start_process",
+    "start_processes",
+    "get_system_info",
+    "download_file_from_url",
+)
+# upper bounds in seconds of latency histogram buckets, the last bucket has no upper bound
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+_INSTRUMENTED_ATTRIBUTE = "_mfd_call_metrics"
+
+
+def _size(value: Any) -> int:
+    """Get size in bytes of str or bytes value, 0 for other values."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="replace"))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return 0
+
+
+def _bytes_sent(args: tuple, kwargs: Dict[str, Any]) -> int:
+    """Get size of command passed to remote call."""
+    return _size(kwargs["command"] if "command" in kwargs else args[0] if args else None)
+
+
+def _bytes_received(result: Any) -> int:
+    """
+    Get size of stdout and stderr of completed process returned by remote call.
+
+    Process started by start_process(es) is running when call returns, its output is read later and is not counted.
+    """
+    return _size(getattr(result, "stdout", None)) + _size(getattr(result, "stderr", None))
+
+
+@dataclass
+class CallStats:
+    """Statistics of remote calls of single method of connections of single owner and kind."""
+
+    count: int = 0
+    failures: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def add(self, latency: float, failed: bool, bytes_sent: int, bytes_received: int) -> None:
+        """Record single call."""
+        self.count += 1
+        self.failures += failed
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    @property
+    def average_latency(self) -> float:
+        """Average latency of call in seconds."""
+        return self.total_latency / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get JSON-serializable representation of statistics."""
+        buckets = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "average_latency": round(self.average_latency, 6),
+            "max_latency": round(self.max_latency, 6),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "histogram": dict(zip(buckets, self.histogram)),
+        }
+
+
+class ConnectionMetrics:
+    """
+    Session-wide statistics of remote calls made via connections, per owner (host name), connection type and method.
+
+    Remote call methods of instrumented connection are wrapped on the instance, so connection keeps its class.
+    Only the outermost call of thread is recorded, so method implemented by other remote call of the same connection
+    (e.g. execute_powershell calling execute_command) is counted once.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Init of ConnectionMetrics.
+
+        :param enabled: Whether created connections should be instrumented
+        """
+        self.enabled = enabled
+        self._stats: Dict[Tuple[str, str, str], CallStats] = {}
+        self._lock = threading.Lock()
+        self._calling = threading.local()
+
+    def configure(self, enabled: bool) -> None:
+        """Enable or disable instrumenting of connections, forget collected statistics."""
+        with self._lock:
+            self.enabled = enabled
+            self._stats.clear()
+
+    def record(
+        self, owner: str, kind: str, method: str, latency: float, failed: bool, sent: int, received: int
+    ) -> None:
+        """
+        Record remote call.
+
+        :param owner: Name of host owning the connection
+        :param kind: Type of connection
+        :param method: Name of called method
+        :param latency: Duration of call in seconds
+        :param failed: Whether call raised exception
+        :param sent: Bytes sent to remote host (size of command)
+        :param received: Bytes received from remote host (size of output)
+        """
+        with self._lock:
+            self._stats.setdefault((owner, kind, method), CallStats()).add(latency, failed, sent, received)
+
+    def _wrap(self, func: Callable, owner: str, kind: str, method: str) -> Callable:
+        @functools.wraps(func)
+        def _instrumented(*args, **kwargs) -> Any:
+            if getattr(self._calling, "value", False):
+                return func(*args, **kwargs)
+            self._calling.value = True
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                self.record(owner, kind, method, time.perf_counter() - start, True, _bytes_sent(args, kwargs), 0)
+                raise
+            finally:
+                self._calling.value = False
+            self.record(
+                owner,
+                kind,
+                method,
+                time.perf_counter() - start,
+                False,
+                _bytes_sent(args, kwargs),
+                _bytes_received(result),
+            )
+            return result
+
+        return _instrumented
+
+    def instrument(self, connection: Any, owner: str, kind: str) -> Any:
+        """
+        Wrap remote call methods of connection, if instrumenting is enabled.
+
+        Connection already instrumented (e.g. reused connection) is instrumented once.
+
+        :param connection: Connection object
+        :param owner: Name of host owning the connection
+        :param kind: Type of connection
+        :return: The same connection object
+        """
+        if not self.enabled or getattr(connection, _INSTRUMENTED_ATTRIBUTE, False):
+            return connection
+        try:
+            for method in REMOTE_CALLS:
+                func = getattr(connection, method, None)
+                if callable(func):
+                    setattr(connection, method, self._wrap(func, owner, kind, method))
+            setattr(connection, _INSTRUMENTED_ATTRIBUTE, True)
+        except AttributeError as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"{kind} of {owner} cannot be instrumented: {e}")
+        return connection
+
+    def snapshot(self, owner: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        Get collected statistics.
+
+        :param owner: Name of host, statistics of all hosts are returned if not passed
+        :return: Nested dictionary: owner -> connection type -> method -> statistics
+        """
+        result = {}
+        with self._lock:
+            for (stats_owner, kind, method), stats in sorted(self._stats.items()):
+                if owner is None or owner == stats_owner:
+                    result.setdefault(stats_owner, {}).setdefault(kind, {})[method] = stats.to_dict()
+        return result
+
+    def reset(self) -> None:
+        """Forget collected statistics, e.g. before measured part of test."""
+        with self._lock:
+            self._stats.clear()
+
+
+call_metrics = ConnectionMetrics()
@@ -0,0 +1,122 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Handling of connection options from topology."""
+
+import importlib
+import logging
+import re
+from functools import lru_cache
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+from pydantic import SecretStr
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from pytest_mfd_config.models.topology import ConnectionModel
+
+MFD_CONNECT_REFERENCE_PREFIX = "mfd_connect."
+# dotted path of public names only, private and dunder attributes can't be reached
+MFD_CONNECT_REFERENCE_REGEX = re.compile(r"mfd_connect(?:\.[A-Za-z][A-Za-z0-9_]*)+")
+
+
+def is_mfd_connect_reference(value: Any) -> bool:
+    """Check if option value refers to object from mfd_connect, like 'mfd_connect.util.EFI_SHELL_PROMPT_REGEX'."""
+    return isinstance(value, str) and value.startswith(MFD_CONNECT_REFERENCE_PREFIX)
+
+
+@lru_cache(maxsize=None)
+def resolve_mfd_connect_reference(reference: str) -> Any:
+    """
+    Get object from mfd_connect namespace by its dotted path, importing submodules if required.
+
+    Result is cached per path.
+
+    :param reference: Dotted path, e.g. 'mfd_connect.util.EFI_SHELL_PROMPT_REGEX'
+    :return: Referenced object
+    :raises ValueError: if path is not a dotted path of public name or object does not exist
+    """
+    if not MFD_CONNECT_REFERENCE_REGEX.fullmatch(reference):
+        raise ValueError(f"'{reference}' is not a dotted path of public object from mfd_connect")
+    parts = reference.split(".")
+    obj = importlib.import_module(parts[0])
+    for index, name in enumerate(parts[1:], start=2):
+        if hasattr(obj, name):
+            obj = getattr(obj, name)
+            continue
+        try:
+            obj = importlib.import_module(".".join(parts[:index]))
+        except ImportError:
+            raise ValueError(f"Cannot resolve '{reference}': '{'.'.join(parts[:index])}' does not exist") from None
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Resolved connection option '{reference}'.")
+    return obj
+
+
+def resolve_connection_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace references to mfd_connect objects in connection options with the objects.
+
+    :param options: Connection options from topology
+    :return: New dictionary with resolved values
+    :raises ValueError: if any reference can't be resolved
+    """
+    return {
+        key: resolve_mfd_connect_reference(value) if is_mfd_connect_reference(value) else value
+        for key, value in options.items()
+    }
+
+
+class ConstructorKwargs(Mapping):
+    """Read-only kwargs of connection constructor, copied (shallowly) before adding per-connection values."""
+
+    def __init__(self, kwargs: Dict[str, Any]) -> None:
+        """
+        Init of ConstructorKwargs.
+
+        :param kwargs: Dictionary with kwargs
+        """
+        self._kwargs = dict(kwargs)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._kwargs[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._kwargs)
+
+    def __len__(self) -> int:
+        return len(self._kwargs)
+
+    def __repr__(self) -> str:
+        return f"ConstructorKwargs({sorted(self._kwargs)})"
+
+
+def _unwrap_secret(value: Any) -> Any:
+    """Get plaintext of SecretStr, empty string for empty value."""
+    if not value:
+        return ""
+    return value.get_secret_value() if isinstance(value, SecretStr) else value
+
+
+def build_constructor_kwargs(connection_model: "ConnectionModel") -> ConstructorKwargs:
+    """
+    Build read-only template of connection constructor kwargs from model.
+
+    Template contains connection options with references to mfd_connect objects resolved, 'password'
+    and 'jump_host_password' unwrapped from SecretStr and 'ip' if IP address is set in model. Values are shared
+    by all connections created from the template, per-connection values (model, relative connection, IP from OSD)
+    are merged into a shallow copy of it.
+
+    :param connection_model: ConnectionModel object
+    :return: ConstructorKwargs object
+    """
+    options = resolve_connection_options(connection_model.connection_options or {})
+    if connection_model.ip_address:
+        options["ip"] = str(connection_model.ip_address)
+    if options.get("password") is not None:
+        options["password"] = _unwrap_secret(options["password"])
+    if "jump_host_password" in options:
+        options["jump_host_password"] = _unwrap_secret(options["jump_host_password"])
+    return ConstructorKwargs(options)
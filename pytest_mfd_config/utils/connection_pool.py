@@ -0,0 +1,93 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Pool of connections of the same type to single host."""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Sequence
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+SELECTION_POLICIES = ("round_robin", "least_busy")
+
+
+class ConnectionPool:
+    """
+    Connections of the same type to single host, selected per call, so threads can execute commands in parallel.
+
+    'round_robin' selects connections in turns, 'least_busy' selects connection with the lowest number of calls
+    in progress (acquired and not yet released), ties are resolved in turns.
+    """
+
+    def __init__(self, connections: Sequence[Any], policy: str = "round_robin") -> None:
+        """
+        Init of ConnectionPool.
+
+        :param connections: Connections of the same type
+        :param policy: Selection policy, one of 'round_robin', 'least_busy'
+        :raises ValueError: if policy is unknown or there are no connections
+        """
+        if not connections:
+            raise ValueError("Connection pool requires at least one connection")
+        self.connections: List[Any] = list(connections)
+        self.policy = policy
+        self._busy = [0] * len(self.connections)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> str:
+        """Selection policy."""
+        return self._policy
+
+    @policy.setter
+    def policy(self, value: str) -> None:
+        if value not in SELECTION_POLICIES:
+            raise ValueError(f"Unknown selection policy '{value}', choose one from {list(SELECTION_POLICIES)}")
+        self._policy = value
+
+    def _select(self) -> int:
+        """Get index of next connection, must be called with lock held."""
+        count = len(self.connections)
+        order = [(self._next + offset) % count for offset in range(count)]
+        index = order[0] if self._policy == "round_robin" else min(order, key=lambda i: self._busy[i])
+        self._next = (index + 1) % count
+        return index
+
+    def get(self) -> Any:
+        """Get next connection according to policy, without marking it as busy."""
+        with self._lock:
+            return self.connections[self._select()]
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """Get next connection according to policy, marked as busy until the block ends."""
+        with self._lock:
+            index = self._select()
+            self._busy[index] += 1
+        try:
+            yield self.connections[index]
+        finally:
+            with self._lock:
+                self._busy[index] -= 1
+
+    def execute_command(self, *args, **kwargs) -> Any:
+        """Execute command via connection selected according to policy, parameters as in execute_command."""
+        with self.acquire() as connection:
+            return connection.execute_command(*args, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.connections)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.connections)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.connections[index]
+
+    def __repr__(self) -> str:
+        return f"ConnectionPool({len(self.connections)} connections, policy={self._policy!r})"
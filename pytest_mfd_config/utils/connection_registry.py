@@ -0,0 +1,186 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Registry of live connections reused across requests for the same ConnectionModel."""
+
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+from pydantic import SecretStr
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from mfd_connect import AsyncConnection
+    from pytest_mfd_config.models.topology import ConnectionModel
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert option value into hashable form, secrets are represented by their digest."""
+    if isinstance(value, SecretStr):
+        return "secret", hashlib.sha256(value.get_secret_value().encode("utf-8")).hexdigest()
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def connection_fingerprint(
+    connection_model: "ConnectionModel", relative_connection: Optional["AsyncConnection"] = None
+) -> Hashable:
+    """
+    Get stable fingerprint of connection.
+
+    Fingerprint consists of connection type, address, connection options and fingerprint of relative parent connection.
+
+    :param connection_model: ConnectionModel object
+    :param relative_connection: Relative connection object, if required
+    :return: Hashable fingerprint
+    """
+    parent = None
+    if relative_connection is not None:
+        parent_model = getattr(relative_connection, "model", None)
+        parent = connection_fingerprint(parent_model) if parent_model is not None else id(relative_connection)
+    address = connection_model.ip_address or connection_model.mac_address
+    return (
+        connection_model.connection_type,
+        str(address) if address is not None else None,
+        _freeze(connection_model.connection_options or {}),
+        parent,
+    )
+
+
+def is_connection_alive(connection: "AsyncConnection") -> bool:
+    """
+    Check cheaply, without remote call, if connection is still alive.
+
+    Supports RPyC (closed flag of rpyc connection) and Paramiko based (active transport) connections,
+    other connections are considered alive.
+
+    :param connection: Connection object
+    :return: False if connection is known to be dropped
+    """
+    inner = getattr(connection, "_connection", None)
+    if inner is None:
+        return True
+    closed = getattr(inner, "closed", None)
+    if isinstance(closed, bool):
+        return not closed
+    get_transport = getattr(inner, "get_transport", None)
+    if callable(get_transport):
+        transport = get_transport()
+        return transport is not None and bool(transport.is_active())
+    return True
+
+
+@dataclass
+class RegistryEntry:
+    """Live connection with number of its users."""
+
+    connection: "AsyncConnection"
+    references: int = 1
+
+
+class ConnectionRegistry:
+    """
+    Session-wide registry of live connections keyed by fingerprint of ConnectionModel.
+
+    Fingerprint can have several registered connections (e.g. fresh one created while previous one is still used),
+    each of them stays registered until released by its last user. Connection found dead is removed from registry
+    before its replacement is created, its users release it as not registered connection.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Init of ConnectionRegistry.
+
+        :param enabled: Whether connections should be reused
+        """
+        self.enabled = enabled
+        self._entries: Dict[Hashable, List[RegistryEntry]] = {}
+        self._lock = threading.Lock()
+        self._creation_locks: Dict[Hashable, threading.Lock] = defaultdict(threading.Lock)
+
+    def configure(self, enabled: bool) -> None:
+        """Enable or disable reusing of connections, forget all registered connections."""
+        with self._lock:
+            self.enabled = enabled
+            self._entries.clear()
+            self._creation_locks.clear()
+
+    def acquire(
+        self, fingerprint: Hashable, factory: Callable[[], "AsyncConnection"], fresh: bool = False
+    ) -> "AsyncConnection":
+        """
+        Get live connection for fingerprint or create new one.
+
+        :param fingerprint: Fingerprint of connection
+        :param factory: Function creating new connection
+        :param fresh: Create new connection even if live one is registered, new one is reused by next requests,
+                      previous ones stay registered until released by their users
+        :return: Connection object
+        """
+        with self._lock:
+            creation_lock = self._creation_locks[fingerprint]
+        with creation_lock:
+            with self._lock:
+                entries = self._entries.get(fingerprint, [])
+                for entry in [entry for entry in entries if not is_connection_alive(entry.connection)]:
+                    logger.log(
+                        level=log_levels.MODULE_DEBUG,
+                        msg=f"Registered {entry.connection} connection is dead, removing it from registry.",
+                    )
+                    entries.remove(entry)
+                if not entries:
+                    self._entries.pop(fingerprint, None)
+                elif not fresh:
+                    entry = entries[-1]
+                    entry.references += 1
+                    logger.log(
+                        level=log_levels.MODULE_DEBUG,
+                        msg=f"Reusing {entry.connection} connection ({entry.references} users).",
+                    )
+                    return entry.connection
+            connection = factory()
+            with self._lock:
+                self._entries.setdefault(fingerprint, []).append(RegistryEntry(connection=connection))
+            return connection
+
+    def release(self, connection: "AsyncConnection") -> bool:
+        """
+        Drop one reference of connection.
+
+        :param connection: Connection object
+        :return: True if it was the last user of registered connection (or connection is not registered),
+                 so connection can be disconnected by caller
+        """
+        with self._lock:
+            for fingerprint, entries in self._entries.items():
+                for entry in entries:
+                    if entry.connection is connection:
+                        entry.references -= 1
+                        if entry.references > 0:
+                            return False
+                        entries.remove(entry)
+                        if not entries:
+                            del self._entries[fingerprint]
+                        return True
+        return True
+
+    def connections(self) -> List["AsyncConnection"]:
+        """Get list of registered connections."""
+        with self._lock:
+            return [entry.connection for entries in self._entries.values() for entry in entries]
+
+
+connection_registry = ConnectionRegistry()
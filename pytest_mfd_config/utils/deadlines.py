@@ -0,0 +1,195 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Deadlines of setup phases and concurrent workers with common deadline."""
+
+import contextvars
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.exceptions import SetupDeadlineExceededError
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+DEFAULT_PHASE = "default"
+
+
+class SetupDeadlines:
+    """
+    Deadlines in seconds for setup phases.
+
+    Keys are connection types (e.g. 'RPyCConnection', 'SerialConnection') or names of phases
+    ('power_mng', 'switch', 'host', 'network_interfaces').
+    Value stored under 'default' key is used for not listed ones.
+    """
+
+    def __init__(self, deadlines: Optional[Dict[str, float]] = None) -> None:
+        """
+        Init of SetupDeadlines.
+
+        :param deadlines: Dictionary with phase or connection type as key and deadline in seconds as value
+        """
+        self._deadlines = dict(deadlines) if deadlines else {}
+
+    def configure(self, deadlines: Optional[Dict[str, float]]) -> None:
+        """Replace configured deadlines."""
+        self._deadlines = dict(deadlines) if deadlines else {}
+
+    def get(self, phase: str) -> Optional[float]:
+        """
+        Get deadline for phase.
+
+        :param phase: Connection type or name of phase
+        :return: Deadline in seconds, None if phase is not limited
+        """
+        return self._deadlines.get(phase, self._deadlines.get(DEFAULT_PHASE))
+
+
+setup_deadlines = SetupDeadlines()
+
+
+def parse_setup_deadlines(value: Optional[str]) -> Dict[str, float]:
+    """
+    Parse value of --setup_deadlines option.
+
+    :param value: Deadlines in format: phase1=seconds,phase2=seconds
+    :return: Dictionary with phase as key and deadline in seconds as value
+    :raises ValueError: in case of wrong format
+    """
+    deadlines = {}
+    if not value:
+        return deadlines
+    for pair in value.split(","):
+        try:
+            phase, seconds = pair.split("=")
+            deadlines[phase.strip()] = float(seconds)
+        except ValueError as e:
+            raise ValueError(
+                f"Cannot parse setup deadline '{pair}'. Acceptable format: 'RPyCConnection=60,switch=120,default=300'"
+            ) from e
+    return deadlines
+
+
+def run_with_deadline(
+    func: Callable,
+    *args,
+    deadline: Optional[float],
+    description: str,
+    on_late_result: Optional[Callable[[Any], None]] = None,
+    **kwargs,
+) -> Any:
+    """
+    Call function in worker thread and wait for result no longer than deadline.
+
+    Worker is a daemon thread, so if deadline passes it is abandoned and won't block the interpreter exit.
+    Function is called in copy of caller's context (context variables).
+
+    :param func: Function to be called
+    :param deadline: Time in seconds, when None function is called directly
+    :param description: Description of setup phase used in failure message
+    :param on_late_result: Function called in worker thread with value returned by function after deadline passed,
+                           e.g. closing connection established by abandoned worker
+    :return: Value returned by function
+    :raises SetupDeadlineExceededError: if function did not finish within deadline
+    """
+    if deadline is None:
+        return func(*args, **kwargs)
+
+    outcome = {}
+    lock = threading.Lock()
+    context = contextvars.copy_context()
+
+    def _worker() -> None:
+        try:
+            result = context.run(func, *args, **kwargs)
+        except BaseException as e:  # noqa: B036 re-raised in caller thread
+            with lock:
+                outcome["error"] = e
+            return
+        with lock:
+            outcome["result"] = result
+            abandoned = outcome.get("abandoned", False)
+        if abandoned and on_late_result is not None:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Late result of {description}, cleaning up.")
+            try:
+                context.run(on_late_result, result)
+            except Exception as e:
+                logger.warning(f"Cleaning up result of {description} failed: {type(e).__name__}: {e}")
+
+    worker = threading.Thread(target=_worker, name=f"setup: {description}", daemon=True)
+    worker.start()
+    worker.join(deadline)
+    with lock:
+        finished = "result" in outcome or "error" in outcome
+        outcome["abandoned"] = not finished
+    if not finished:
+        logger.warning(f"Abandoning setup worker of {description} after {deadline}s.")
+        raise SetupDeadlineExceededError(f"{description} did not finish within deadline of {deadline}s.")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+
+@dataclass
+class WorkerOutcome:
+    """Outcome of function called in worker thread."""
+
+    result: Any = None
+    error: Optional[BaseException] = None
+    finished: bool = False
+
+
+def run_concurrently(
+    calls: Dict[Hashable, Callable[[], Any]],
+    deadline: Optional[float] = None,
+    name: str = "worker",
+    max_workers: Optional[int] = None,
+) -> Dict[Hashable, WorkerOutcome]:
+    """
+    Call functions concurrently in daemon worker threads and wait for them no longer than common deadline.
+
+    Workers which did not finish within deadline are abandoned and their outcome contains TimeoutError.
+    Each function is called in copy of caller's context (context variables).
+
+    :param calls: Dictionary with key identifying call and function without arguments as value
+    :param deadline: Time in seconds for all calls, None means waiting until all calls finish
+    :param name: Prefix of worker threads names
+    :param max_workers: Maximum number of concurrently running calls, None means no limit
+    :return: Dictionary with the same keys as calls and outcomes of calls as values
+    """
+    outcomes = {key: WorkerOutcome() for key in calls}
+    slots = threading.BoundedSemaphore(max_workers) if max_workers else None
+
+    def _worker(key: Hashable, func: Callable[[], Any], context: contextvars.Context) -> None:
+        if slots is not None:
+            slots.acquire()
+        try:
+            outcomes[key].result = context.run(func)
+        except BaseException as e:  # noqa: B036 passed to caller thread
+            outcomes[key].error = e
+        finally:
+            outcomes[key].finished = True
+            if slots is not None:
+                slots.release()
+
+    workers = [
+        threading.Thread(
+            target=_worker, args=(key, func, contextvars.copy_context()), name=f"{name}: {key}", daemon=True
+        )
+        for key, func in calls.items()
+    ]
+    for worker in workers:
+        worker.start()
+    end_time = None if deadline is None else time.monotonic() + deadline
+    for worker in workers:
+        worker.join(None if end_time is None else max(0.0, end_time - time.monotonic()))
+    for key, outcome in outcomes.items():
+        if not outcome.finished:
+            logger.warning(f"Abandoning {name} of {key} after {deadline}s.")
+            outcome.error = TimeoutError(f"{name} of {key} did not finish within deadline of {deadline}s.")
+    return outcomes
@@ -0,0 +1,167 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Streaming of extra_data of tests into JSON Lines file."""
+
+import json
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, IO, Optional, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+_STOP = object()
+
+
+@dataclass
+class SinkStats:
+    """Counters of extra_data sink."""
+
+    written: int = 0
+    truncated: int = 0
+    dropped: int = 0
+    bytes_written: int = 0
+
+
+class ExtraDataSink:
+    """
+    Writer of per-test records into JSON Lines file, one line per test.
+
+    Records are serialized by caller, so later changes of record do not affect written line, and written by
+    background thread. Queue of lines waiting for writing is bounded, so memory usage does not grow with number
+    of tests. Lines are dropped when queue stays full for put_timeout seconds or when file reached its size limit.
+    Sink configured without writer (e.g. in pytest-xdist worker) only serializes records, lines are written
+    by process owning the file.
+    """
+
+    def __init__(self, queue_size: int = 1000, put_timeout: float = 5.0) -> None:
+        """
+        Init of ExtraDataSink.
+
+        :param queue_size: Maximal number of records waiting for writing
+        :param put_timeout: Time in seconds to wait for free place in queue before dropping the record
+        """
+        self.queue_size = queue_size
+        self.put_timeout = put_timeout
+        self.path: Optional[str] = None
+        self.max_record_size: Optional[int] = None
+        self.max_file_size: Optional[int] = None
+        self.stats = SinkStats()
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._file: Optional[IO[str]] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether records are collected."""
+        return self.path is not None
+
+    @property
+    def writing(self) -> bool:
+        """Whether this process writes lines into file."""
+        return self._thread is not None
+
+    def configure(
+        self,
+        path: Optional[str],
+        max_record_size: Optional[int] = None,
+        max_file_size: Optional[int] = None,
+        writer: bool = True,
+    ) -> None:
+        """
+        Start collecting records, stop if path is None.
+
+        :param path: Path of JSON Lines file, overwritten if exists
+        :param max_record_size: Maximal size of record in bytes, extra_data of bigger records is replaced by its size
+        :param max_file_size: Maximal size of file in bytes, records which don't fit are dropped
+        :param writer: Whether this process opens the file and writes lines, False in pytest-xdist workers
+        """
+        self.stop()
+        self.path = path
+        self.max_record_size = max_record_size
+        self.max_file_size = max_file_size
+        self.stats = SinkStats()
+        if path is None or not writer:
+            return
+        self._file = open(path, "w", encoding="utf-8")
+        self._queue = queue.Queue(maxsize=self.queue_size)
+        self._thread = threading.Thread(target=self._run, name="extra_data sink", daemon=True)
+        self._thread.start()
+
+    def serialize(self, record: Dict[str, Any]) -> Tuple[str, bool]:
+        """
+        Serialize record into single line, replacing extra_data if record is bigger than limit.
+
+        :param record: JSON-serializable dictionary, objects which are not serializable are written as str
+        :return: Line and whether extra_data was replaced by its size
+        """
+        line = json.dumps(record, default=str) + "\n"
+        size = len(line.encode("utf-8"))
+        if self.max_record_size is None or size <= self.max_record_size:
+            return line, False
+        summary = {key: value for key, value in record.items() if key != "extra_data"}
+        summary["extra_data_truncated"] = size
+        return json.dumps(summary, default=str) + "\n", True
+
+    def submit(self, line: str, truncated: bool = False) -> None:
+        """
+        Queue serialized record for writing.
+
+        :param line: Line returned by serialize
+        :param truncated: Whether extra_data of record was replaced by its size, counted in statistics
+        """
+        if not self.writing:
+            return
+        self.stats.truncated += truncated
+        try:
+            self._queue.put(line, timeout=self.put_timeout)
+        except queue.Full:
+            self.stats.dropped += 1
+            logger.log(level=log_levels.MODULE_DEBUG, msg="extra_data sink queue is full, record dropped.")
+
+    def _write(self, line: str) -> None:
+        size = len(line.encode("utf-8"))
+        if self.max_file_size is not None and self.stats.bytes_written + size > self.max_file_size:
+            self.stats.dropped += 1
+            return
+        self._file.write(line)
+        self.stats.written += 1
+        self.stats.bytes_written += size
+
+    def _run(self) -> None:
+        while True:
+            line = self._queue.get()
+            try:
+                if line is _STOP:
+                    return
+                self._write(line)
+                if self._queue.empty():
+                    self._file.flush()
+            except Exception as e:
+                self.stats.dropped += 1
+                logger.warning(f"Cannot write extra_data record: {type(e).__name__}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until all queued records are written."""
+        if self.writing:
+            self._queue.join()
+            self._file.flush()
+
+    def stop(self) -> None:
+        """Write queued records, stop background thread and close file, stop collecting records."""
+        self.path = None
+        if not self.writing:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+        self._thread = self._queue = self._file = None
+
+
+extra_data_sink = ExtraDataSink()
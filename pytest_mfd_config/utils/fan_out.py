@@ -0,0 +1,131 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Running the same command or function on many hosts concurrently."""
+
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.utils.deadlines import run_concurrently
+from pytest_mfd_config.utils.host_logs import log_owner
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from mfd_host import Host
+
+Action = Union[str, Callable[["Host"], Any]]
+
+
+@dataclass
+class FanOutResult:
+    """Outcome of command or function on single host."""
+
+    host: str
+    result: Any = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether command or function finished without exception."""
+        return self.error is None
+
+
+def unique_hosts(hosts: Iterable[Union["Host", Tuple["Host", ...]]]) -> List["Host"]:
+    """
+    Get hosts without duplicates, pairs of hosts (e.g. from connected_hosts fixture) are flattened.
+
+    :param hosts: Host objects or tuples of Host objects, dictionary with Host objects as values (hosts fixture)
+    :return: List of Host objects in order of first occurrence, unique by name
+    """
+    if isinstance(hosts, Mapping):
+        hosts = hosts.values()
+    unique = {}
+    for item in hosts:
+        for host in item if isinstance(item, tuple) else (item,):
+            unique.setdefault(host.name, host)
+    return list(unique.values())
+
+
+def run_on_hosts(
+    hosts: Iterable[Union["Host", Tuple["Host", ...]]], action: Action, deadline: Optional[float] = None, **kwargs
+) -> Dict[str, FanOutResult]:
+    """
+    Run command via connection of every host or call function with every host, concurrently.
+
+    Exceptions are collected in results instead of being raised. All hosts start at once, so deadline applies
+    to each host separately, host which did not finish before deadline is abandoned (command keeps running on host)
+    and its result contains TimeoutError. Returned results are not changed by abandoned hosts finishing later.
+
+    :param hosts: Host objects or tuples of Host objects (e.g. from connected_hosts fixture), each host is used once
+    :param action: Command executed via host.connection.execute_command or function called with Host object
+    :param deadline: Time in seconds for each host, None means waiting until all hosts finish
+    :param kwargs: Parameters of execute_command (including its timeout) or function
+    :return: Dictionary with host name as key and result as value
+    """
+    hosts = {host.name: host for host in unique_hosts(hosts)}
+    results = {name: FanOutResult(host=name) for name in hosts}
+
+    def _run(name: str) -> Any:
+        host = hosts[name]
+        start = time.monotonic()
+        try:
+            with log_owner(name):
+                if isinstance(action, str):
+                    return host.connection.execute_command(action, **kwargs)
+                return action(host, **kwargs)
+        finally:
+            results[name].duration = time.monotonic() - start
+
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Running {action!r} on hosts: {', '.join(hosts)}.")
+    outcomes = run_concurrently(
+        {name: lambda name=name: _run(name) for name in hosts}, deadline=deadline, name="fan-out"
+    )
+    returned = {}
+    for name, outcome in outcomes.items():
+        # copy, abandoned worker still sets duration of its own result when it finishes
+        returned[name] = replace(
+            results[name],
+            result=outcome.result,
+            error=outcome.error,
+            duration=results[name].duration if outcome.finished else deadline,
+        )
+        if outcome.error is not None:
+            logger.log(
+                level=log_levels.MODULE_DEBUG,
+                msg=f"{action!r} failed on {name}: {type(outcome.error).__name__}: {outcome.error}",
+            )
+    return returned
+
+
+class FanOut:
+    """Running the same command or function on hosts from hosts fixture, selected by name."""
+
+    def __init__(self, hosts: Dict[str, "Host"]) -> None:
+        """
+        Init of FanOut.
+
+        :param hosts: Dictionary with host name as key and Host object as value
+        """
+        self._hosts = hosts
+
+    def run(
+        self, action: Action, names: Optional[Iterable[str]] = None, deadline: Optional[float] = None, **kwargs
+    ) -> Dict[str, FanOutResult]:
+        """
+        Run command or function on hosts concurrently, on all hosts if names are not passed.
+
+        :param action: Command executed via host.connection.execute_command or function called with Host object
+        :param names: Names of hosts
+        :param deadline: Time in seconds for each host
+        :param kwargs: Parameters of execute_command (including its timeout) or function
+        :return: Dictionary with host name as key and result as value
+        """
+        selected = [self._hosts[name] for name in names] if names is not None else list(self._hosts.values())
+        return run_on_hosts(selected, action, deadline=deadline, **kwargs)
@@ -0,0 +1,234 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Session cache of facts about host, which don't change until reboot or reconnect."""
+
+import functools
+import logging
+import shlex
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_typing import OSType
+
+from pytest_mfd_config.utils.power_mng import LazyPowerManagement
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from mfd_host import Host
+    from mfd_powermanagement.base import PowerManagement
+
+FACT_NAMES = ("os_name", "kernel_version", "cpu_count", "hostname")
+# methods of power management objects after which facts of host are outdated
+POWER_METHODS = ("power_on", "power_up", "power_off", "power_down", "power_cycle", "powercycle")
+
+# all facts caches, matched to reconnected connection by identity, host names are not unique across sessions of tests
+_all_facts: "weakref.WeakSet[HostFacts]" = weakref.WeakSet()
+_all_facts_lock = threading.Lock()
+
+
+def _posix_command(interfaces: List[str]) -> str:
+    commands = [
+        'echo "os_name=$(uname -s)"',
+        'echo "kernel_version=$(uname -r)"',
+        'echo "cpu_count=$(getconf _NPROCESSORS_ONLN)"',
+        'echo "hostname=$(hostname)"',
+    ]
+    for interface in interfaces:
+        quoted = shlex.quote(interface)
+        commands.append(
+            f"ethtool -i {quoted} 2>/dev/null | sed -n "
+            + shlex.quote(f"s/^driver: /driver.{interface}=/p; s/^version: /driver_version.{interface}=/p")
+        )
+    return "; ".join(commands)
+
+
+def _windows_command(interfaces: List[str]) -> str:
+    commands = [
+        '"os_name=$((Get-CimInstance Win32_OperatingSystem).Caption)"',
+        '"kernel_version=$([Environment]::OSVersion.Version)"',
+        '"cpu_count=$([Environment]::ProcessorCount)"',
+        '"hostname=$env:COMPUTERNAME"',
+    ]
+    if interfaces:
+        names = ",".join("'" + interface.replace("'", "''") + "'" for interface in interfaces)
+        commands.append(
+            f"Get-NetAdapter -Name {names} -ErrorAction SilentlyContinue | ForEach-Object "
+            '{ "driver.$($_.Name)=$($_.DriverName)"; "driver_version.$($_.Name)=$($_.DriverVersion)" }'
+        )
+    return "; ".join(commands)
+
+
+def parse_facts(output: str) -> Dict[str, Any]:
+    """
+    Parse output of facts command.
+
+    :param output: Lines in format 'name=value', drivers as 'driver.<interface>=' and 'driver_version.<interface>='
+    :return: Dictionary with facts, drivers under 'drivers' key as {interface: {'driver': ..., 'version': ...}}
+    """
+    facts: Dict[str, Any] = {name: None for name in FACT_NAMES}
+    facts["drivers"] = {}
+    for line in output.splitlines():
+        name, separator, value = line.strip().partition("=")
+        if not separator or not value:
+            continue
+        if name.startswith("driver."):
+            facts["drivers"].setdefault(name.partition(".")[2], {})["driver"] = value
+        elif name.startswith("driver_version."):
+            facts["drivers"].setdefault(name.partition(".")[2], {})["version"] = value
+        elif name in FACT_NAMES:
+            facts[name] = value
+    if facts["cpu_count"] is not None:
+        facts["cpu_count"] = int(facts["cpu_count"]) if facts["cpu_count"].isdigit() else None
+    return facts
+
+
+class HostFacts:
+    """
+    Facts about host (OS name, kernel version, CPU count, hostname, drivers of interfaces from topology).
+
+    Facts are gathered with single remote command on first access and served from memory until invalidated.
+    Cache is invalidated when host is reconnected (keepalive, host_reconnector), its power management performs
+    power action or main connection of host is replaced.
+    """
+
+    def __init__(self, host: "Host", owner: str) -> None:
+        """
+        Init of HostFacts.
+
+        :param host: Host object
+        :param owner: Name of host, used in logs
+        """
+        self._host = host
+        self.owner = owner
+        self._facts: Optional[Dict[str, Any]] = None
+        self._connection = None
+        self._lock = threading.Lock()
+        with _all_facts_lock:
+            _all_facts.add(self)
+
+    def uses(self, connection: Any) -> bool:
+        """
+        Check whether connection belongs to host of facts.
+
+        :param connection: Connection object
+        :return: True if connection is main connection or one of connections of host
+        """
+        connections = [self._host.connection, *(getattr(self._host, "connections", None) or [])]
+        return any(item is connection for item in connections)
+
+    @property
+    def cached(self) -> bool:
+        """Whether facts are gathered and valid."""
+        return self._facts is not None and self._connection is self._host.connection
+
+    def _interfaces(self) -> List[str]:
+        topology = getattr(self._host, "topology", None)
+        interfaces = getattr(topology, "network_interfaces", None) or []
+        return [interface.interface_name for interface in interfaces if getattr(interface, "interface_name", None)]
+
+    def _gather(self) -> Dict[str, Any]:
+        connection = self._host.connection
+        interfaces = self._interfaces()
+        os_type = connection.get_os_type()
+        if os_type == OSType.POSIX:
+            output = connection.execute_command(_posix_command(interfaces), shell=True, expected_return_codes=None)
+        elif os_type == OSType.WINDOWS:
+            output = connection.execute_powershell(_windows_command(interfaces), expected_return_codes=None)
+        else:
+            raise NotImplementedError(f"Gathering facts is not supported for OS type {os_type}.")
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Gathered facts of {self.owner}.")
+        return parse_facts(output.stdout)
+
+    def all(self) -> Dict[str, Any]:  # noqa A003
+        """Get all facts, gather them if not cached."""
+        with self._lock:
+            if not self.cached:
+                connection = self._host.connection
+                self._facts = self._gather()
+                self._connection = connection
+            return self._facts
+
+    def get(self, name: str) -> Any:
+        """
+        Get fact.
+
+        :param name: One of 'os_name', 'kernel_version', 'cpu_count', 'hostname', 'drivers'
+        :return: Value of fact, None if host did not report it
+        """
+        return self.all()[name]
+
+    @property
+    def os_name(self) -> Optional[str]:
+        """OS name, e.g. 'Linux', 'FreeBSD' or Windows edition."""
+        return self.get("os_name")
+
+    @property
+    def kernel_version(self) -> Optional[str]:
+        """Kernel version (OS version on Windows)."""
+        return self.get("kernel_version")
+
+    @property
+    def cpu_count(self) -> Optional[int]:
+        """Number of online logical CPUs."""
+        return self.get("cpu_count")
+
+    @property
+    def hostname(self) -> Optional[str]:
+        """Hostname."""
+        return self.get("hostname")
+
+    @property
+    def drivers(self) -> Dict[str, Dict[str, str]]:
+        """Driver name and version per interface name from topology."""
+        return self.get("drivers")
+
+    def invalidate(self) -> None:
+        """Forget facts, they are gathered again on next access."""
+        with self._lock:
+            if self._facts is not None:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Facts of {self.owner} invalidated.")
+            self._facts = None
+
+    def refresh(self) -> Dict[str, Any]:
+        """Gather facts again."""
+        self.invalidate()
+        return self.all()
+
+
+def invalidate_host_facts(connection: Any) -> None:
+    """
+    Invalidate facts of every host using connection, e.g. after connection was reconnected in place.
+
+    :param connection: Connection object
+    """
+    with _all_facts_lock:
+        all_facts = list(_all_facts)
+    for facts in all_facts:
+        if facts.uses(connection):
+            facts.invalidate()
+
+
+def _call_power_method(power_mng: Any, method: str, callback: Callable[[], None], *args, **kwargs) -> Any:
+    """Call power method of class, bypassing wrapper set on instance, and call callback afterwards."""
+    target = power_mng._get() if type(power_mng) is LazyPowerManagement else power_mng
+    try:
+        return getattr(type(target), method)(target, *args, **kwargs)
+    finally:
+        callback()
+
+
+def invalidate_on_power_actions(power_mng: "PowerManagement", callback: Callable[[], None]) -> None:
+    """
+    Call callback after every power action of power management object.
+
+    :param power_mng: PowerManagement object or its lazy proxy, proxy is not forced to create the object
+    :param callback: Function without arguments, e.g. HostFacts.invalidate
+    """
+    power_mng_class = power_mng.__class__  # class of proxied object for lazy power management
+    for method in POWER_METHODS:
+        if callable(getattr(power_mng_class, method, None)):
+            setattr(power_mng, method, functools.partial(_call_power_method, power_mng, method, callback))
@@ -0,0 +1,227 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Routing of log records into per-host log files."""
+
+import contextvars
+import gzip
+import logging
+import os
+import re
+import shutil
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Pattern
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.utils.queued_logging import queued_logging
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+_current_owner: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("log_owner", default=None)
+_last_owner = threading.local()  # (logger name, owner) of the last record of thread matched by address
+
+OWNER_ATTRIBUTE = "host_log_owner"
+ROUTED_ATTRIBUTE = "_host_log_routed"
+
+
+@contextmanager
+def log_owner(owner: Optional[str]) -> Iterator[None]:
+    """
+    Attribute log records emitted in the block (also by worker threads started via deadlines helpers) to owner.
+
+    Owner remembered from address in earlier record of the thread is forgotten on exit, so records following
+    the block are not attributed to host used before it.
+
+    :param owner: Name of host or switch
+    """
+    token = _current_owner.set(owner)
+    try:
+        yield
+    finally:
+        _current_owner.reset(token)
+        _last_owner.value = None
+
+
+def _compress_rotated(source: str, dest: str) -> None:
+    """Rotator of RotatingFileHandler compressing rotated file."""
+    with open(source, "rb") as source_file, gzip.open(dest, "wb") as dest_file:
+        shutil.copyfileobj(source_file, dest_file)
+    os.remove(source)
+
+
+def _file_name(owner: str, worker_id: Optional[str] = None) -> str:
+    name = re.sub(r"[^A-Za-z0-9_.-]", "_", owner)
+    if worker_id:
+        name = f"{name}.{re.sub(r'[^A-Za-z0-9_-]', '_', worker_id)}"
+    return name + ".log"
+
+
+@dataclass
+class HostLogStats:
+    """Records written into log file of single owner."""
+
+    path: str
+    records: int = 0
+
+
+class HostLogRouter:
+    """
+    Router of log records into per-owner (host or switch name) files, rotated by size and compressed.
+
+    Owner of record is taken from, in order:
+    - 'host_log_owner' attribute of record (logging extra),
+    - owner set by log_owner context manager, plugin sets it while creating, reconnecting, powering and closing
+      hosts and switches,
+    - address of connection registered for owner found in message, e.g. '>10.10.10.10> ...' of mfd-connect,
+      following records from the same logger and thread without address (e.g. command output) go to the same owner
+      until log_owner block of the thread exits.
+    Routed records are written into main log only if their level is at least main_level.
+    """
+
+    def __init__(self) -> None:
+        """Init of HostLogRouter."""
+        self.directory: Optional[Path] = None
+        self.max_bytes = 0
+        self.backup_count = 0
+        self.main_level = logging.WARNING
+        self.worker_id: Optional[str] = None
+        self.stats: Dict[str, HostLogStats] = {}
+        self._formatter: Optional[logging.Formatter] = None
+        self._handlers: Dict[str, RotatingFileHandler] = {}
+        self._addresses: Dict[str, str] = {}
+        self._address_regex: Optional[Pattern] = None
+        self._main_handler: Optional[logging.Handler] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether records are routed."""
+        return self._main_handler is not None
+
+    def configure(
+        self,
+        directory: Optional[str],
+        main_handler: Optional[logging.Handler] = None,
+        max_bytes: int = 100 * 1024 * 1024,
+        backup_count: int = 5,
+        main_level: int = logging.WARNING,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        """
+        Start routing records handled by main handler into per-owner files, stop routing if directory is None.
+
+        :param directory: Directory of per-owner log files, created if does not exist
+        :param main_handler: Handler of main log, its formatter is used for per-owner files
+        :param max_bytes: Size of file in bytes after which it is rotated, 0 disables rotation
+        :param backup_count: Number of compressed rotated files kept per owner
+        :param main_level: Minimal level of routed records which are written into main log as well
+        :param worker_id: Id of pytest-xdist worker added to file names (e.g. 'sut.gw0.log'), so workers sharing
+                          directory do not write into the same files
+        """
+        self.stop()
+        self.stats = {}
+        self._addresses = {}
+        self._address_regex = None
+        _last_owner.value = None
+        self.directory = None if directory is None else Path(directory)
+        if self.directory is None or main_handler is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.main_level = main_level
+        self.worker_id = worker_id
+        self._formatter = main_handler.formatter
+        self._main_handler = main_handler
+        main_handler.addFilter(self._route)
+
+    def register_address(self, address: Optional[str], owner: str) -> None:
+        """
+        Attribute records mentioning address to owner.
+
+        :param address: IP address of connection
+        :param owner: Name of host or switch
+        """
+        if not address:
+            return
+        with self._lock:
+            if self._addresses.get(str(address)) == owner:
+                return
+            self._addresses[str(address)] = owner
+            alternatives = "|".join(re.escape(known) for known in sorted(self._addresses, key=len, reverse=True))
+            self._address_regex = re.compile(rf"(?<![\w.:])({alternatives})(?![\w:]|\.\d)")
+
+    def resolve_owner(self, record: logging.LogRecord) -> Optional[str]:
+        """
+        Get owner of record.
+
+        :param record: Log record
+        :return: Name of host or switch, None if record is not attributed to any
+        """
+        owner = getattr(record, OWNER_ATTRIBUTE, None) or _current_owner.get()
+        if owner is not None:
+            return owner
+        regex = self._address_regex
+        match = regex.search(record.getMessage()) if regex is not None else None
+        if match is not None:
+            owner = self._addresses.get(match.group(1))
+            _last_owner.value = (record.name, owner)
+            return owner
+        last = getattr(_last_owner, "value", None)
+        if last is not None and last[0] == record.name:
+            return last[1]
+        return None
+
+    def _handler(self, owner: str) -> RotatingFileHandler:
+        handler = self._handlers.get(owner)
+        if handler is not None:
+            return handler
+        with self._lock:
+            if owner not in self._handlers:
+                path = self.directory / _file_name(owner, self.worker_id)
+                handler = RotatingFileHandler(
+                    path, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8", delay=True
+                )
+                handler.namer = lambda name: f"{name}.gz"
+                handler.rotator = _compress_rotated
+                handler.setFormatter(self._formatter)
+                self._handlers[owner] = handler
+                self.stats[owner] = HostLogStats(path=str(path))
+        return self._handlers[owner]
+
+    def _route(self, record: logging.LogRecord) -> bool:
+        """Filter of main handler writing record into file of its owner, True if record stays in main log."""
+        if getattr(record, ROUTED_ATTRIBUTE, False):
+            return True  # handled again by queued logging thread
+        setattr(record, ROUTED_ATTRIBUTE, True)
+        owner = self.resolve_owner(record)
+        if owner is None:
+            return True
+        handler = self._handler(owner)
+        self.stats[owner].records += 1
+        if queued_logging.enabled and record.levelno in queued_logging.levels:
+            queued_logging.put(handler, record)
+        else:
+            handler.handle(record)
+        return record.levelno >= self.main_level
+
+    def stop(self) -> None:
+        """Stop routing, close per-owner files and log summary of them into main log."""
+        if not self.enabled:
+            return
+        self._main_handler.removeFilter(self._route)
+        self._main_handler = None
+        queued_logging.flush()
+        for handler in self._handlers.values():
+            handler.close()
+        self._handlers = {}
+        for owner, stats in sorted(self.stats.items()):
+            logger.info(f"Log of {owner}: {stats.records} records in {stats.path}")
+
+
+host_log_router = HostLogRouter()
@@ -0,0 +1,254 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Background keepalive and reconnect of session-scoped connections."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.utils.connection_registry import is_connection_alive
+from pytest_mfd_config.utils.host_facts import invalidate_host_facts
+from pytest_mfd_config.utils.host_logs import log_owner
+from pytest_mfd_config.utils.leak_tracker import weak_reference
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+MAX_WRAPPING_DEPTH = 3
+
+
+@dataclass
+class KeepaliveTarget:
+    """Connection monitored by keepalive."""
+
+    owner: str
+    kind: str
+    reference: Callable[[], Any]
+    reconnect: Callable[[Any], None]
+    dead: bool = False
+    error: Optional[str] = None
+    # held while connection is pinged or reconnected, so they do not run concurrently for the same connection
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def obj(self) -> Any:
+        """Get monitored object, None if it was garbage collected."""
+        return self.reference()
+
+
+@dataclass
+class ReconnectStats:
+    """Reconnects of connections of single owner and kind."""
+
+    reconnects: int = 0
+    failures: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """Average time of successful reconnect in seconds."""
+        return self.total_latency / self.reconnects if self.reconnects else 0.0
+
+
+def _layers(obj: Any) -> Iterator[Any]:
+    """Iterate over object and connections wrapped by it (e.g. Switch -> SSHSwitchConnection -> Netmiko)."""
+    for _ in range(MAX_WRAPPING_DEPTH):
+        if obj is None:
+            return
+        yield obj
+        obj = getattr(obj, "_connection", None)
+
+
+def _send_transport_keepalive(transport: Any) -> None:
+    """Send SSH ignore message via Paramiko transport, it is safe to be sent concurrently with commands."""
+    if transport is None or not transport.is_active():
+        raise ConnectionError("SSH transport is not active")
+    transport.send_ignore()
+
+
+def send_keepalive(obj: Any, timeout: float = 10.0) -> None:
+    """
+    Send keepalive traffic via connection.
+
+    Supports RPyC (ping), Paramiko based (SSH ignore message) and Netmiko based (SSH ignore message of underlying
+    Paramiko client) connections, for other connections nothing is sent.
+
+    :param obj: Connection or switch object
+    :param timeout: Time in seconds for RPyC ping response
+    :raises Exception: if connection is dropped
+    """
+    for layer in _layers(obj):
+        if isinstance(getattr(layer, "closed", None), bool) and callable(getattr(layer, "ping", None)):
+            if layer.closed:
+                raise ConnectionError("RPyC connection is closed")
+            layer.ping(timeout=timeout)
+            return
+        if callable(getattr(layer, "get_transport", None)):
+            _send_transport_keepalive(layer.get_transport())
+            return
+        remote_conn_pre = getattr(layer, "remote_conn_pre", None)
+        if callable(getattr(remote_conn_pre, "get_transport", None)):
+            _send_transport_keepalive(remote_conn_pre.get_transport())
+            return
+
+
+def get_reconnect(obj: Any) -> Optional[Callable[[Any], None]]:
+    """
+    Get function reconnecting object in place.
+
+    :param obj: Connection (mfd-connect) or switch (mfd-switchmanagement) object
+    :return: Function taking object as argument, None if object cannot be reconnected
+    """
+    if callable(getattr(obj, "_reconnect", None)):
+        return lambda target: target._reconnect()
+    if callable(getattr(getattr(obj, "_connection", None), "_reconnect", None)):
+        return lambda target: target._connection._reconnect()
+    return None
+
+
+class KeepaliveMonitor:
+    """
+    Session-wide keepalive of connections.
+
+    Background thread sends keepalive traffic via every registered connection once per interval
+    and marks dropped ones. Dropped connections are reconnected in place before the next test.
+    Each connection is locked only while it is pinged or reconnected, so slow ping of one connection delays
+    only reconnecting of the same connection.
+    """
+
+    def __init__(self, interval: Optional[float] = None, ping_timeout: float = 10.0) -> None:
+        """
+        Init of KeepaliveMonitor.
+
+        :param interval: Time in seconds between keepalives, None disables monitoring
+        :param ping_timeout: Time in seconds for response to keepalive
+        """
+        self.interval = interval
+        self.ping_timeout = ping_timeout
+        self.stats: Dict[Tuple[str, str], ReconnectStats] = {}
+        self._targets: Dict[int, KeepaliveTarget] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether connections are monitored."""
+        return self.interval is not None
+
+    def configure(self, interval: Optional[float]) -> None:
+        """Stop monitoring, forget registered connections and set new interval."""
+        self.stop()
+        with self._lock:
+            self.interval = interval
+            self._targets.clear()
+            self.stats = {}
+
+    def register(self, obj: Any, owner: str, kind: str) -> Any:
+        """
+        Start monitoring of connection.
+
+        Connections which cannot be reconnected in place (e.g. serial, local) are not monitored.
+
+        :param obj: Connection or switch object
+        :param owner: Name of host or switch owning the connection
+        :param kind: Type of connection
+        :return: Passed object
+        """
+        if not self.enabled or obj is None:
+            return obj
+        reconnect = get_reconnect(obj)
+        if reconnect is None:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"{kind} of {owner} cannot be reconnected, not monitored.")
+            return obj
+        with self._lock:
+            target = self._targets.get(id(obj))
+            if target is None or target.obj is not obj:
+                self._targets[id(obj)] = KeepaliveTarget(
+                    owner=str(owner), kind=kind, reference=weak_reference(obj), reconnect=reconnect
+                )
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="keepalive", daemon=True)
+                self._thread.start()
+        return obj
+
+    def unregister(self, obj: Any) -> None:
+        """Stop monitoring of connection, e.g. closed on purpose."""
+        with self._lock:
+            target = self._targets.get(id(obj))
+            if target is not None and target.obj is obj:
+                del self._targets[id(obj)]
+
+    def _live_targets(self) -> List[KeepaliveTarget]:
+        """Get monitored targets, forget garbage collected ones."""
+        with self._lock:
+            self._targets = {key: target for key, target in self._targets.items() if target.obj is not None}
+            return list(self._targets.values())
+
+    def check(self) -> None:
+        """Send keepalive via every monitored connection and mark dropped ones."""
+        for target in self._live_targets():
+            if target.dead or not target.lock.acquire(blocking=False):
+                continue  # dropped or being reconnected
+            try:
+                send_keepalive(target.obj, timeout=self.ping_timeout)
+            except Exception as e:
+                target.dead = True
+                target.error = f"{type(e).__name__}: {e}"
+                logger.warning(f"{target.kind} of {target.owner} is dropped, will reconnect: {target.error}")
+            finally:
+                target.lock.release()
+
+    def reconnect_dead(self) -> None:
+        """Reconnect in place connections marked as dropped or known to be dropped locally."""
+        for target in self._live_targets():
+            obj = target.obj
+            if not target.dead and is_connection_alive(obj):
+                continue
+            with target.lock:
+                self._reconnect(target, obj)
+
+    def _reconnect(self, target: KeepaliveTarget, obj: Any) -> None:
+        """Reconnect connection of target, called with lock of target held."""
+        stats = self.stats.setdefault((target.owner, target.kind), ReconnectStats())
+        start = time.perf_counter()
+        try:
+            with log_owner(target.owner):
+                target.reconnect(obj)
+        except Exception as e:
+            stats.failures += 1
+            logger.warning(f"Reconnect of {target.kind} of {target.owner} failed: {type(e).__name__}: {e}")
+            return
+        latency = time.perf_counter() - start
+        stats.reconnects += 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+        target.dead = False
+        target.error = None
+        invalidate_host_facts(obj)
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Reconnected {target.kind} of {target.owner} in {latency:.2f}s.",
+        )
+
+    def _run(self) -> None:
+        """Send keepalives once per interval until stopped."""
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stop(self) -> None:
+        """Stop background thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(self.ping_timeout)
+
+
+keepalive_monitor = KeepaliveMonitor()
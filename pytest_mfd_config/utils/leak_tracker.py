@@ -0,0 +1,153 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tracker of connections and other objects created by plugin factories, for finding leaked ones."""
+
+import gc
+import logging
+import threading
+import time
+import traceback
+import weakref
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.utils.connection_registry import is_connection_alive
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+
+@dataclass
+class TrackedObject:
+    """Object created by plugin factory with place of its creation."""
+
+    owner: str
+    kind: str
+    description: str
+    stack: str
+    created: float
+    reference: Callable[[], Any]
+    closed: bool = False
+
+    @property
+    def obj(self) -> Any:
+        """Get tracked object, None if it was garbage collected."""
+        return self.reference()
+
+
+def weak_reference(obj: Any) -> Callable[[], Any]:
+    """Get weak reference of object, so tracking does not keep it alive, or strong one if not supported."""
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return lambda: obj
+
+
+class LeakTracker:
+    """
+    Session-wide tracker of objects created by plugin factories.
+
+    Object is considered open as long as it is referenced, it was not closed by plugin teardown
+    and its connection is not known to be dropped.
+    """
+
+    def __init__(self, enabled: bool = False, stack_limit: int = 20) -> None:
+        """
+        Init of LeakTracker.
+
+        :param enabled: Whether created objects should be tracked
+        :param stack_limit: Maximum number of frames of creation stack stored per object
+        """
+        self.enabled = enabled
+        self.stack_limit = stack_limit
+        self._tracked: Dict[int, TrackedObject] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, enabled: bool) -> None:
+        """Enable or disable tracking, forget all tracked objects."""
+        with self._lock:
+            self.enabled = enabled
+            self._tracked.clear()
+
+    def track(self, obj: Any, owner: str, kind: str) -> Any:
+        """
+        Register object created by factory together with its creation stack.
+
+        Object already tracked (e.g. reused connection) is registered once.
+
+        :param obj: Created object
+        :param owner: Name of host or switch owning the object
+        :param kind: Type of object, e.g. connection type
+        :return: Passed object
+        """
+        if not self.enabled or obj is None:
+            return obj
+        with self._lock:
+            entry = self._tracked.get(id(obj))
+            if entry is not None and entry.obj is obj:
+                return obj
+            self._tracked[id(obj)] = TrackedObject(
+                owner=str(owner),
+                kind=kind,
+                description=str(obj),
+                stack="".join(traceback.format_stack(limit=self.stack_limit)[:-1]),
+                created=time.time(),
+                reference=weak_reference(obj),
+            )
+        return obj
+
+    def mark_closed(self, obj: Any) -> None:
+        """Mark tracked object as closed."""
+        with self._lock:
+            entry = self._tracked.get(id(obj))
+            if entry is not None and entry.obj is obj:
+                entry.closed = True
+
+    def _is_open(self, entry: TrackedObject) -> bool:
+        """Check if tracked object is still open, objects wrapping tracked connection follow its state."""
+        obj = entry.obj
+        if obj is None or entry.closed:
+            return False
+        inner = self._tracked.get(id(getattr(obj, "_connection", None)))
+        if inner is not None and inner.obj is getattr(obj, "_connection", None):
+            return inner is not entry and self._is_open(inner)
+        return is_connection_alive(obj)
+
+    def open_objects(self, collect: bool = False) -> List[TrackedObject]:
+        """
+        Get tracked objects which are still open, forget the rest.
+
+        :param collect: Run garbage collector before checking, so unreachable objects are not reported
+        :return: List of open objects, in order of creation
+        """
+        if collect:
+            gc.collect()
+        with self._lock:
+            open_entries = {key: entry for key, entry in self._tracked.items() if self._is_open(entry)}
+            self._tracked = open_entries
+            return sorted(open_entries.values(), key=lambda entry: entry.created)
+
+    def open_counts(self) -> Dict[Tuple[str, str], int]:
+        """Get number of open objects per owner and kind."""
+        return dict(Counter((entry.owner, entry.kind) for entry in self.open_objects()))
+
+
+leak_tracker = LeakTracker()
+
+
+def format_open_counts(counts: Dict[Tuple[str, str], int]) -> str:
+    """
+    Prepare single line summary of open objects.
+
+    :param counts: Number of open objects per owner and kind
+    :return: Summary, e.g. "sut: RPyCConnection=2, SSHConnection=1; switch-1: switch Cisco_NXOS=1"
+    """
+    if not counts:
+        return "none"
+    per_owner: Dict[str, List[str]] = {}
+    for (owner, kind), count in sorted(counts.items()):
+        per_owner.setdefault(owner, []).append(f"{kind}={count}")
+    return "; ".join(f"{owner}: {', '.join(kinds)}" for owner, kinds in per_owner.items())
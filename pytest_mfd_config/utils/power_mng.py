@@ -0,0 +1,137 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Helpers for creating power management objects."""
+
+import inspect
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Type, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_powermanagement.base import PowerManagement
+    from pytest_mfd_config.models.topology import PowerMngModel
+
+KEYWORD_PARAMETER_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+@lru_cache(maxsize=None)
+def get_init_parameters(power_mng_class: type) -> FrozenSet[str]:
+    """
+    Get names of parameters of class constructor which can be passed as keyword arguments.
+
+    Decorated constructors are unwrapped by inspect.signature (via __wrapped__). Result is cached per class.
+
+    :param power_mng_class: PowerManagement subclass
+    :return: Names of parameters
+    """
+    parameters = list(inspect.signature(power_mng_class.__init__).parameters.values())[1:]  # skip self
+    return frozenset(parameter.name for parameter in parameters if parameter.kind in KEYWORD_PARAMETER_KINDS)
+
+
+@lru_cache(maxsize=None)
+def get_required_init_parameters(power_mng_class: type) -> FrozenSet[str]:
+    """
+    Get names of keyword parameters of class constructor without default value.
+
+    :param power_mng_class: PowerManagement subclass
+    :return: Names of parameters
+    """
+    parameters = list(inspect.signature(power_mng_class.__init__).parameters.values())[1:]  # skip self
+    return frozenset(
+        parameter.name
+        for parameter in parameters
+        if parameter.kind in KEYWORD_PARAMETER_KINDS and parameter.default is inspect.Parameter.empty
+    )
+
+
+def get_missing_init_parameters(power_mng_class: type, names: Iterable[str]) -> FrozenSet[str]:
+    """
+    Get required constructor parameters which are not in passed names.
+
+    :param power_mng_class: PowerManagement subclass
+    :param names: Names of parameters which will be passed
+    :return: Names of missing parameters
+    """
+    return get_required_init_parameters(power_mng_class) - set(names)
+
+
+def build_power_mng_kwargs(
+    power_mng_class: Type["PowerManagement"], power_mng_model: "PowerMngModel"
+) -> Dict[str, Any]:
+    """
+    Build constructor kwargs from fields of model which are accepted by constructor.
+
+    Connection is not included, it has to be created from ConnectionModel separately.
+
+    :param power_mng_class: PowerManagement subclass
+    :param power_mng_model: PowerMngModel object
+    :return: Dictionary with kwargs, fields not set in model are skipped
+    """
+    parameters = get_init_parameters(power_mng_class)
+    kwargs = {}
+    for name in type(power_mng_model).model_fields:
+        if name in parameters and name != "connection":
+            value = getattr(power_mng_model, name)
+            if value is not None:
+                kwargs[name] = value
+    return kwargs
+
+
+class LazyPowerManagement:
+    """
+    Proxy of power management object, created together with its connection on first use.
+
+    Proxy pretends to be an instance of the power management class, so isinstance checks keep working.
+    """
+
+    def __init__(self, power_mng_class: Type["PowerManagement"], factory: Callable[[], "PowerManagement"]) -> None:
+        """
+        Init of LazyPowerManagement.
+
+        :param power_mng_class: PowerManagement subclass which will be created
+        :param factory: Function creating power management object
+        """
+        self._power_mng_class = power_mng_class
+        self._factory = factory
+        self._power_mng: Optional["PowerManagement"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def __class__(self) -> type:
+        return self._power_mng_class
+
+    @property
+    def created(self) -> bool:
+        """Whether underlying power management object was already created."""
+        return self._power_mng is not None
+
+    @property
+    def _connection(self) -> Optional["Connection"]:
+        """Connection of underlying object, None if it was not created yet."""
+        return getattr(self._power_mng, "_connection", None)
+
+    def _get(self) -> "PowerManagement":
+        """Get underlying power management object, create it on first call."""
+        with self._lock:
+            if self._power_mng is None:
+                logger.log(
+                    level=log_levels.MODULE_DEBUG, msg=f"Creating {self._power_mng_class.__name__} on first use."
+                )
+                self._power_mng = self._factory()
+            return self._power_mng
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name in ("_power_mng_class", "_factory", "_power_mng", "_lock"):
+            raise AttributeError(name)
+        return getattr(self._get(), name)
+
+    def __repr__(self) -> str:
+        state = "created" if self.created else "not created"
+        return f"<LazyPowerManagement of {self._power_mng_class.__name__} ({state})>"
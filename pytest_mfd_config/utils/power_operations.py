@@ -0,0 +1,297 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Concurrent power operations on many hosts."""
+
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.exceptions import PyTestMFDConfigException
+from pytest_mfd_config.utils.deadlines import run_concurrently
+from pytest_mfd_config.utils.host_logs import log_owner
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_host import Host
+    from mfd_powermanagement.base import PowerManagement
+    from pytest_mfd_config.models.topology import PowerMngModel
+
+POWER_ACTIONS = {
+    "on": ("power_on", "power_up"),
+    "off": ("power_off", "power_down"),
+    "cycle": ("power_cycle", "powercycle"),
+}
+ACTIONS_WITH_BOOT = ("on", "cycle")
+# time in seconds between power off and power on, for power managements which require it (e.g. DLI)
+DEFAULT_CYCLE_DELAY = 10
+
+
+@dataclass
+class PowerActionResult:
+    """Result of power action on single host."""
+
+    host: str
+    action: str
+    error: Optional[str] = None
+    wait_error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether action succeeded and host came back, if waiting was requested."""
+        return self.error is None and self.wait_error is None
+
+
+def get_power_method(power_mng_class: type, action: str) -> Optional[str]:
+    """
+    Get name of method of power management class performing action.
+
+    :param power_mng_class: PowerManagement subclass
+    :param action: One of 'on', 'off', 'cycle'
+    :return: Name of method, None if action is not supported
+    """
+    for method in POWER_ACTIONS[action]:
+        if callable(getattr(power_mng_class, method, None)):
+            return method
+    return None
+
+
+def build_power_action_kwargs(
+    power_mng_class: type,
+    method: str,
+    power_mng_model: Optional["PowerMngModel"],
+    time_delay: int = DEFAULT_CYCLE_DELAY,
+) -> Dict[str, Any]:
+    """
+    Build kwargs of power method from fields of model accepted by the method (e.g. outlet_number).
+
+    :param power_mng_class: PowerManagement subclass
+    :param method: Name of power method
+    :param power_mng_model: PowerMngModel of host
+    :param time_delay: Value of 'time_delay' parameter, for methods which accept it
+    :return: Dictionary with kwargs, fields not set in model are skipped
+    :raises PyTestMFDConfigException: if parameter required by the method is not set in model
+    """
+    parameters = list(inspect.signature(getattr(power_mng_class, method)).parameters.values())[1:]  # skip self
+    kwargs = {}
+    missing = []
+    for parameter in parameters:
+        if parameter.kind not in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+            continue
+        if parameter.name == "time_delay":
+            value = time_delay
+        else:
+            value = getattr(power_mng_model, parameter.name, None)
+        if value is not None:
+            kwargs[parameter.name] = value
+        elif parameter.default is inspect.Parameter.empty:
+            missing.append(parameter.name)
+    if missing:
+        raise PyTestMFDConfigException(
+            f"{power_mng_class.__name__}.{method} requires parameters not set in power_mng of host: "
+            + ", ".join(missing)
+        )
+    return kwargs
+
+
+def call_power_action(
+    power_mng: "PowerManagement",
+    action: str,
+    power_mng_model: Optional["PowerMngModel"] = None,
+    time_delay: int = DEFAULT_CYCLE_DELAY,
+) -> Any:
+    """
+    Call method of power management object performing action.
+
+    :param power_mng: PowerManagement object or its lazy proxy
+    :param action: One of 'on', 'off', 'cycle'
+    :param power_mng_model: PowerMngModel of host, source of method parameters (e.g. outlet_number)
+    :param time_delay: Time in seconds between power off and power on, for methods which accept it
+    :return: Value returned by power management
+    :raises NotImplementedError: if power management does not support action
+    :raises PyTestMFDConfigException: if parameter required by power method is not set in model
+    """
+    power_mng_class = power_mng.__class__  # class of proxied object for lazy power management
+    method = get_power_method(power_mng_class, action)
+    if method is None:
+        raise NotImplementedError(f"Power action '{action}' is not supported by {power_mng_class.__name__}.")
+    kwargs = build_power_action_kwargs(power_mng_class, method, power_mng_model, time_delay=time_delay)
+    return getattr(power_mng, method)(**kwargs)
+
+
+def power_group_key(host: "Host") -> Hashable:
+    """
+    Get key grouping hosts which have to be powered one by one.
+
+    Hosts powered by the same multi-outlet device (power methods accept 'outlet_number', e.g. PDU, DLI)
+    are in one group, every other host is in its own group.
+
+    :param host: Host object
+    :return: Key of group
+    """
+    power_mng_model = getattr(host.topology, "power_mng", None)
+    method = get_power_method(host.power_mng.__class__, "on") or get_power_method(host.power_mng.__class__, "off")
+    if method is not None and power_mng_model is not None:
+        parameters = inspect.signature(getattr(host.power_mng.__class__, method)).parameters
+        address = power_mng_model.ip or power_mng_model.host
+        if "outlet_number" in parameters and address is not None:
+            return "outlets", power_mng_model.power_mng_type, str(address)
+    return "host", host.name
+
+
+def get_host_connections(host: "Host") -> List["Connection"]:
+    """Get distinct connections of host: main one and all from Connections dataclass (also pooled ones)."""
+    connections = [host.connection]
+    if host.connections is not None:
+        connections.extend(host.connections.all())
+    distinct = []
+    for connection in connections:
+        if connection is not None and all(connection is not known for known in distinct):
+            distinct.append(connection)
+    return distinct
+
+
+def _wait_for_connections(host: "Host", timeout: int) -> None:
+    """Wait until every connection of host is re-established."""
+    with log_owner(host.name):
+        for connection in get_host_connections(host):
+            if callable(getattr(connection, "wait_for_host", None)):
+                connection.wait_for_host(timeout=timeout)
+
+
+def _format_error(error: BaseException) -> str:
+    """Format error as type and message."""
+    return f"{type(error).__name__}: {error}"
+
+
+def run_power_action(
+    hosts: Iterable["Host"],
+    action: str,
+    wait_for_connections: bool = True,
+    wait_timeout: int = 600,
+    deadline: Optional[float] = None,
+    time_delay: int = DEFAULT_CYCLE_DELAY,
+) -> Dict[str, PowerActionResult]:
+    """
+    Power off, power on or power cycle hosts concurrently.
+
+    Parameters of power methods (e.g. outlet_number) are taken from power_mng of host topology.
+    Hosts sharing multi-outlet device (PDU, DLI) are powered one by one, groups are powered concurrently.
+    After 'on' and 'cycle' connections of all hosts are awaited concurrently.
+
+    :param hosts: Host objects
+    :param action: One of 'on', 'off', 'cycle'
+    :param wait_for_connections: Wait for connections of hosts after 'on' and 'cycle'
+    :param wait_timeout: Time in seconds for connections of single host to come back
+    :param deadline: Time in seconds for each stage (power action, waiting for connections)
+    :param time_delay: Time in seconds between power off and power on of 'cycle', for power managements requiring it
+    :return: Dictionary with host name as key and result as value
+    """
+    if action not in POWER_ACTIONS:
+        raise ValueError(f"Unknown power action '{action}', choose one from {list(POWER_ACTIONS)}")
+    hosts = list(hosts)
+    results = {host.name: PowerActionResult(host=host.name, action=action) for host in hosts}
+    groups: Dict[Hashable, List["Host"]] = {}
+    for host in hosts:
+        if host.power_mng is None:
+            results[host.name].error = "Host has no power management"
+            continue
+        groups.setdefault(power_group_key(host), []).append(host)
+
+    def _power_group(group: List["Host"]) -> None:
+        for host in group:
+            try:
+                with log_owner(host.name):
+                    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Power {action} of {host.name}.")
+                    call_power_action(
+                        host.power_mng, action, getattr(host.topology, "power_mng", None), time_delay=time_delay
+                    )
+            except Exception as e:
+                results[host.name].error = _format_error(e)
+
+    outcomes = run_concurrently(
+        {key: lambda group=group: _power_group(group) for key, group in groups.items()},
+        deadline=deadline,
+        name="power",
+    )
+    for key, outcome in outcomes.items():
+        if outcome.error is not None:
+            for host in groups[key]:
+                results[host.name].error = results[host.name].error or _format_error(outcome.error)
+
+    if wait_for_connections and action in ACTIONS_WITH_BOOT:
+        to_wait = {host.name: host for host in hosts if results[host.name].error is None}
+        outcomes = run_concurrently(
+            {name: lambda host=host: _wait_for_connections(host, wait_timeout) for name, host in to_wait.items()},
+            deadline=deadline,
+            name="wait for host",
+        )
+        for name, outcome in outcomes.items():
+            if outcome.error is not None:
+                results[name].wait_error = _format_error(outcome.error)
+
+    for result in results.values():
+        if not result.ok:
+            logger.warning(f"Power {action} of {result.host} failed: {result.error or result.wait_error}")
+    return results
+
+
+class BulkPower:
+    """Power operations on hosts from hosts fixture, selected by name."""
+
+    def __init__(self, hosts: Dict[str, "Host"], wait_timeout: int = 600) -> None:
+        """
+        Init of BulkPower.
+
+        :param hosts: Dictionary with host name as key and Host object as value
+        :param wait_timeout: Time in seconds for connections of single host to come back
+        """
+        self._hosts = hosts
+        self.wait_timeout = wait_timeout
+
+    def _run(
+        self, action: str, names: Optional[Iterable[str]], wait_for_connections: bool, **kwargs
+    ) -> Dict[str, PowerActionResult]:
+        """Run action on selected hosts, raise if it failed for any of them."""
+        selected = [self._hosts[name] for name in names] if names is not None else list(self._hosts.values())
+        results = run_power_action(
+            selected, action, wait_for_connections=wait_for_connections, wait_timeout=self.wait_timeout, **kwargs
+        )
+        failed = [result for result in results.values() if not result.ok]
+        if failed:
+            raise PyTestMFDConfigException(
+                f"Power {action} failed for hosts: "
+                + ", ".join(f"{result.host} ({result.error or result.wait_error})" for result in failed)
+            )
+        return results
+
+    def off(self, names: Optional[Iterable[str]] = None) -> Dict[str, PowerActionResult]:
+        """Power off hosts, all hosts if names are not passed."""
+        return self._run("off", names, wait_for_connections=False)
+
+    def on(
+        self, names: Optional[Iterable[str]] = None, wait_for_connections: bool = True
+    ) -> Dict[str, PowerActionResult]:
+        """Power on hosts, all hosts if names are not passed, and wait for their connections."""
+        return self._run("on", names, wait_for_connections)
+
+    def cycle(
+        self,
+        names: Optional[Iterable[str]] = None,
+        wait_for_connections: bool = True,
+        time_delay: int = DEFAULT_CYCLE_DELAY,
+    ) -> Dict[str, PowerActionResult]:
+        """
+        Power cycle hosts, all hosts if names are not passed, and wait for their connections.
+
+        :param names: Names of hosts
+        :param wait_for_connections: Wait for connections of hosts
+        :param time_delay: Time in seconds between power off and power on, for power managements requiring it (DLI)
+        :return: Dictionary with host name as key and result as value
+        """
+        return self._run("cycle", names, wait_for_connections, time_delay=time_delay)
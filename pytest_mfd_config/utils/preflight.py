@@ -0,0 +1,219 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Preflight reachability probe of topology endpoints."""
+
+import logging
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, TYPE_CHECKING
+from urllib.parse import urlparse
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from pytest_mfd_config.models.topology import ConnectionModel, PowerMngModel, TopologyModel
+
+CONNECTION_TCP_PORTS = {
+    "RPyCConnection": 18816,
+    "RPyCZeroDeployConnection": 22,
+    "SSHConnection": 22,
+    "SSHConfigConnection": 22,
+    "InteractiveSSHConnection": 22,
+    "PxsshConnection": 22,
+    "TelnetConnection": 23,
+    "WinRmConnection": 5985,
+}
+JUMP_HOST_TCP_PORTS = {"TunneledRPyCConnection": 18816, "TunneledSSHConnection": 22}
+SWITCH_TCP_PORTS = {"SSHSwitchConnection": 22, "CiscoAPIConnection": 443}
+POWER_MNG_TCP_PORTS = {"DLI": 80, "CCSG": 443}
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """Single network endpoint read from topology."""
+
+    owner: str
+    kind: str
+    address: Optional[str]
+    port: Optional[int]
+    required: bool = True
+
+    def __str__(self):
+        return f"{self.address}:{self.port}" if self.port else f"{self.address}"
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Result of reachability probe of single endpoint."""
+
+    endpoint: Endpoint
+    reachable: Optional[bool]
+    latency: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        """Human-readable status of probe."""
+        if self.reachable is None:
+            return "NOT PROBED"
+        return "OK" if self.reachable else "UNREACHABLE"
+
+
+def _connection_endpoints(owner: str, connection: "ConnectionModel", required: bool) -> List[Endpoint]:
+    """
+    Get endpoints of single connection model.
+
+    Tunneled connections are probed via their jump host, since target host is usually not reachable directly.
+    Connections without TCP transport (e.g. serial, SOL, local) are reported as not probed.
+
+    :param owner: Name of host owning the connection
+    :param connection: ConnectionModel object
+    :param required: Whether owner of connection is going to be instantiated
+    :return: List of endpoints
+    """
+    options = connection.connection_options or {}
+    kind = f"{connection.connection_type}(id={connection.connection_id})"
+    endpoints = []
+    if connection.osd_details is not None:
+        parsed_url = urlparse(connection.osd_details.base_url)
+        default_port = 80 if parsed_url.scheme == "http" else 443
+        endpoints.append(
+            Endpoint(
+                owner=owner,
+                kind="osd",
+                address=parsed_url.hostname or connection.osd_details.base_url,
+                port=parsed_url.port or default_port,
+                required=required,
+            )
+        )
+    if connection.connection_type in JUMP_HOST_TCP_PORTS and options.get("jump_host_ip"):
+        port = options.get("jump_host_port") or JUMP_HOST_TCP_PORTS[connection.connection_type]
+        endpoints.append(Endpoint(owner, kind, str(options["jump_host_ip"]), int(port), required))
+    elif connection.ip_address is not None:
+        port = CONNECTION_TCP_PORTS.get(connection.connection_type)
+        if port is not None and options.get("port"):
+            port = int(options["port"])
+        endpoints.append(Endpoint(owner, kind, str(connection.ip_address), port, required))
+    return endpoints
+
+
+def _power_mng_endpoints(owner: str, power_mng: "PowerMngModel", required: bool) -> List[Endpoint]:
+    """
+    Get endpoints of power management model.
+
+    :param owner: Name of host owning the power management
+    :param power_mng: PowerMngModel object
+    :param required: Whether owner of power management is going to be instantiated
+    :return: List of endpoints
+    """
+    endpoints = []
+    address = power_mng.ip or power_mng.host
+    if address:
+        kind = f"power_mng({power_mng.power_mng_type})"
+        endpoints.append(Endpoint(owner, kind, address, POWER_MNG_TCP_PORTS.get(power_mng.power_mng_type), required))
+    if power_mng.connection is not None:
+        endpoints.extend(_connection_endpoints(f"{owner}.power_mng", power_mng.connection, required))
+    return endpoints
+
+
+def collect_endpoints(topology: "TopologyModel") -> List[Endpoint]:
+    """
+    Walk topology and gather every network endpoint used by the plugin.
+
+    Endpoints of hosts and switches with 'instantiate' flag set to True are marked as required.
+
+    :param topology: Topology model object
+    :return: List of endpoints
+    """
+    endpoints = []
+    for host_model in topology.hosts or []:
+        for connection in host_model.connections or []:
+            endpoints.extend(_connection_endpoints(host_model.name, connection, host_model.instantiate))
+        if host_model.power_mng is not None:
+            endpoints.extend(_power_mng_endpoints(host_model.name, host_model.power_mng, host_model.instantiate))
+    for switch_model in topology.switches or []:
+        if switch_model.mng_ip_address is not None:
+            endpoints.append(
+                Endpoint(
+                    owner=switch_model.name,
+                    kind=f"switch({switch_model.connection_type})",
+                    address=str(switch_model.mng_ip_address),
+                    port=SWITCH_TCP_PORTS.get(switch_model.connection_type),
+                    required=switch_model.instantiate,
+                )
+            )
+        if switch_model.power_mng is not None:
+            endpoints.extend(_power_mng_endpoints(switch_model.name, switch_model.power_mng, switch_model.instantiate))
+    return endpoints
+
+
+def probe_endpoint(endpoint: Endpoint, timeout: float) -> ProbeResult:
+    """
+    Check if TCP connection to endpoint can be opened.
+
+    :param endpoint: Endpoint to be probed
+    :param timeout: Time in seconds for opening connection
+    :return: Result of probe, endpoints without known TCP port are not probed
+    """
+    if endpoint.port is None:
+        return ProbeResult(endpoint=endpoint, reachable=None)
+    start = time.perf_counter()
+    try:
+        with socket.create_connection((endpoint.address, endpoint.port), timeout=timeout):
+            pass
+    except OSError as e:
+        return ProbeResult(endpoint=endpoint, reachable=False, error=str(e) or type(e).__name__)
+    return ProbeResult(endpoint=endpoint, reachable=True, latency=time.perf_counter() - start)
+
+
+def probe_endpoints(endpoints: List[Endpoint], timeout: float, max_workers: int = 32) -> List[ProbeResult]:
+    """
+    Probe all endpoints concurrently.
+
+    Every probe is bounded by timeout, so whole probe takes roughly timeout seconds regardless of endpoints count.
+
+    :param endpoints: Endpoints to be probed
+    :param timeout: Time in seconds for opening single connection
+    :param max_workers: Maximum number of concurrent probes
+    :return: List of results, in the same order as endpoints
+    """
+    if not endpoints:
+        return []
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Probing {len(endpoints)} topology endpoints.")
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(endpoints)), thread_name_prefix="preflight") as executor:
+        return list(executor.map(lambda endpoint: probe_endpoint(endpoint, timeout), endpoints))
+
+
+def get_unreachable_required(results: List[ProbeResult]) -> List[ProbeResult]:
+    """Get results of required endpoints which could not be reached."""
+    return [result for result in results if result.endpoint.required and result.reachable is False]
+
+
+def format_probe_table(results: List[ProbeResult]) -> str:
+    """
+    Prepare reachability and latency table.
+
+    :param results: Results of probes
+    :return: Table as a string
+    """
+    header = ("OWNER", "ENDPOINT", "ADDRESS", "REQUIRED", "STATUS", "LATENCY")
+    rows = [
+        (
+            str(result.endpoint.owner),
+            result.endpoint.kind,
+            str(result.endpoint),
+            "yes" if result.endpoint.required else "no",
+            result.status,
+            f"{result.latency * 1000:.1f} ms" if result.latency is not None else (result.error or "-"),
+        )
+        for result in results
+    ]
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in [header, *rows]
+    )
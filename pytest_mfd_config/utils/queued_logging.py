@@ -0,0 +1,172 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Emitting of chatty log records (MODULE_DEBUG, CMD, OUT) from background thread."""
+
+import copy
+import logging
+import queue
+import threading
+from typing import FrozenSet, List, Optional, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+QUEUED_LEVELS = frozenset({log_levels.MODULE_DEBUG, log_levels.CMD, log_levels.OUT})
+DROP_POLICIES = ("new", "old", "block")
+
+_STOP = None
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+def _prepare(record: logging.LogRecord) -> logging.LogRecord:
+    """
+    Copy of record safe for emitting later by another thread, like in logging.handlers.QueueHandler.prepare.
+
+    Message is merged with its arguments and exception is rendered into text in the caller, so objects passed
+    to logging call and traceback with its frames are not referenced by queued record.
+
+    :param record: Log record
+    :return: Prepared copy of record
+    """
+    message = record.getMessage()
+    exc_text = record.exc_text
+    if record.exc_info and not exc_text:
+        exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+    record = copy.copy(record)
+    record.msg = message
+    record.args = None
+    record.exc_info = None
+    record.exc_text = exc_text
+    return record
+
+
+class _DivertFilter(logging.Filter):
+    """Filter of handler moving records at queued levels into queue, instead of emitting them immediately."""
+
+    def __init__(self, owner: "QueuedLogging", handler: logging.Handler) -> None:
+        super().__init__()
+        self._owner = owner
+        self._handler = handler
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa A003
+        if record.levelno not in self._owner.levels or threading.current_thread() is self._owner.thread:
+            return True
+        self._owner.put(self._handler, record)
+        return False
+
+
+class QueuedLogging:
+    """
+    Emitting of records at chatty levels through bounded queue, by background thread.
+
+    Records at other levels are emitted by handlers immediately, so order of records in output may differ
+    from order of logging, timestamps of records are kept. Queued records are prepared in the caller: message
+    is merged with its arguments and exception is rendered, so formatting in handler does not see later changes
+    of logged objects. Only given handlers are diverted, other handlers (e.g. pytest's LogCaptureHandler
+    collecting report sections and caplog) still format every record in the caller.
+    When queue is full, policy decides: 'new' drops the incoming record, 'old' drops the oldest queued record
+    and 'block' waits for free place.
+    """
+
+    def __init__(self, levels: FrozenSet[int] = QUEUED_LEVELS) -> None:
+        """
+        Init of QueuedLogging.
+
+        :param levels: Levels of records emitted by background thread
+        """
+        self.levels = levels
+        self.policy = "new"
+        self.dropped = 0
+        self.thread: Optional[threading.Thread] = None
+        self._queue: Optional[queue.Queue] = None
+        self._filters: List[Tuple[logging.Handler, _DivertFilter]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether records are queued."""
+        return self.thread is not None
+
+    def configure(self, handlers: List[logging.Handler], queue_size: int = 10000, policy: str = "new") -> None:
+        """
+        Start emitting records at queued levels of handlers by background thread.
+
+        :param handlers: Handlers which will emit queued records
+        :param queue_size: Maximal number of records waiting in queue
+        :param policy: What to do when queue is full, one of 'new', 'old', 'block'
+        :raises ValueError: if policy is unknown
+        """
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy '{policy}', choose one from {list(DROP_POLICIES)}")
+        self.stop()
+        self.policy = policy
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self._run, name="queued logging", daemon=True)
+        self.thread.start()
+        for handler in handlers:
+            divert_filter = _DivertFilter(self, handler)
+            handler.addFilter(divert_filter)
+            self._filters.append((handler, divert_filter))
+
+    def put(self, handler: logging.Handler, record: logging.LogRecord) -> None:
+        """
+        Queue prepared copy of record for emitting by handler, applying drop policy if queue is full.
+
+        :param handler: Handler which will emit the record
+        :param record: Log record
+        """
+        record = _prepare(record)
+        if self.policy == "block":
+            self._queue.put((handler, record))
+            return
+        try:
+            self._queue.put_nowait((handler, record))
+            return
+        except queue.Full:
+            pass
+        with self._lock:
+            self.dropped += 1
+            if self.policy == "old":
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self._queue.put_nowait((handler, record))
+                except (queue.Empty, queue.Full):
+                    pass
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                handler, record = item
+                handler.handle(record)
+            except Exception:
+                pass  # handler reports its own errors via handleError, nothing more can be done here
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until all queued records are emitted."""
+        if self.enabled:
+            self._queue.join()
+
+    def stop(self) -> None:
+        """Emit queued records, remove filters from handlers and stop background thread."""
+        if not self.enabled:
+            return
+        for handler, divert_filter in self._filters:
+            handler.removeFilter(divert_filter)
+        self._filters = []
+        self._queue.put(_STOP)
+        self.thread.join()
+        self.thread = self._queue = None
+        if self.dropped:
+            logger.warning(f"{self.dropped} log records were dropped, because logging queue was full.")
+
+
+queued_logging = QueuedLogging()
@@ -0,0 +1,237 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Re-establishing connections of many hosts, e.g. after reboot or driver reload."""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.exceptions import PyTestMFDConfigException
+from pytest_mfd_config.utils.config_utils import Connections
+from pytest_mfd_config.utils.deadlines import run_concurrently
+from pytest_mfd_config.utils.host_logs import log_owner
+from pytest_mfd_config.utils.teardown import close_resources, host_resources
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from mfd_connect import AsyncConnection
+    from mfd_host import Host
+    from pytest_mfd_config.models.topology import HostModel
+
+ConnectionsFactory = Callable[["HostModel"], List["AsyncConnection"]]
+
+# features of Host created lazily with Host.connection, they have to be recreated with new connection
+HOST_FEATURE_CACHES = (
+    "_network",
+    "_driver",
+    "_event",
+    "_virtualization",
+    "_utils",
+    "_memory",
+    "_stats",
+    "_cpu",
+    "_service",
+    "_device",
+)
+
+
+@dataclass
+class ReconnectResult:
+    """Result of re-establishing connections of single host."""
+
+    host: str
+    error: Optional[str] = None
+    attempts: int = 0
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether connections were re-established."""
+        return self.error is None
+
+
+def poll_with_backoff(
+    func: Callable[[], Any],
+    timeout: float,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    factor: float = 2.0,
+    description: str = "",
+) -> Tuple[Any, int]:
+    """
+    Call function until it succeeds, sleeping exponentially longer between attempts.
+
+    :param func: Function to call, failure is signalled by raising exception
+    :param timeout: Time in seconds after which polling is stopped
+    :param initial_delay: Sleep in seconds after first failed attempt
+    :param max_delay: Maximal sleep in seconds between attempts
+    :param factor: Multiplier of sleep after every failed attempt
+    :param description: Description of polled action used in logs and errors
+    :return: Tuple with value returned by function and number of attempts
+    :raises TimeoutError: if function did not succeed within timeout
+    """
+    end = time.monotonic() + timeout
+    delay = initial_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return func(), attempt
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"{description} did not succeed after {attempt} attempts in {timeout} seconds, last error: {error}"
+                ) from e
+            logger.log(
+                level=log_levels.MODULE_DEBUG,
+                msg=f"{description} attempt {attempt} failed ({error}), retrying in {min(delay, remaining):.1f}s.",
+            )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * factor, max_delay)
+
+
+def swap_host_connections(host: "Host", connections: List["AsyncConnection"]) -> None:
+    """
+    Put new connections into existing Host and its Connections object.
+
+    Features of host created with previous connection are dropped and will be created again on first use,
+    cached facts of host are invalidated.
+
+    :param host: Host object
+    :param connections: New connections of host, first one becomes main connection
+    """
+    if host.connections is None:
+        host.connections = Connections(_connections=connections)
+    else:
+        host.connections.replace(connections)
+    host.connection = connections[0]
+    for name in HOST_FEATURE_CACHES:
+        if hasattr(host, name):
+            setattr(host, name, None)
+    if getattr(host, "facts", None) is not None:
+        host.facts.invalidate()
+
+
+def reconnect_host(
+    host: "Host",
+    create_connections: ConnectionsFactory,
+    timeout: float = 600,
+    close_timeout: Optional[float] = 30,
+    refresh_interfaces: bool = True,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> int:
+    """
+    Drop connections of host, wait until new ones can be established and swap them into host.
+
+    Connection of power management is kept. Network interfaces are created again with new connection.
+    Function creating connections is called on every attempt, so when it fails it has to close connections it already
+    established (create_host_connections_from_model does), otherwise every attempt leaks them.
+
+    :param host: Host object created from topology
+    :param create_connections: Function creating all connections of host from HostModel
+    :param timeout: Time in seconds for host to accept connections again
+    :param close_timeout: Time in seconds for closing previous connections
+    :param refresh_interfaces: Refresh network interfaces of host if they are defined in topology
+    :param initial_delay: Sleep in seconds after first failed attempt of connecting
+    :param max_delay: Maximal sleep in seconds between attempts of connecting
+    :return: Number of attempts of connecting
+    """
+    previous = [resource for resource in host_resources(host) if not resource.description.startswith("power_mng")]
+    for failure in close_resources(previous, close_timeout):
+        logger.log(
+            level=log_levels.MODULE_DEBUG, msg=f"Ignoring failure of closing {failure.description}: {failure.error}"
+        )
+    connections, attempts = poll_with_backoff(
+        lambda: create_connections(host.topology),
+        timeout=timeout,
+        initial_delay=initial_delay,
+        max_delay=max_delay,
+        description=f"Connecting to {host.name}",
+    )
+    swap_host_connections(host, connections)
+    if refresh_interfaces and host.topology.network_interfaces:
+        host.network_interfaces.clear()
+        host.refresh_network_interfaces()
+    return attempts
+
+
+def reconnect_hosts(
+    hosts: Iterable["Host"],
+    create_connections: ConnectionsFactory,
+    timeout: float = 600,
+    deadline: Optional[float] = None,
+    **kwargs,
+) -> Dict[str, ReconnectResult]:
+    """
+    Re-establish connections of hosts concurrently.
+
+    :param hosts: Host objects created from topology
+    :param create_connections: Function creating all connections of host from HostModel
+    :param timeout: Time in seconds for single host to accept connections again
+    :param deadline: Time in seconds for reconnecting all hosts
+    :param kwargs: Other parameters of reconnect_host
+    :return: Dictionary with host name as key and result as value
+    """
+    hosts = {host.name: host for host in hosts}
+    results = {name: ReconnectResult(host=name) for name in hosts}
+
+    def _reconnect(name: str) -> None:
+        start = time.monotonic()
+        try:
+            with log_owner(name):
+                results[name].attempts = reconnect_host(hosts[name], create_connections, timeout=timeout, **kwargs)
+        finally:
+            results[name].duration = time.monotonic() - start
+
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Reconnecting {len(hosts)} hosts.")
+    outcomes = run_concurrently(
+        {name: lambda name=name: _reconnect(name) for name in hosts}, deadline=deadline, name="reconnect"
+    )
+    for name, outcome in outcomes.items():
+        if outcome.error is not None:
+            results[name].error = f"{type(outcome.error).__name__}: {outcome.error}"
+            logger.warning(f"Connections of {name} were not re-established: {results[name].error}")
+    return results
+
+
+class HostReconnector:
+    """Re-establishing connections of hosts from hosts fixture, selected by name."""
+
+    def __init__(self, hosts: Dict[str, "Host"], create_connections: ConnectionsFactory, timeout: float = 600) -> None:
+        """
+        Init of HostReconnector.
+
+        :param hosts: Dictionary with host name as key and Host object as value
+        :param create_connections: Function creating all connections of host from HostModel
+        :param timeout: Time in seconds for single host to accept connections again
+        """
+        self._hosts = hosts
+        self._create_connections = create_connections
+        self.timeout = timeout
+
+    def reconnect(self, names: Optional[Iterable[str]] = None, **kwargs) -> Dict[str, ReconnectResult]:
+        """
+        Re-establish connections of hosts, all hosts if names are not passed.
+
+        :param names: Names of hosts
+        :param kwargs: Other parameters of reconnect_hosts
+        :return: Dictionary with host name as key and result as value
+        :raises PyTestMFDConfigException: if connections of any host were not re-established
+        """
+        selected = [self._hosts[name] for name in names] if names is not None else list(self._hosts.values())
+        kwargs.setdefault("timeout", self.timeout)
+        results = reconnect_hosts(selected, self._create_connections, **kwargs)
+        failed = [result for result in results.values() if not result.ok]
+        if failed:
+            raise PyTestMFDConfigException(
+                "Reconnecting failed for hosts: " + ", ".join(f"{result.host} ({result.error})" for result in failed)
+            )
+        return results
@@ -0,0 +1,137 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Lazy decryption of secrets encrypted with Fernet."""
+
+import base64
+import binascii
+import logging
+import threading
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Tuple, TypeVar
+
+from cryptography.fernet import Fernet
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_model.config import SecretModel
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+Model = TypeVar("Model")
+
+FERNET_VERSION = 0x80
+# version (1) + timestamp (8) + IV (16) + HMAC (32), ciphertext is a non-empty multiple of AES block size (16)
+FERNET_OVERHEAD = 57
+FERNET_BLOCK_SIZE = 16
+
+
+@lru_cache(maxsize=None)
+def get_cipher(key: bytes) -> Fernet:
+    """
+    Get Fernet object for encryption key, created once per key.
+
+    :param key: Fernet encryption key
+    :return: Fernet object
+    """
+    return Fernet(key)
+
+
+def is_fernet_token(value: str) -> bool:
+    """
+    Check if value has format of Fernet token, without decrypting it.
+
+    :param value: Value to check
+    :return: True if value is urlsafe base64 with Fernet version byte and valid length, False otherwise
+    """
+    try:
+        data = base64.urlsafe_b64decode(value.encode("ascii") + b"=" * (-len(value) % 4))
+    except (binascii.Error, UnicodeEncodeError, ValueError):
+        return False
+    ciphertext_length = len(data) - FERNET_OVERHEAD
+    return len(data) > FERNET_OVERHEAD and data[0] == FERNET_VERSION and ciphertext_length % FERNET_BLOCK_SIZE == 0
+
+
+class LazySecrets(Mapping):
+    """
+    Read-only mapping of secret name to SecretModel, value of secret is decrypted on first access.
+
+    Decrypted secrets are cached, so each secret is decrypted at most once.
+    """
+
+    def __init__(self, secrets: List[Dict[str, str]], get_cipher: Callable[[], Fernet]) -> None:
+        """
+        Init of LazySecrets.
+
+        :param secrets: List of secrets from test config, each with 'name' and encrypted 'value'
+        :param get_cipher: Function returning Fernet object, called on first decryption
+        """
+        self._encrypted = {secret.get("name"): secret.get("value") for secret in secrets}
+        self._get_cipher = get_cipher
+        self._decrypted: Dict[str, SecretModel] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> SecretModel:
+        if name in self._decrypted:
+            return self._decrypted[name]
+        encrypted = self._encrypted[name]
+        with self._lock:
+            if name not in self._decrypted:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Decrypting secret '{name}'.")
+                value = self._get_cipher().decrypt(encrypted.encode("utf-8")).decode()
+                self._decrypted[name] = SecretModel(name=name, value=value)
+        return self._decrypted[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._encrypted)
+
+    def __len__(self) -> int:
+        return len(self._encrypted)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._encrypted
+
+    def __repr__(self) -> str:
+        return f"LazySecrets({list(self._encrypted)})"
+
+
+class DecryptedModelCache:
+    """
+    Cache of models with decrypted fields, each model is decrypted once even if requested from many threads.
+
+    Models are cached by identity and kept referenced by the cache, so identity of cached model is not reused.
+    """
+
+    def __init__(self) -> None:
+        """Init of DecryptedModelCache."""
+        self._entries: Dict[int, Tuple[object, object]] = {}
+        self._locks: Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model: Model, decrypt: Callable[[Model], Model]) -> Model:
+        """
+        Get decrypted copy of model, decrypt it on first request.
+
+        :param model: Model with encrypted fields
+        :param decrypt: Function returning model with decrypted fields
+        :return: Model with decrypted fields
+        """
+        key = id(model)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is model:
+            return entry[1]
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not model:
+                entry = self._entries[key] = (model, decrypt(model))
+        return entry[1]
+
+    def clear(self) -> None:
+        """Forget all decrypted models."""
+        with self._lock:
+            self._entries.clear()
+            self._locks.clear()
+
+
+host_password_cache = DecryptedModelCache()
@@ -0,0 +1,287 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Port details of switches for all network interfaces from topology."""
+
+import logging
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.utils.deadlines import run_concurrently
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from mfd_switchmanagement.base import Switch
+    from pytest_mfd_config.models.topology import NetworkInterfaceModel, TopologyModel
+
+InterfaceKey = Tuple[str, str]
+
+LINK_UP_STATES = frozenset({"connected", "up"})
+LINK_DOWN_STATES = frozenset({"notconnect", "notconnec", "down", "disabled", "err-disabled", "sfpabsent", "xcvrabsen"})
+
+
+@dataclass
+class SwitchPortInfo:
+    """Details of switch port to which interface is connected."""
+
+    switch_name: str
+    port: Optional[str] = None
+    vlan: Optional[int] = None
+    speed: Optional[int] = None
+    link_up: Optional[bool] = None
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def interface_id(interface_model: "NetworkInterfaceModel", position: int) -> str:
+    """
+    Get identifier of interface unique within host.
+
+    :param interface_model: NetworkInterfaceModel object
+    :param position: Position of interface in network_interfaces of host
+    :return: Interface name, PCI address or MAC address, whichever is set first, position otherwise
+    """
+    return (
+        interface_model.interface_name or interface_model.pci_address or interface_model.mac_address or f"#{position}"
+    )
+
+
+def group_interfaces_by_switch(
+    topology: "TopologyModel",
+) -> Dict[str, List[Tuple[InterfaceKey, "NetworkInterfaceModel"]]]:
+    """
+    Group network interfaces of all hosts by switch they are connected to.
+
+    :param topology: Topology model object
+    :return: Dictionary with switch name as key and list of (host name, interface id) keys with interface models
+    """
+    groups = {}
+    for host_model in topology.hosts or []:
+        for position, interface_model in enumerate(host_model.network_interfaces or []):
+            if interface_model.switch_name:
+                key = (host_model.name, interface_id(interface_model, position))
+                groups.setdefault(interface_model.switch_name, []).append((key, interface_model))
+    return groups
+
+
+@dataclass
+class PortStatus:
+    """Status of single port parsed from ports status table of switch."""
+
+    vlan: Optional[int] = None
+    speed: Optional[int] = None
+    link_up: Optional[bool] = None
+
+
+def _port_key(port: str) -> str:
+    """Get port name comparable between long and abbreviated forms, e.g. 'Ethernet1/1' and 'Eth1/1'."""
+    match = re.match(r"([A-Za-z-]*)(.*)", port.strip())
+    return f"{match.group(1)[:2]}{match.group(2)}".lower()
+
+
+def _parse_speed(value: str) -> Optional[int]:
+    """Get speed in Mbps from status table, e.g. '10G', 'a-25G', '1000', 'a-100'."""
+    match = re.fullmatch(r"(?:a-)?(\d+)(G?)", value, re.IGNORECASE)
+    if match is None:
+        return None
+    return int(match.group(1)) * (1000 if match.group(2) else 1)
+
+
+def parse_ports_status(output: Any) -> Dict[str, PortStatus]:
+    """
+    Parse table of all ports returned by Switch.show_ports_status.
+
+    Columns are located by header line with 'Port' and status column ('Status' of Cisco 'show interface status',
+    'Operational state' of Mellanox 'show interfaces ethernet status'), 'Vlan' and 'Speed' columns are optional.
+    Values which are not recognized are left None.
+
+    :param output: Output of show_ports_status
+    :return: Dictionary with comparable port name as key and status of port as value, empty if output
+             is not recognized
+    """
+    if not isinstance(output, str):
+        return {}
+    lines = output.splitlines()
+    for index, line in enumerate(lines):
+        columns = {match.group().lower(): match.start() for match in re.finditer(r"(?:Operational )?\S+", line, re.I)}
+        status_column = next((name for name in columns if name in ("status", "state", "operational state")), None)
+        if "port" in columns and status_column is not None:
+            break
+    else:
+        return {}
+    starts = sorted(columns.values())
+    first_row = index + 1
+
+    def _cell(row: str, name: Optional[str]) -> str:
+        if name not in columns:
+            return ""
+        start = columns[name]
+        end = next((position for position in starts if position > start), len(row))
+        return row[start:end].strip()
+
+    statuses = {}
+    for row in lines[first_row:]:
+        port = _cell(row, "port")
+        if not port or set(port) <= {"-"}:
+            continue
+        state = _cell(row, status_column).lower()
+        vlan = _cell(row, "vlan")
+        statuses[_port_key(port)] = PortStatus(
+            vlan=int(vlan) if vlan.isdigit() else None,
+            speed=_parse_speed(_cell(row, "speed")),
+            link_up=True if state in LINK_UP_STATES else False if state in LINK_DOWN_STATES else None,
+        )
+    return statuses
+
+
+class _Memo:
+    """Call each switch query once per distinct argument and remember result or error."""
+
+    def __init__(self, switch: "Switch") -> None:
+        self._switch = switch
+        self._results: Dict[Tuple[str, Any], Tuple[Any, Optional[str]]] = {}
+
+    def __call__(self, method: str, argument: Any) -> Tuple[Any, Optional[str]]:
+        if (method, argument) not in self._results:
+            try:
+                self._results[method, argument] = getattr(self._switch, method)(argument), None
+            except Exception as e:
+                self._results[method, argument] = None, f"{type(e).__name__}: {e}"
+        return self._results[method, argument]
+
+
+def fetch_switch_port_details(
+    switch: "Switch", switch_name: str, interfaces: List[Tuple[InterfaceKey, "NetworkInterfaceModel"]]
+) -> Dict[InterfaceKey, SwitchPortInfo]:
+    """
+    Read port details of interfaces connected to single switch.
+
+    Status of all ports (link, speed and access VLAN) is read by single show_ports_status query and parsed.
+    Switch API has no bulk query of MAC address table, so port (when not set in topology as switch_port) and VLAN
+    of trunk ports are read by MAC address, once per distinct MAC address. Ports missing in status table, or whole
+    switch whose status table is not recognized, are queried per port, once per distinct port.
+
+    :param switch: Switch object
+    :param switch_name: Name of switch from topology
+    :param interfaces: Keys and models of interfaces connected to switch
+    :return: Dictionary with (host name, interface id) as key and port details as value
+    """
+    query = _Memo(switch)
+    try:
+        statuses = parse_ports_status(switch.show_ports_status())
+    except Exception as e:
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Cannot read ports status of {switch_name}: {e}")
+        statuses = {}
+    if not statuses:
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"No ports status of {switch_name}, querying per port.")
+    details = {}
+    for key, interface_model in interfaces:
+        info = SwitchPortInfo(switch_name=switch_name, port=interface_model.switch_port)
+        mac = str(interface_model.mac_address) if interface_model.mac_address else None
+        if info.port is None and mac is not None:
+            info.port, error = query("get_port_by_mac", mac)
+            if error:
+                info.errors["port"] = error
+        status = statuses.get(_port_key(str(info.port))) if info.port is not None else None
+        if status is not None and status.vlan is not None:
+            info.vlan = status.vlan
+        elif mac is not None:
+            info.vlan, error = query("get_vlan_by_mac", mac)
+            if error:
+                info.errors["vlan"] = error
+        if status is not None and status.speed is not None:
+            info.speed = status.speed
+        elif info.port is not None:
+            info.speed, error = query("get_port_speed", info.port)
+            if error:
+                info.errors["speed"] = error
+        if status is not None and status.link_up is not None:
+            info.link_up = status.link_up
+        elif info.port is not None:
+            info.link_up, error = query("is_port_linkup", info.port)
+            if error:
+                info.errors["link_up"] = error
+        details[key] = info
+    return details
+
+
+class SwitchPortDetails(Mapping):
+    """Mapping of (host name, interface id) to details of switch port, with lookups by host and by switch port."""
+
+    def __init__(self, details: Dict[InterfaceKey, SwitchPortInfo]) -> None:
+        """
+        Init of SwitchPortDetails.
+
+        :param details: Dictionary with (host name, interface id) as key and port details as value
+        """
+        self._details = dict(details)
+        self._by_host: Dict[str, Dict[str, SwitchPortInfo]] = {}
+        self._by_port: Dict[Tuple[str, str], List[InterfaceKey]] = {}
+        for key, info in self._details.items():
+            self._by_host.setdefault(key[0], {})[key[1]] = info
+            if info.port is not None:
+                self._by_port.setdefault((info.switch_name, info.port), []).append(key)
+
+    def __getitem__(self, key: InterfaceKey) -> SwitchPortInfo:
+        return self._details[key]
+
+    def __iter__(self) -> Iterator[InterfaceKey]:
+        return iter(self._details)
+
+    def __len__(self) -> int:
+        return len(self._details)
+
+    def for_host(self, host_name: str) -> Dict[str, SwitchPortInfo]:
+        """Get port details of interfaces of host, keyed by interface id."""
+        return dict(self._by_host.get(host_name, {}))
+
+    def interfaces_on_port(self, switch_name: str, port: str) -> List[InterfaceKey]:
+        """Get keys of interfaces connected to switch port."""
+        return list(self._by_port.get((switch_name, port), []))
+
+
+def collect_switch_port_details(
+    topology: "TopologyModel", get_switch: Callable[[str], "Switch"], deadline: Optional[float] = None
+) -> SwitchPortDetails:
+    """
+    Read port details of all topology interfaces connected to switches, switches are queried concurrently.
+
+    Interfaces connected to switch which cannot be accessed have the error recorded under 'switch' key.
+
+    :param topology: Topology model object
+    :param get_switch: Function returning Switch object for switch name, KeyError for unknown switch
+    :param deadline: Time in seconds for querying all switches
+    :return: SwitchPortDetails mapping
+    """
+    groups = group_interfaces_by_switch(topology)
+    logger.log(
+        level=log_levels.MODULE_DEBUG,
+        msg=f"Reading port details of {sum(len(group) for group in groups.values())} interfaces "
+        f"from {len(groups)} switches.",
+    )
+    outcomes = run_concurrently(
+        {
+            switch_name: lambda switch_name=switch_name, interfaces=interfaces: fetch_switch_port_details(
+                get_switch(switch_name), switch_name, interfaces
+            )
+            for switch_name, interfaces in groups.items()
+        },
+        deadline=deadline,
+        name="switch ports",
+    )
+    details = {}
+    for switch_name, outcome in outcomes.items():
+        if outcome.error is None:
+            details.update(outcome.result)
+            continue
+        error = f"{type(outcome.error).__name__}: {outcome.error}"
+        logger.warning(f"Cannot read port details from switch {switch_name}: {error}")
+        for key, interface_model in groups[switch_name]:
+            details[key] = SwitchPortInfo(
+                switch_name=switch_name, port=interface_model.switch_port, errors={"switch": error}
+            )
+    return SwitchPortDetails(details)
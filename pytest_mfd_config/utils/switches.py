@@ -0,0 +1,130 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Lazy and concurrent creation of switches and cache of their autodetected device types."""
+
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, Optional, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from pytest_mfd_config.utils.deadlines import run_concurrently
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from _pytest.cacheprovider import Cache
+    from mfd_switchmanagement.base import Switch
+    from pytest_mfd_config.models.topology import SwitchModel
+
+DEVICE_TYPES_CACHE_KEY = "pytest_mfd_config/switch_device_types"
+
+
+def device_type_key(switch_model: "SwitchModel") -> str:
+    """Get key of switch in device types cache."""
+    return f"{switch_model.switch_type}@{switch_model.mng_ip_address}"
+
+
+class SwitchDeviceTypeCache:
+    """Device types of switches detected by Netmiko, stored in pytest cache between runs."""
+
+    def __init__(self) -> None:
+        """Init of SwitchDeviceTypeCache."""
+        self._cache: Optional["Cache"] = None
+        self._device_types: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, cache: Optional["Cache"]) -> None:
+        """
+        Load device types detected in previous runs.
+
+        :param cache: Pytest cache, None disables storing between runs
+        """
+        with self._lock:
+            self._cache = cache
+            self._device_types = dict(cache.get(DEVICE_TYPES_CACHE_KEY, {})) if cache is not None else {}
+
+    def get(self, key: str) -> Optional[str]:
+        """Get cached device type, None if it was not detected yet."""
+        with self._lock:
+            return self._device_types.get(key)
+
+    def set(self, key: str, device_type: str) -> None:
+        """Store detected device type."""
+        with self._lock:
+            self._device_types[key] = device_type
+            self._save()
+
+    def forget(self, key: str) -> None:
+        """Remove device type, e.g. when switch was replaced by another model."""
+        with self._lock:
+            if self._device_types.pop(key, None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        """Write device types to pytest cache."""
+        if self._cache is not None:
+            self._cache.set(DEVICE_TYPES_CACHE_KEY, self._device_types)
+
+
+switch_device_types = SwitchDeviceTypeCache()
+
+
+class LazySwitches(Mapping):
+    """
+    Mapping of switch name to Switch object, created on first access.
+
+    Switches are created once, concurrent accesses of the same switch wait for single creation.
+    """
+
+    def __init__(self, switch_models: List["SwitchModel"], factory: Callable[["SwitchModel"], "Switch"]) -> None:
+        """
+        Init of LazySwitches.
+
+        :param switch_models: Models of switches, in topology order
+        :param factory: Function creating Switch object from model
+        """
+        self._models = {switch_model.name: switch_model for switch_model in switch_models}
+        self._factory = factory
+        self._switches: Dict[str, "Switch"] = {}
+        self._locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> "Switch":
+        if name not in self._models:
+            raise KeyError(name)
+        with self._lock:
+            creation_lock = self._locks[name]
+        with creation_lock:
+            if name not in self._switches:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Connecting to switch {name} on first use.")
+                self._switches[name] = self._factory(self._models[name])
+            return self._switches[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._models)
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def created(self) -> List["Switch"]:
+        """Get switches which were already created."""
+        return [self._switches[name] for name in self._models if name in self._switches]
+
+    def create_all(self, concurrent: bool = False) -> List["Switch"]:
+        """
+        Create all switches which were not created yet.
+
+        :param concurrent: Create switches concurrently instead of one by one
+        :return: List of all switches, in topology order
+        :raises Exception: first error of switch creation, after all creations finished
+        """
+        if concurrent:
+            outcomes = run_concurrently({name: lambda name=name: self[name] for name in self._models}, name="switch")
+            for outcome in outcomes.values():
+                if outcome.error is not None:
+                    raise outcome.error
+        return [self[name] for name in self._models]
@@ -0,0 +1,133 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Teardown of connections opened by the plugin."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, List, Optional, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_connect import LocalConnection
+
+from pytest_mfd_config.utils.connection_registry import connection_registry
+from pytest_mfd_config.utils.deadlines import run_concurrently
+from pytest_mfd_config.utils.host_logs import log_owner
+from pytest_mfd_config.utils.keepalive import keepalive_monitor
+from pytest_mfd_config.utils.leak_tracker import leak_tracker
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+if TYPE_CHECKING:
+    from mfd_host import Host
+    from mfd_powermanagement.base import PowerManagement
+    from mfd_switchmanagement.base import Switch
+
+
+@dataclass(frozen=True)
+class Resource:
+    """Object with disconnect method, opened by the plugin."""
+
+    owner: str
+    description: str
+    obj: Any
+
+
+@dataclass(frozen=True)
+class CloseFailure:
+    """Resource which was not closed cleanly."""
+
+    owner: str
+    description: str
+    error: str
+
+
+def host_resources(host: "Host") -> List[Resource]:
+    """
+    Get connections of host: all from Connections dataclass (also pooled ones), main connection and connection
+    of power management.
+
+    :param host: Host object
+    :return: List of resources, each connection listed once
+    """
+    candidates = [(str(host.connection), host.connection)]
+    if host.connections is not None:
+        candidates.extend((str(connection), connection) for connection in host.connections.all())
+    candidates.extend(
+        (resource.description, resource.obj) for resource in power_mng_resources(host.name, host.power_mng)
+    )
+
+    resources = []
+    for description, obj in candidates:
+        if obj is not None and all(obj is not resource.obj for resource in resources):
+            resources.append(Resource(owner=host.name, description=description, obj=obj))
+    return resources
+
+
+def power_mng_resources(owner: str, power_mng: Optional["PowerManagement"]) -> List[Resource]:
+    """
+    Get connection of power management, local connections are skipped.
+
+    :param owner: Name of host owning the power management
+    :param power_mng: PowerManagement object or its lazy proxy
+    :return: List with single resource, empty if power management has no remote connection (yet)
+    """
+    connection = getattr(power_mng, "_connection", None) if power_mng is not None else None
+    if connection is None or isinstance(connection, LocalConnection):
+        return []
+    return [Resource(owner=owner, description=f"power_mng {type(power_mng).__name__}", obj=connection)]
+
+
+def switch_resources(switch: "Switch") -> List[Resource]:
+    """
+    Get switch session as resource.
+
+    :param switch: Switch object
+    :return: List with single resource
+    """
+    owner = switch.topology.name if getattr(switch, "topology", None) is not None else str(switch)
+    return [Resource(owner=owner, description=f"switch {type(switch).__name__}", obj=switch)]
+
+
+def _disconnect(resource: Resource) -> None:
+    with log_owner(resource.owner):
+        resource.obj.disconnect()
+
+
+def close_resources(resources: List[Resource], deadline: Optional[float]) -> List[CloseFailure]:
+    """
+    Disconnect resources concurrently, waiting for all of them no longer than deadline.
+
+    Connections shared via connection registry are disconnected only when released by their last user.
+
+    :param resources: Resources to be closed
+    :param deadline: Time in seconds for closing all resources
+    :return: List of resources which failed to close or did not close within deadline
+    """
+    to_close = [resource for resource in resources if connection_registry.release(resource.obj)]
+    for resource in to_close:
+        keepalive_monitor.unregister(resource.obj)
+    if not to_close:
+        return []
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Closing {len(to_close)} connections opened by plugin.")
+    outcomes = run_concurrently(
+        {index: lambda resource=resource: _disconnect(resource) for index, resource in enumerate(to_close)},
+        deadline=deadline,
+        name="teardown",
+    )
+    failures = []
+    for index, outcome in outcomes.items():
+        if outcome.error is None:
+            leak_tracker.mark_closed(to_close[index].obj)
+        else:
+            resource = to_close[index]
+            failure = CloseFailure(
+                owner=resource.owner,
+                description=resource.description,
+                error=f"{type(outcome.error).__name__}: {outcome.error}",
+            )
+            logger.warning(
+                f"Connection {failure.description} of {failure.owner} was not closed cleanly: {failure.error}"
+            )
+            failures.append(failure)
+    return failures
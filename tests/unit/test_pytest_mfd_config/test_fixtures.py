@@ -2,19 +2,22 @@
 # SPDX-License-Identifier: MIT
 """Tests for `pytest_mfd_config` package."""
 
+import json
 import logging
 import os
 import re
+import threading
 
 from pydantic import SecretStr
 
+import mfd_powermanagement
 import pytest
 from cryptography.fernet import Fernet
 from mfd_common_libs import log_levels
 from mfd_connect import AsyncConnection
 from ruamel.yaml import YAML
 
-from pytest_mfd_config.exceptions import PyTestMFDConfigException
+from pytest_mfd_config.exceptions import PyTestMFDConfigException, SetupDeadlineExceededError, CircuitOpenError
 from pytest_mfd_config.fixtures import (
     _get_connected_pairs,
     log_extra_data_after_test,
@@ -26,10 +29,24 @@ from pytest_mfd_config.fixtures import (
     _decrypt_secrets,
     _decrypt_host_password,
     create_host_from_model,
+    create_host_connections_from_model,
+    create_switch_from_model,
+    create_power_mng_from_model,
+    _establish_connection,
 )
 from mfd_host import Host
 from pytest_mfd_config.models.test_config import HostPairConnectionModel, SecretModel
-from pytest_mfd_config.models.topology import ConnectionModel
+from pytest_mfd_config.models.topology import ConnectionModel, SwitchModel, PowerMngModel
+from pytest_mfd_config.utils.circuit_breaker import circuit_breaker
+from pytest_mfd_config.utils.connection_registry import connection_registry
+from pytest_mfd_config.utils.deadlines import setup_deadlines
+from pytest_mfd_config.utils.switches import switch_device_types
+from pytest_mfd_config.utils.power_mng import get_init_parameters, get_missing_init_parameters
+from pytest_mfd_config.utils.secrets import LazySecrets, host_password_cache
+from pytest_mfd_config.utils.connection_metrics import call_metrics
+
+
+FERNET_TOKEN = Fernet(Fernet.generate_key()).encrypt(b"password").decode()
 
 
 class TestFixtures:
@@ -68,6 +85,131 @@ class TestFixtures:
         assert "Extra data from test:" not in caplog.text
         assert "{'tested_adapter': {'nvm': '80008213'}}" not in caplog.text
 
+    def test_extra_data_jsonl(self, pytester):
+        pytester.makepyfile(
+            """
+            def test_passed(extra_data):
+                extra_data["nvm"] = "80008213"
+
+            def test_failed(extra_data):
+                extra_data["driver"] = "1.11.2"
+                assert False
+
+            def test_without_extra_data():
+                pass
+            """
+        )
+        result = pytester.runpytest("-p", "pytest_mfd_config.fixtures", "--extra_data_jsonl", "extra_data.jsonl")
+        result.assert_outcomes(passed=2, failed=1)
+        result.stdout.fnmatch_lines(["*extra_data.jsonl: 2 records (* bytes) written, 0 truncated, 0 dropped"])
+        lines = (pytester.path / "extra_data.jsonl").read_text().splitlines()
+        records = {record["nodeid"]: record for record in map(json.loads, lines)}
+        assert records["test_extra_data_jsonl.py::test_passed"]["extra_data"] == {"nvm": "80008213"}
+        assert records["test_extra_data_jsonl.py::test_failed"]["outcome"] == "failed"
+        assert len(records) == 2
+
+    def test_extra_data_jsonl_record_not_kept_in_report(self, pytester):
+        pytester.makepyfile(
+            """
+            def test_passed(extra_data):
+                extra_data["nvm"] = "80008213"
+            """
+        )
+        recorder = pytester.inline_run("-p", "pytest_mfd_config.fixtures", "--extra_data_jsonl", "extra_data.jsonl")
+        reports = recorder.getreports("pytest_runtest_logreport")
+        assert [report.when for report in reports if hasattr(report, "extra_data_record")] == ["call"]
+        assert all(getattr(report, "extra_data_record", None) is None for report in reports)
+        assert len((pytester.path / "extra_data.jsonl").read_text().splitlines()) == 1
+
+    def test_extra_data_jsonl_not_changed_by_teardown(self, pytester):
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.fixture()
+            def teardown_data(extra_data):
+                yield
+                extra_data["teardown"] = "x" * 100000
+
+            def test_passed(teardown_data, extra_data):
+                extra_data["nvm"] = "80008213"
+            """
+        )
+        result = pytester.runpytest("-p", "pytest_mfd_config.fixtures", "--extra_data_jsonl", "extra_data.jsonl")
+        result.assert_outcomes(passed=1)
+        lines = (pytester.path / "extra_data.jsonl").read_text().splitlines()
+        assert [json.loads(line)["extra_data"] for line in lines] == [{"nvm": "80008213"}]
+
+    def test_extra_data_jsonl_not_written_by_xdist_worker(self, pytester):
+        pytester.makeconftest(
+            """
+            import pytest
+
+            reports = []
+
+            @pytest.hookimpl(tryfirst=True)
+            def pytest_configure(config):
+                config.workerinput = {"workerid": "gw0"}
+
+            def pytest_runtest_logreport(report):
+                if getattr(report, "extra_data_record", None):
+                    reports.append(report.extra_data_record)
+
+            def pytest_sessionfinish(session):
+                assert len(reports) == 1
+            """
+        )
+        pytester.makepyfile(
+            """
+            def test_passed(extra_data):
+                extra_data["nvm"] = "80008213"
+            """
+        )
+        result = pytester.runpytest("-p", "pytest_mfd_config.fixtures", "--extra_data_jsonl", "extra_data.jsonl")
+        result.assert_outcomes(passed=1)
+        assert result.ret == 0
+        assert not (pytester.path / "extra_data.jsonl").exists()
+
+    def test_queued_logging(self, pytester):
+        pytester.makepyfile(
+            """
+            import logging
+            from mfd_common_libs import log_levels
+
+            def test_logging():
+                logging.getLogger("mfd").log(log_levels.CMD, "ip link show")
+                logging.getLogger("mfd").info("info record")
+            """
+        )
+        result = pytester.runpytest(
+            "-p", "pytest_mfd_config.fixtures", "--queued_logging", "--log-file", "test.log", "--log-file-level", "1"
+        )
+        result.assert_outcomes(passed=1)
+        log = (pytester.path / "test.log").read_text()
+        assert "ip link show" in log and "info record" in log
+
+    def test_host_logs(self, pytester):
+        pytester.makepyfile(
+            """
+            import logging
+            from mfd_common_libs import log_levels
+            from pytest_mfd_config.utils.host_logs import log_owner
+
+            def test_logging():
+                with log_owner("sut"):
+                    logging.getLogger("mfd").log(log_levels.CMD, "ip link show")
+                logging.getLogger("mfd").info("info record")
+            """
+        )
+        result = pytester.runpytest(
+            "-p", "pytest_mfd_config.fixtures", "--host_logs_dir=hosts", "--log-file=test.log", "--log-file-level=1"
+        )
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*sut: 1 records in hosts*sut.log"])
+        log = (pytester.path / "test.log").read_text()
+        assert "info record" in log and "ip link show" not in log
+        assert "ip link show" in (pytester.path / "hosts" / "sut.log").read_text()
+
     def test_extra_data(self, pytester):
         """
         Testing if we didn't use json report it works fine without exception.
@@ -232,6 +374,7 @@ class TestFixtures:
         test_config = {}
         mock_logger = mocker.patch("pytest_mfd_config.fixtures.logger")
         secrets = _get_secrets(test_config)
+        assert isinstance(secrets, LazySecrets)
         assert secrets == {}
         mock_logger.log.assert_called_with(
             level=log_levels.MODULE_DEBUG, msg="There is no 'secrets' key in test config file."
@@ -247,13 +390,19 @@ class TestFixtures:
         with pytest.raises(PyTestMFDConfigException, match="AMBER_ENCRYPTION_KEY environment variable is not set."):
             _get_encryption_obj()
 
+    def test__get_encryption_obj_reused(self, mocker):
+        mocker.patch.dict(os.environ, {"AMBER_ENCRYPTION_KEY": "GWXohRLNALUC5zzulG6cZtPtxBKC7VA0mo-ING-_G1c="})
+        assert _get_encryption_obj() is _get_encryption_obj()
+
     def test__decrypt_secrets(self, mocker):
         secrets_dict = [{"name": "secret1", "value": "gAAAAABf2..."}]
         mock_cipher = mocker.Mock()
         mock_cipher.decrypt.return_value = b"decrypted_value1"
         mocker.patch("pytest_mfd_config.fixtures._get_encryption_obj", return_value=mock_cipher)
         secrets = _decrypt_secrets(secrets_dict)
+        mock_cipher.decrypt.assert_not_called()
         assert secrets == {"secret1": SecretModel(name="secret1", value="decrypted_value1")}
+        assert secrets["secret1"].value.get_secret_value() == "decrypted_value1"
         mock_cipher.decrypt.assert_called_once_with(b"gAAAAABf2...")
 
     def test__decrypt_host_password_no_connections(self, mocker):
@@ -285,7 +434,7 @@ class TestFixtures:
 
     def test__decrypt_host_password_connection_without_options(self, mocker):
         conn_with_password = mocker.Mock(name="connection_with_password")
-        conn_with_password.connection_options = {"password": SecretStr("encrypted_pwd")}
+        conn_with_password.connection_options = {"password": SecretStr(FERNET_TOKEN)}
 
         conn_without_options = mocker.Mock(name="connection_without_options")
         conn_without_options.connection_options = None
@@ -330,8 +479,8 @@ class TestFixtures:
             connections=[
                 DummyConnection(
                     {
-                        "password": SecretStr("encrypted_password"),
-                        "jump_host_password": SecretStr("encrypted_jump_password"),
+                        "password": SecretStr(FERNET_TOKEN),
+                        "jump_host_password": SecretStr(FERNET_TOKEN),
                         "timeout": 30,
                     }
                 )
@@ -350,6 +499,42 @@ class TestFixtures:
         assert decrypted_options["timeout"] == 30
         assert mock_cipher.decrypt.call_count == 2
 
+    def test__decrypt_host_password_keeps_plaintext_passwords(self, mocker):
+        connection_model = ConnectionModel(
+            connection_type="SSHConnection", ip_address="10.10.10.10", connection_options={"password": "plaintext"}
+        )
+        host_model = mocker.Mock(connections=[connection_model])
+        get_encryption_obj = mocker.patch("pytest_mfd_config.fixtures._get_encryption_obj")
+        assert _decrypt_host_password(host_model) is host_model
+        get_encryption_obj.assert_not_called()
+
+    def test_create_host_from_model_decrypts_passwords_once(self, mocker):
+        mocker.patch.object(host_password_cache, "_entries", {})
+        mocker.patch.object(host_password_cache, "_locks", {})
+        host_model = mocker.Mock(name="host_model", power_mng=None, network_interfaces=None)
+        decrypted_model = mocker.Mock(name="decrypted_model", power_mng=None, network_interfaces=None)
+        decrypt = mocker.patch("pytest_mfd_config.fixtures._decrypt_host_password", return_value=decrypted_model)
+        create_connections = mocker.patch(
+            "pytest_mfd_config.fixtures.create_host_connections_from_model", return_value=[mocker.Mock()]
+        )
+        mocker.patch("pytest_mfd_config.fixtures.Connections")
+        host_class = mocker.patch("pytest_mfd_config.fixtures.Host")
+        barrier = threading.Barrier(4, timeout=1)
+
+        def _create():
+            barrier.wait()
+            create_host_from_model(host_model)
+
+        threads = [threading.Thread(target=_create) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        decrypt.assert_called_once_with(host_model)
+        create_connections.assert_called_with(decrypted_model, fresh=False)
+        assert host_class.call_args.kwargs["topology"] is decrypted_model
+
     def test_create_host_from_model_basic(self, mocker):
         host_model = mocker.Mock(name="host_model")
         host_model.name = "test_host"
@@ -409,3 +594,485 @@ class TestFixtures:
 
         mock_host.refresh_network_interfaces.assert_called_once()
         assert result is mock_host
+
+    def test_create_host_from_model_closes_connections_on_failure(self, mocker):
+        host_model = mocker.Mock(name="host_model", power_mng=None, network_interfaces=[mocker.Mock()])
+        host_model.name = "test_host"
+        mock_connection = mocker.Mock(__str__=lambda _: "rpyc")
+        mocker.patch("pytest_mfd_config.fixtures._decrypt_host_password", return_value=host_model)
+        mocker.patch("pytest_mfd_config.fixtures.create_host_connections_from_model", return_value=[mock_connection])
+        mock_host = mocker.Mock(spec=Host)
+        mock_host.refresh_network_interfaces.side_effect = RuntimeError("lspci failed")
+        mocker.patch("pytest_mfd_config.fixtures.Host", return_value=mock_host)
+
+        with pytest.raises(RuntimeError, match="lspci failed"):
+            create_host_from_model(host_model)
+
+        mock_connection.disconnect.assert_called_once()
+
+    def test_create_host_from_model_host_deadline_exceeded(self, mocker):
+        host_model = mocker.Mock(name="host_model", power_mng=None, network_interfaces=None)
+        host_model.name = "test_host"
+        mock_connection = mocker.Mock(__str__=lambda _: "rpyc")
+        own_connection = mocker.Mock(__str__=lambda _: "ssh")
+        release, closed = threading.Event(), threading.Event()
+        own_connection.disconnect.side_effect = lambda: closed.set()
+        late_host = mocker.Mock(connection=mock_connection, power_mng=None)
+        late_host.name = "test_host"
+        late_host.connections.all.return_value = [mock_connection, own_connection]
+        mocker.patch("pytest_mfd_config.fixtures._decrypt_host_password", return_value=host_model)
+        mocker.patch("pytest_mfd_config.fixtures.create_host_connections_from_model", return_value=[mock_connection])
+        mocker.patch("pytest_mfd_config.fixtures.Host", side_effect=lambda **kwargs: release.wait() and late_host)
+        mocker.patch.object(setup_deadlines, "_deadlines", {"host": 0.05})
+
+        with pytest.raises(SetupDeadlineExceededError, match="phase 'host'"):
+            create_host_from_model(host_model)
+        mock_connection.disconnect.assert_called_once()
+        release.set()
+        assert closed.wait(1)
+        mock_connection.disconnect.assert_called_once()
+
+    def test_preflight_abort_on_unreachable_endpoint(self, pytester):
+        pytester.makefile(
+            ".yaml",
+            topology="""
+            metadata:
+              version: '2.5'
+            hosts:
+            - name: sut
+              role: sut
+              connections:
+              - ip_address: 127.0.0.1
+                connection_type: SSHConnection
+                connection_options:
+                  port: 1
+            """,
+        )
+        pytester.makepyfile(
+            """
+            def test_dummy():
+                pass
+            """
+        )
+        result = pytester.runpytest(
+            "-p", "pytest_mfd_config.fixtures", "--topology_config", "topology.yaml", "--preflight_abort"
+        )
+        result.stdout.fnmatch_lines(["*topology preflight*", "*sut*127.0.0.1:1*UNREACHABLE*"])
+        result.stderr.fnmatch_lines(["*Preflight probe failed*sut SSHConnection(id=0) 127.0.0.1:1*"])
+        assert result.ret == pytest.ExitCode.INTERRUPTED
+
+    def test_preflight_skipped_on_xdist_worker(self, pytester, mocker):
+        probe_endpoints = mocker.patch("pytest_mfd_config.fixtures.probe_endpoints")
+        pytester.makeconftest(
+            """
+            import pytest
+
+            @pytest.hookimpl(tryfirst=True)
+            def pytest_configure(config):
+                config.workerinput = {"workerid": "gw0"}
+            """
+        )
+        pytester.makefile(
+            ".yaml",
+            topology="""
+            metadata:
+              version: '2.5'
+            hosts: []
+            """,
+        )
+        pytester.makepyfile(
+            """
+            def test_dummy():
+                pass
+            """
+        )
+        result = pytester.runpytest_inprocess(
+            "-p", "pytest_mfd_config.fixtures", "--topology_config", "topology.yaml", "--preflight"
+        )
+        result.assert_outcomes(passed=1)
+        probe_endpoints.assert_not_called()
+
+    def test_create_host_connections_from_model_pooled_connections_not_reused(self, mocker):
+        get_connection_object = mocker.patch("pytest_mfd_config.fixtures.get_connection_object")
+        host_model = mocker.Mock(
+            connections=[
+                ConnectionModel(connection_id=0, ip_address="10.10.10.10", connection_type="RPyCConnection"),
+                ConnectionModel(connection_id=1, ip_address="10.10.10.10", connection_type="RPyCConnection"),
+                ConnectionModel(connection_id=2, ip_address="10.10.10.10", connection_type="SSHConnection"),
+            ]
+        )
+        create_host_connections_from_model(host_model)
+        assert [call.kwargs["fresh"] for call in get_connection_object.call_args_list] == [False, True, False]
+
+    def test_create_host_connections_from_model_deadline_exceeded(self, mocker):
+        release = threading.Event()
+        mocker.patch(
+            "pytest_mfd_config.fixtures.get_connection_object", side_effect=lambda *args, **kwargs: release.wait()
+        )
+        mocker.patch.object(setup_deadlines, "_deadlines", {"SerialConnection": 0.05})
+        host_model = mocker.Mock(connections=[ConnectionModel(connection_id=3, connection_type="SerialConnection")])
+        host_model.name = "sut-1"
+        try:
+            with pytest.raises(
+                SetupDeadlineExceededError,
+                match=r"Host 'sut-1' connection_id=3 \(SerialConnection\) phase 'connection'",
+            ):
+                create_host_connections_from_model(host_model)
+        finally:
+            release.set()
+
+    def test_create_host_connections_from_model_deadline_exceeded_late_connection(self, mocker):
+        mocker.patch.object(circuit_breaker, "threshold", 1)
+        mocker.patch.object(circuit_breaker, "_states", {})
+        mocker.patch.object(circuit_breaker, "events", [])
+        release, closed = threading.Event(), threading.Event()
+        late_connection = mocker.Mock(**{"disconnect.side_effect": lambda: closed.set()})
+        key = ("SSHConnection", "10.10.10.10", None)
+        mocker.patch(
+            "pytest_mfd_config.fixtures.get_connection_object",
+            side_effect=lambda *args, **kwargs: circuit_breaker.call(key, lambda: release.wait() and late_connection),
+        )
+        mocker.patch.object(setup_deadlines, "_deadlines", {"SSHConnection": 0.05})
+        connection_model = ConnectionModel(ip_address="10.10.10.10", connection_type="SSHConnection")
+        host_model = mocker.Mock(connections=[connection_model])
+        host_model.name = "sut-1"
+        with pytest.raises(SetupDeadlineExceededError):
+            create_host_connections_from_model(host_model)
+        assert [event.key for event in circuit_breaker.events] == [key]
+        release.set()
+        assert closed.wait(1)
+        with pytest.raises(CircuitOpenError, match="after 1 failures"):
+            circuit_breaker.check(key)  # late success of abandoned attempt does not close breaker
+
+    def test_create_host_connections_from_model_closes_partial_connections(self, mocker):
+        established = mocker.Mock(__str__=lambda _: "RPyCConnection")
+        mocker.patch(
+            "pytest_mfd_config.fixtures.get_connection_object",
+            side_effect=[established, ConnectionRefusedError("host is booting")],
+        )
+        host_model = mocker.Mock(
+            connections=[
+                ConnectionModel(ip_address="10.10.10.10", connection_type="RPyCConnection"),
+                ConnectionModel(ip_address="10.10.10.10", connection_type="SSHConnection"),
+            ]
+        )
+        host_model.name = "sut-1"
+        with pytest.raises(ConnectionRefusedError):
+            create_host_connections_from_model(host_model)
+        established.disconnect.assert_called_once()
+
+    def test_hosts_degraded_mode(self, pytester):
+        pytester.makeconftest(
+            """
+            from types import SimpleNamespace
+
+            import pytest
+
+            import pytest_mfd_config.fixtures as plugin_fixtures
+
+
+            @pytest.fixture(scope="session")
+            def topology():
+                return SimpleNamespace(
+                    hosts=[
+                        SimpleNamespace(name="good", instantiate=True),
+                        SimpleNamespace(name="bad", instantiate=True),
+                        SimpleNamespace(name="other", instantiate=True),
+                    ]
+                )
+
+
+            @pytest.fixture(scope="session")
+            def connected_pairs():
+                return [
+                    SimpleNamespace(hosts=["good", "bad"], bidirectional=False),
+                    SimpleNamespace(hosts=["good", "other"], bidirectional=False),
+                ]
+
+
+            @pytest.fixture(scope="session", autouse=True)
+            def fake_host_creation():
+                def _create_host_from_model(host_model, **kwargs):
+                    if host_model.name == "bad":
+                        raise ConnectionError("refused")
+                    return SimpleNamespace(name=host_model.name, connection=None, connections=None, power_mng=None)
+
+                original = plugin_fixtures.create_host_from_model
+                plugin_fixtures.create_host_from_model = _create_host_from_model
+                yield
+                plugin_fixtures.create_host_from_model = original
+            """
+        )
+        pytester.makepyfile(
+            """
+            def test_good_host(hosts):
+                assert hosts["good"].name == "good"
+
+            def test_bad_host(hosts):
+                hosts["bad"]
+
+            def test_bad_host_get(hosts):
+                hosts.get("bad")
+
+            def test_connected_hosts(connected_hosts):
+                assert [(left.name, right.name) for left, right in connected_hosts] == [("good", "other")]
+            """
+        )
+        result = pytester.runpytest("-p", "pytest_mfd_config.fixtures", "--degraded_mode", "-rs")
+        result.assert_outcomes(passed=2, skipped=2)
+        result.stdout.fnmatch_lines(
+            [
+                "*Connected pair*requires unavailable hosts: 'bad' (ConnectionError: refused)*",
+                "*unavailable hosts (degraded mode)*",
+                "bad: ConnectionError: refused",
+                "*Host 'bad' is unavailable: ConnectionError: refused*",
+            ]
+        )
+
+    def test_hosts_without_degraded_mode_fails(self, pytester):
+        pytester.makeconftest(
+            """
+            from types import SimpleNamespace
+
+            import pytest
+
+            import pytest_mfd_config.fixtures as plugin_fixtures
+
+
+            @pytest.fixture(scope="session")
+            def topology():
+                return SimpleNamespace(hosts=[SimpleNamespace(name="bad", instantiate=True)])
+
+
+            @pytest.fixture(scope="session", autouse=True)
+            def fake_host_creation():
+                def _create_host_from_model(host_model, **kwargs):
+                    raise ConnectionError("refused")
+
+                original = plugin_fixtures.create_host_from_model
+                plugin_fixtures.create_host_from_model = _create_host_from_model
+                yield
+                plugin_fixtures.create_host_from_model = original
+            """
+        )
+        pytester.makepyfile(
+            """
+            def test_bad_host(hosts):
+                pass
+            """
+        )
+        result = pytester.runpytest("-p", "pytest_mfd_config.fixtures")
+        result.assert_outcomes(errors=1)
+
+    def test_establish_connection_circuit_breaker(self, mocker):
+        mocker.patch.object(circuit_breaker, "threshold", 1)
+        mocker.patch.object(circuit_breaker, "_states", {})
+        mocker.patch.object(circuit_breaker, "events", [])
+        connection_class = mocker.patch("mfd_connect.SSHConnection", side_effect=ConnectionRefusedError("refused"))
+        connection_model = ConnectionModel(ip_address="10.10.10.10", connection_type="SSHConnection")
+        with pytest.raises(ConnectionRefusedError):
+            _establish_connection(connection_model)
+        with pytest.raises(CircuitOpenError, match=r"\('SSHConnection', '10.10.10.10', None\)"):
+            _establish_connection(connection_model)
+        connection_class.assert_called_once()
+
+    def test_establish_connection_from_kwargs_template(self, mocker):
+        connection_class = mocker.patch("mfd_connect.SerialConnection")
+        deepcopy = mocker.patch("copy.deepcopy")
+        relative_connection = mocker.Mock()
+        connection_model = ConnectionModel(
+            connection_type="SerialConnection",
+            connection_options={"baudrate": 115200, "password": "secret", "prompts": {"efi": ["Shell>"]}},
+        )
+        _establish_connection(connection_model, relative_connection)
+        _establish_connection(connection_model, relative_connection)
+        connection_class.assert_called_with(
+            baudrate=115200,
+            password="secret",
+            prompts={"efi": ["Shell>"]},
+            model=connection_model,
+            connection=relative_connection,
+        )
+        assert "model" not in connection_model.constructor_kwargs
+        assert connection_model.connection_options["password"].get_secret_value() == "secret"
+        deepcopy.assert_not_called()
+
+    def test_get_connection_object_reuse_connections(self, mocker):
+        mocker.patch.object(connection_registry, "enabled", True)
+        mocker.patch.object(connection_registry, "_entries", {})
+        mock = mocker.patch("pytest_mfd_config.fixtures._establish_connection", side_effect=lambda *args: object())
+        connection_model = ConnectionModel(ip_address="10.10.10.10", connection_type="SSHConnection")
+        first = get_connection_object(connection_model)
+        assert get_connection_object(connection_model) is first
+        assert get_connection_object(connection_model, fresh=True) is not first
+        assert mock.call_count == 2
+
+    def test_get_connection_object_instrumented(self, mocker):
+        mocker.patch.object(call_metrics, "enabled", True)
+        mocker.patch.object(call_metrics, "_stats", {})
+        connection = mocker.Mock(spec=["execute_command", "disconnect"])
+        connection.execute_command.return_value = mocker.Mock(stdout="Linux", stderr="")
+        mocker.patch("pytest_mfd_config.fixtures._establish_connection", return_value=connection)
+        connection_model = ConnectionModel(ip_address="10.10.10.10", connection_type="SSHConnection")
+        assert get_connection_object(connection_model, owner="sut") is connection
+        connection.execute_command("uname")
+        stats = call_metrics.snapshot()["sut"]["SSHConnection"]["execute_command"]
+        assert (stats["count"], stats["bytes_sent"], stats["bytes_received"]) == (1, 5, 5)
+
+    def test_hosts_teardown_reports_not_closed_connections(self, pytester):
+        pytester.makeconftest(
+            """
+            from types import SimpleNamespace
+            from unittest.mock import Mock
+
+            import pytest
+
+            import pytest_mfd_config.fixtures as plugin_fixtures
+
+
+            @pytest.fixture(scope="session")
+            def topology():
+                return SimpleNamespace(hosts=[SimpleNamespace(name="sut", instantiate=True)])
+
+
+            @pytest.fixture(scope="session", autouse=True)
+            def fake_host_creation():
+                def _create_host_from_model(host_model, **kwargs):
+                    connection = Mock(
+                        **{"disconnect.side_effect": OSError("socket closed"), "__str__": lambda _: "rpyc"}
+                    )
+                    return SimpleNamespace(
+                        name=host_model.name, connection=connection, connections=None, power_mng=None
+                    )
+
+                original = plugin_fixtures.create_host_from_model
+                plugin_fixtures.create_host_from_model = _create_host_from_model
+                yield
+                plugin_fixtures.create_host_from_model = original
+            """
+        )
+        pytester.makepyfile(
+            """
+            def test_host(hosts):
+                pass
+            """
+        )
+        result = pytester.runpytest("-p", "pytest_mfd_config.fixtures")
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*connections not closed cleanly*", "sut rpyc: OSError: socket closed"])
+
+    def test_track_leaks_reports_still_open_connections(self, pytester):
+        pytester.makeconftest(
+            """
+            import pytest
+
+            import pytest_mfd_config.fixtures as plugin_fixtures
+            from pytest_mfd_config.models.topology import ConnectionModel, SwitchModel, PowerMngModel
+
+
+            class FakeConnection:
+                def __init__(self, **kwargs):
+                    pass
+
+                def __str__(self):
+                    return "fake"
+
+
+            @pytest.fixture(scope="session", autouse=True)
+            def fake_connection():
+                original = plugin_fixtures._establish_connection
+                plugin_fixtures._establish_connection = lambda *args: FakeConnection()
+                yield
+                plugin_fixtures._establish_connection = original
+
+
+            leaked = []
+
+
+            @pytest.fixture
+            def model():
+                return ConnectionModel(ip_address="10.10.10.10", connection_type="SSHConnection")
+            """
+        )
+        pytester.makepyfile(
+            """
+            import pytest_mfd_config.fixtures as plugin_fixtures
+            from conftest import leaked
+
+
+            def test_leak(model):
+                leaked.append(plugin_fixtures.get_connection_object(model, owner="sut"))
+
+
+            def test_no_leak(model):
+                plugin_fixtures.get_connection_object(model, owner="client")
+            """
+        )
+        result = pytester.runpytest("-p", "pytest_mfd_config.fixtures", "--track_leaks")
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(
+            ["*plugin-managed objects still open*", "sut SSHConnection fake, created at:", "*in test_leak*"]
+        )
+        result.stdout.no_fnmatch_line("client SSHConnection*")
+
+    def test_create_switch_from_model_caches_autodetected_device_type(self, mocker):
+        mocker.patch.object(switch_device_types, "_device_types", {})
+        switch_class = mocker.patch(
+            "mfd_switchmanagement.Cisco_NXOS",
+            return_value=mocker.Mock(_connection=mocker.Mock(_resolved_device_type="cisco_nxos")),
+            __name__="Cisco_NXOS",
+        )
+        switch_model = SwitchModel(
+            name="switch-1",
+            mng_ip_address="10.10.10.10",
+            switch_type="Cisco_NXOS",
+            connection_type="SSHSwitchConnection",
+        )
+        create_switch_from_model(switch_model)
+        assert switch_class.call_args.kwargs["device_type"] == "autodetect"
+        create_switch_from_model(switch_model)
+        assert switch_class.call_args.kwargs["device_type"] == "cisco_nxos"
+
+    def test_create_switch_from_model_cached_device_type_failure(self, mocker):
+        mocker.patch.object(switch_device_types, "_device_types", {"Cisco_NXOS@10.10.10.10": "cisco_ios"})
+        switch = mocker.Mock(_connection=mocker.Mock(_resolved_device_type="cisco_nxos"))
+        switch_class = mocker.patch(
+            "mfd_switchmanagement.Cisco_NXOS", side_effect=[TimeoutError("prompt"), switch], __name__="Cisco_NXOS"
+        )
+        switch_model = SwitchModel(
+            name="switch-1",
+            mng_ip_address="10.10.10.10",
+            switch_type="Cisco_NXOS",
+            connection_type="SSHSwitchConnection",
+        )
+        assert create_switch_from_model(switch_model) is switch
+        assert [call.kwargs["device_type"] for call in switch_class.call_args_list] == ["cisco_ios", "autodetect"]
+        assert switch_device_types.get("Cisco_NXOS@10.10.10.10") == "cisco_nxos"
+
+    def test_create_power_mng_from_model_lazy(self, mocker):
+        get_connection = mocker.patch("pytest_mfd_config.fixtures.get_connection_object")
+        # cache constructor signature before patching it
+        get_missing_init_parameters(mfd_powermanagement.Ipmi, [])
+        get_init_parameters(mfd_powermanagement.Ipmi)
+        ipmi_init = mocker.patch.object(mfd_powermanagement.Ipmi, "__init__", return_value=None)
+        powercycle = mocker.patch.object(mfd_powermanagement.Ipmi, "powercycle")
+        power_mng_model = PowerMngModel(
+            power_mng_type="Ipmi",
+            ip="10.10.10.10",
+            connection=ConnectionModel(ip_address="10.10.10.11", connection_type="SSHConnection"),
+        )
+        power_mng = create_power_mng_from_model(power_mng_model, lazy=True)
+        get_connection.assert_not_called()
+        ipmi_init.assert_not_called()
+        assert isinstance(power_mng, mfd_powermanagement.Ipmi)
+        power_mng.powercycle()
+        get_connection.assert_called_once_with(power_mng_model.connection, owner="10.10.10.10")
+        ipmi_init.assert_called_once_with(ip="10.10.10.10", connection=get_connection.return_value)
+        powercycle.assert_called_once()
+
+    def test_create_power_mng_from_model_lazy_validates_eagerly(self):
+        power_mng_model = PowerMngModel(power_mng_type="CCSG", ip="10.10.10.10")
+        with pytest.raises(
+            PyTestMFDConfigException, match="CCSG of sut requires missing parameters: password, username"
+        ):
+            create_power_mng_from_model(power_mng_model, owner="sut", lazy=True)
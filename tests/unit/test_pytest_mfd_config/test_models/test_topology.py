@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Tests for topology models."""
 
+import json
 import re
 
 import pytest
@@ -891,6 +892,25 @@ class TestTopology:
                 # missing osd_details
                 ConnectionModel(connection_type="RPyCConnection", mac_address="aa:bb:cc:dd:ee:ff")
 
+        def test_mfd_connect_references_resolved(self):
+            from mfd_connect.util import EFI_SHELL_PROMPT_REGEX
+
+            model = ConnectionModel(
+                connection_type="SerialConnection",
+                connection_options={"prompt": "mfd_connect.util.EFI_SHELL_PROMPT_REGEX", "login": "mfd_connect"},
+            )
+            assert dict(model.constructor_kwargs) == {"prompt": EFI_SHELL_PROMPT_REGEX, "login": "mfd_connect"}
+            assert model.connection_options["prompt"] == "mfd_connect.util.EFI_SHELL_PROMPT_REGEX"
+            assert json.loads(model.model_dump_json())["connection_options"]["prompt"] == (
+                "mfd_connect.util.EFI_SHELL_PROMPT_REGEX"
+            )
+
+            with pytest.raises(ValidationError, match="'mfd_connect.util.NOT_EXISTING' does not exist"):
+                ConnectionModel(
+                    connection_type="SerialConnection",
+                    connection_options={"prompt": "mfd_connect.util.NOT_EXISTING"},
+                )
+
     class TestSUTModel:
         """SUTModel Test class."""
 
@@ -0,0 +1,144 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test circuit breaker."""
+
+import pytest
+
+from pytest_mfd_config.exceptions import CircuitOpenError
+from pytest_mfd_config.utils.circuit_breaker import CircuitBreaker
+
+KEY = ("RPyCConnection", "10.10.10.10", None)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    @pytest.fixture()
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture()
+    def breaker(self, clock):
+        return CircuitBreaker(threshold=2, cooldown=30, clock=clock)
+
+    @staticmethod
+    def _fail():
+        raise ConnectionRefusedError("refused")
+
+    def test_disabled_breaker_calls_function(self, mocker):
+        breaker = CircuitBreaker()
+        func = mocker.Mock(side_effect=ConnectionRefusedError)
+        for _ in range(5):
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, func)
+        assert func.call_count == 5
+        assert breaker.events == []
+
+    def test_breaker_opens_after_threshold(self, breaker, mocker):
+        func = mocker.Mock(side_effect=ConnectionRefusedError("refused"))
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, func)
+        with pytest.raises(CircuitOpenError, match="Circuit breaker is open for .* after 2 failures"):
+            breaker.call(KEY, func)
+        assert func.call_count == 2
+        assert len(breaker.events) == 1
+        assert breaker.events[0].key == KEY
+        assert breaker.events[0].error == "ConnectionRefusedError: refused"
+
+    def test_success_resets_failures(self, breaker, mocker):
+        with pytest.raises(ConnectionRefusedError):
+            breaker.call(KEY, self._fail)
+        assert breaker.call(KEY, mocker.Mock(return_value="connection")) == "connection"
+        with pytest.raises(ConnectionRefusedError):
+            breaker.call(KEY, self._fail)
+        assert breaker.events == []
+
+    def test_breaker_is_keyed_by_endpoint(self, breaker, mocker):
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, self._fail)
+        assert breaker.call(("RPyCConnection", "10.10.10.11", None), mocker.Mock(return_value=1)) == 1
+
+    def test_half_open_after_cooldown(self, breaker, clock, mocker):
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, self._fail)
+        clock.now = 31
+        with pytest.raises(ConnectionRefusedError):
+            breaker.call(KEY, self._fail)
+        with pytest.raises(CircuitOpenError):
+            breaker.call(KEY, self._fail)
+        clock.now = 62
+        assert breaker.call(KEY, mocker.Mock(return_value="connection")) == "connection"
+        assert len(breaker.events) == 1
+
+    def test_half_open_allows_single_trial(self, breaker, clock, mocker):
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, self._fail)
+        clock.now = 31
+
+        def _trial():
+            with pytest.raises(CircuitOpenError, match="trial attempt is in progress"):
+                breaker.call(KEY, func)
+            return "connection"
+
+        func = mocker.Mock(side_effect=_trial)
+        assert breaker.call(KEY, func) == "connection"
+        func.assert_called_once()
+        assert breaker.call(KEY, mocker.Mock(return_value="connection")) == "connection"
+
+    def test_interrupted_trial_allows_next_trial(self, breaker, clock, mocker):
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, self._fail)
+        clock.now = 31
+        with pytest.raises(KeyboardInterrupt):
+            breaker.call(KEY, mocker.Mock(side_effect=KeyboardInterrupt))
+        assert breaker.call(KEY, mocker.Mock(return_value="connection")) == "connection"
+
+    def test_failures_of_open_breaker_do_not_add_events(self, breaker):
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, self._fail)
+        breaker.record_failure(KEY, ConnectionRefusedError("late attempt started before opening"))
+        assert len(breaker.events) == 1
+        with pytest.raises(CircuitOpenError, match="after 3 failures"):
+            breaker.check(KEY)
+
+    def test_abandoned_attempt_counted_once(self, breaker):
+        with breaker.attempt() as attempt:
+            breaker.abandon(KEY, TimeoutError("deadline"))
+            assert attempt.abandoned
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, self._fail)  # late outcome of abandoned attempt
+        with breaker.attempt():
+            breaker.abandon(KEY, TimeoutError("deadline"))
+            breaker.record_success(KEY)  # late success does not close breaker opened by abandoning
+        assert [event.failures for event in breaker.events] == [2]
+        with pytest.raises(CircuitOpenError, match="Last error: TimeoutError: deadline"):
+            breaker.check(KEY)
+
+    def test_finished_attempt_not_abandoned(self, breaker):
+        with breaker.attempt() as attempt:
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, self._fail)
+            breaker.abandon(KEY, TimeoutError("deadline"))
+        assert not attempt.abandoned
+        assert breaker.events == []
+
+    def test_configure_resets_states(self, breaker):
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                breaker.call(KEY, self._fail)
+        breaker.configure(threshold=None, cooldown=60)
+        assert not breaker.enabled
+        assert breaker.events == []
+        breaker.check(KEY)
@@ -14,6 +14,8 @@ from pytest_mfd_config.utils.config_utils import (
     _log_config,
     load_test_config,
     _hide_secrets,
+    Connections,
+    DegradedHosts,
 )
 from pytest_mfd_config.utils.exceptions import ObjectCantBeFoundError
 
@@ -179,3 +181,48 @@ class TestUtils:
             """
         )
         assert _hide_secrets(yaml_str) == yaml_str
+
+    def test_degraded_hosts(self):
+        hosts = DegradedHosts({"good": "host"}, failures={"bad": "ConnectionError: refused"})
+        assert hosts["good"] == "host"
+        assert list(hosts) == ["good"]
+        with pytest.raises(pytest.skip.Exception, match="Host 'bad' is unavailable: ConnectionError: refused"):
+            hosts["bad"]
+        with pytest.raises(KeyError):
+            hosts["unknown"]
+        with pytest.raises(pytest.skip.Exception, match="Host 'bad' is unavailable"):
+            hosts.get("bad")
+        assert hosts.get("unknown") is None
+        assert hosts.get("good") == "host"
+        assert "bad" not in hosts
+
+    def test_connections_replace(self, mocker):
+        rpyc, ssh, new_rpyc = (mocker.Mock(__str__=lambda _, kind=kind: kind) for kind in ("rpyc", "ssh", "rpyc"))
+        connections = Connections(_connections=[rpyc, ssh])
+        connections.replace([new_rpyc])
+        assert connections == Connections(_connections=[new_rpyc])
+        assert list(connections.pool("rpyc")) == [new_rpyc]
+
+    def test_connections_pool(self, mocker):
+        rpyc, ssh, rpyc2, rpyc_bmc, local = (
+            mocker.Mock(__str__=lambda _, kind=kind: kind, _ip=ip)
+            for kind, ip in (
+                ("rpyc", "10.10.10.10"),
+                ("ssh", "10.10.10.10"),
+                ("rpyc", "10.10.10.10"),
+                ("rpyc", "10.10.10.11"),
+                ("local", None),
+            )
+        )
+        local.model = None
+        connections = Connections(_connections=[rpyc_bmc, rpyc, ssh, rpyc2, local])
+        assert connections.rpyc is rpyc2
+        assert list(connections.pool("rpyc", policy="least_busy")) == [rpyc, rpyc2]
+        assert connections.pool("rpyc").policy == "least_busy"
+        assert list(connections.pool("rpyc", address="10.10.10.11")) == [rpyc_bmc]
+        assert list(connections.pool("local")) == [local]
+        assert connections.all() == [local, rpyc2, ssh, rpyc_bmc, rpyc]
+        with pytest.raises(KeyError, match="There is no telnet connection"):
+            connections.pool("telnet")
+        with pytest.raises(KeyError, match="There is no ssh connection to 10.10.10.11"):
+            connections.pool("ssh", address="10.10.10.11")
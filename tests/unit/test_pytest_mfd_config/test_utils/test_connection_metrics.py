@@ -0,0 +1,74 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test statistics of remote calls made via connections."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_mfd_config.utils.connection_metrics import ConnectionMetrics
+
+
+class _Connection:
+    def __init__(self):
+        self.calls = 0
+
+    def execute_command(self, command, **kwargs):
+        self.calls += 1
+        if command == "false":
+            raise RuntimeError("command failed")
+        return SimpleNamespace(stdout="ok\n", stderr="", return_code=0)
+
+    def execute_powershell(self, command, **kwargs):
+        return self.execute_command(f"powershell.exe -Command {command}", **kwargs)
+
+    def disconnect(self):
+        pass
+
+
+class TestConnectionMetrics:
+    def test_disabled(self):
+        connection = _Connection()
+        metrics = ConnectionMetrics()
+        assert metrics.instrument(connection, owner="sut", kind="SSHConnection") is connection
+        assert "execute_command" not in vars(connection)
+
+    def test_calls_recorded_per_owner_and_kind(self):
+        metrics = ConnectionMetrics(enabled=True)
+        sut, client = _Connection(), _Connection()
+        metrics.instrument(sut, owner="sut", kind="SSHConnection")
+        metrics.instrument(sut, owner="sut", kind="SSHConnection")
+        metrics.instrument(client, owner="client", kind="RPyCConnection")
+        assert isinstance(sut, _Connection)
+
+        assert sut.execute_command("uname").stdout == "ok\n"
+        sut.execute_command(command="hostname", shell=True)
+        with pytest.raises(RuntimeError):
+            sut.execute_command("false")
+        client.execute_command("ls")
+
+        assert sut.calls == 3
+        snapshot = metrics.snapshot()
+        stats = snapshot["sut"]["SSHConnection"]["execute_command"]
+        assert stats["count"] == 3 and stats["failures"] == 1
+        assert stats["bytes_sent"] == len("uname") + len("hostname") + len("false")
+        assert stats["bytes_received"] == 2 * len("ok\n")
+        assert stats["histogram"]["<=0.01s"] == 3 and sum(stats["histogram"].values()) == 3
+        assert list(metrics.snapshot("client")) == ["client"]
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_internal_calls_recorded_once(self):
+        metrics = ConnectionMetrics(enabled=True)
+        connection = _Connection()
+        metrics.instrument(connection, owner="sut", kind="RPyCConnection")
+        connection.execute_powershell("Get-NetAdapter")
+        with pytest.raises(RuntimeError):
+            connection.execute_command("false")
+        connection.execute_command("hostname")
+
+        stats = metrics.snapshot()["sut"]["RPyCConnection"]
+        assert sorted(stats) == ["execute_command", "execute_powershell"]
+        assert stats["execute_powershell"]["count"] == 1
+        assert stats["execute_powershell"]["bytes_sent"] == len("Get-NetAdapter")
+        assert stats["execute_command"]["count"] == 2 and stats["execute_command"]["failures"] == 1
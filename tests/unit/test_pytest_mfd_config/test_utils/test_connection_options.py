@@ -0,0 +1,93 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test handling of connection options."""
+
+import importlib
+
+import pytest
+from mfd_connect import SSHConnection
+from pydantic import SecretStr
+from mfd_connect.util import EFI_SHELL_PROMPT_REGEX
+
+from pytest_mfd_config.models.topology import ConnectionModel
+from pytest_mfd_config.utils.connection_options import (
+    build_constructor_kwargs,
+    resolve_connection_options,
+    resolve_mfd_connect_reference,
+)
+
+
+class TestConnectionOptions:
+    def test_resolve_mfd_connect_reference(self):
+        assert resolve_mfd_connect_reference("mfd_connect.util.EFI_SHELL_PROMPT_REGEX") is EFI_SHELL_PROMPT_REGEX
+        assert resolve_mfd_connect_reference("mfd_connect.SSHConnection") is SSHConnection
+
+    def test_resolve_mfd_connect_reference_cached(self, mocker):
+        import_module = mocker.patch(
+            "pytest_mfd_config.utils.connection_options.importlib.import_module", wraps=importlib.import_module
+        )
+        resolve_mfd_connect_reference.cache_clear()
+        for _ in range(3):
+            resolve_mfd_connect_reference("mfd_connect.util.UNIX_PROMPT_REGEX")
+        assert import_module.call_count == 1
+
+    @pytest.mark.parametrize(
+        "reference",
+        [
+            "mfd_connect.util.__builtins__",
+            "mfd_connect.util._private",
+            "mfd_connect.util.EFI_SHELL_PROMPT_REGEX.pattern + 'x'",
+            "mfd_connect.os.system('reboot')",
+            "mfd_connect.",
+        ],
+    )
+    def test_resolve_mfd_connect_reference_rejects_expressions(self, reference):
+        with pytest.raises(ValueError, match="is not a dotted path of public object from mfd_connect"):
+            resolve_mfd_connect_reference(reference)
+
+    def test_resolve_mfd_connect_reference_not_existing(self):
+        with pytest.raises(ValueError, match="Cannot resolve 'mfd_connect.not_existing.X'"):
+            resolve_mfd_connect_reference("mfd_connect.not_existing.X")
+
+    def test_resolve_connection_options(self):
+        options = {"prompt": "mfd_connect.util.EFI_SHELL_PROMPT_REGEX", "path": "/opt/mfd_connect", "port": 22}
+        resolved = resolve_connection_options(options)
+        assert resolved == {"prompt": EFI_SHELL_PROMPT_REGEX, "path": "/opt/mfd_connect", "port": 22}
+        assert options["prompt"] == "mfd_connect.util.EFI_SHELL_PROMPT_REGEX"
+
+    def test_build_constructor_kwargs(self):
+        connection_model = ConnectionModel(
+            connection_type="SSHConnection",
+            ip_address="10.10.10.10",
+            connection_options={"username": "root", "password": "secret", "jump_host_password": ""},
+        )
+        kwargs = build_constructor_kwargs(connection_model)
+        assert dict(kwargs) == {
+            "username": "root",
+            "password": "secret",
+            "jump_host_password": "",
+            "ip": "10.10.10.10",
+        }
+        with pytest.raises(TypeError):
+            kwargs["ip"] = "10.10.10.11"
+        assert connection_model.constructor_kwargs == kwargs
+
+    def test_constructor_kwargs_rebuilt_on_model_copy(self):
+        connection_model = ConnectionModel(
+            connection_type="SSHConnection", ip_address="10.10.10.10", connection_options={"password": "encrypted"}
+        )
+        copied = connection_model.model_copy(update={"connection_options": {"password": SecretStr("decrypted")}})
+        assert copied.constructor_kwargs["password"] == "decrypted"
+        assert connection_model.constructor_kwargs["password"] == "encrypted"
+
+    def test_constructor_kwargs_rebuilt_after_fields_changed(self):
+        connection_model = ConnectionModel(
+            connection_type="SSHConnection", ip_address="10.0.0.1", connection_options={"password": "old"}
+        )
+        kwargs = connection_model.constructor_kwargs
+        assert connection_model.constructor_kwargs is kwargs
+        connection_model.ip_address = "10.0.0.2"
+        connection_model.connection_options["password"] = SecretStr("new")
+        assert dict(connection_model.constructor_kwargs) == {"ip": "10.0.0.2", "password": "new"}
+        connection_model.connection_options = {"password": "newest"}
+        assert connection_model.constructor_kwargs["password"] == "newest"
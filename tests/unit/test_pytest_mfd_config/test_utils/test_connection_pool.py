@@ -0,0 +1,42 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test pool of connections of the same type."""
+
+import threading
+
+import pytest
+
+from pytest_mfd_config.utils.connection_pool import ConnectionPool
+
+
+class TestConnectionPool:
+    def test_round_robin(self):
+        pool = ConnectionPool(["rpyc0", "rpyc1", "rpyc2"])
+        assert [pool.get() for _ in range(4)] == ["rpyc0", "rpyc1", "rpyc2", "rpyc0"]
+
+    def test_least_busy(self):
+        pool = ConnectionPool(["rpyc0", "rpyc1"], policy="least_busy")
+        with pool.acquire() as first:
+            with pool.acquire() as second:
+                assert (first, second) == ("rpyc0", "rpyc1")
+            with pool.acquire() as third:
+                assert third == "rpyc1"
+        assert pool.get() == "rpyc0"
+
+    def test_execute_command_in_parallel(self, mocker):
+        barrier = threading.Barrier(2, timeout=1)
+        connections = [mocker.Mock(**{"execute_command.side_effect": lambda command: barrier.wait()}) for _ in "ab"]
+        pool = ConnectionPool(connections, policy="least_busy")
+        threads = [threading.Thread(target=pool.execute_command, args=("iperf3 -c 1.1.1.1",)) for _ in "ab"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for connection in connections:
+            connection.execute_command.assert_called_once_with("iperf3 -c 1.1.1.1")
+
+    def test_wrong_parameters(self):
+        with pytest.raises(ValueError, match="at least one connection"):
+            ConnectionPool([])
+        with pytest.raises(ValueError, match="Unknown selection policy 'random'"):
+            ConnectionPool(["rpyc"], policy="random")
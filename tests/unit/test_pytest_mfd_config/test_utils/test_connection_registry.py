@@ -0,0 +1,115 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test connection registry."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_mfd_config.models.topology import ConnectionModel
+from pytest_mfd_config.utils.connection_registry import (
+    ConnectionRegistry,
+    connection_fingerprint,
+    is_connection_alive,
+)
+
+
+class TestConnectionRegistry:
+    @pytest.fixture()
+    def registry(self):
+        return ConnectionRegistry(enabled=True)
+
+    def test_connection_fingerprint_is_stable(self):
+        first = ConnectionModel(
+            ip_address="10.10.10.10",
+            connection_type="SSHConnection",
+            connection_options={"username": "root", "password": "s3cr3t", "port": 22},
+        )
+        second = ConnectionModel(
+            ip_address="10.10.10.10",
+            connection_type="SSHConnection",
+            connection_options={"port": 22, "password": "s3cr3t", "username": "root"},
+        )
+        assert connection_fingerprint(first) == connection_fingerprint(second)
+        assert "s3cr3t" not in str(connection_fingerprint(first))
+
+    def test_connection_fingerprint_differs(self):
+        rpyc = ConnectionModel(ip_address="10.10.10.10", connection_type="RPyCConnection")
+        ssh = ConnectionModel(ip_address="10.10.10.10", connection_type="SSHConnection")
+        other_ip = ConnectionModel(ip_address="10.10.10.11", connection_type="RPyCConnection")
+        serial = ConnectionModel(connection_type="SerialConnection", relative_connection_id=1)
+        parent_1 = SimpleNamespace(model=rpyc)
+        parent_2 = SimpleNamespace(model=other_ip)
+        fingerprints = {
+            connection_fingerprint(rpyc),
+            connection_fingerprint(ssh),
+            connection_fingerprint(other_ip),
+            connection_fingerprint(serial, parent_1),
+            connection_fingerprint(serial, parent_2),
+        }
+        assert len(fingerprints) == 5
+
+    def test_is_connection_alive(self, mocker):
+        assert is_connection_alive(SimpleNamespace()) is True
+        assert is_connection_alive(SimpleNamespace(_connection=SimpleNamespace(closed=True))) is False
+        assert is_connection_alive(SimpleNamespace(_connection=SimpleNamespace(closed=False))) is True
+        transport = mocker.Mock(**{"is_active.return_value": False})
+        ssh_client = SimpleNamespace(get_transport=lambda: transport)
+        assert is_connection_alive(SimpleNamespace(_connection=ssh_client)) is False
+        assert is_connection_alive(SimpleNamespace(_connection=SimpleNamespace(get_transport=lambda: None))) is False
+
+    def test_acquire_reuses_live_connection(self, registry, mocker):
+        factory = mocker.Mock(side_effect=lambda: SimpleNamespace())
+        first = registry.acquire("key", factory)
+        assert registry.acquire("key", factory) is first
+        factory.assert_called_once()
+        assert registry.release(first) is False
+        assert registry.release(first) is True
+        assert registry.connections() == []
+
+    def test_acquire_fresh(self, registry, mocker):
+        factory = mocker.Mock(side_effect=lambda: SimpleNamespace())
+        first = registry.acquire("key", factory)
+        second = registry.acquire("key", factory, fresh=True)
+        assert first is not second
+        assert registry.acquire("key", factory) is second
+        assert registry.connections() == [first, second]
+        assert registry.release(first) is True
+        assert registry.connections() == [second]
+
+    def test_acquire_fresh_keeps_shared_connection_registered(self, registry, mocker):
+        factory = mocker.Mock(side_effect=lambda: SimpleNamespace())
+        shared = registry.acquire("key", factory)
+        assert registry.acquire("key", factory) is shared
+        fresh = registry.acquire("key", factory, fresh=True)
+        assert registry.release(shared) is False
+        assert registry.release(shared) is True
+        assert registry.release(fresh) is True
+        assert registry.connections() == []
+
+    def test_acquire_replaces_dead_connection(self, registry):
+        dead = SimpleNamespace(_connection=SimpleNamespace(closed=True))
+        registry.acquire("key", lambda: dead)
+        assert registry.acquire("key", lambda: dead) is dead
+        alive = registry.acquire("key", SimpleNamespace)
+        assert alive is not dead
+        assert registry.connections() == [alive]
+        assert registry.acquire("key", SimpleNamespace) is alive
+        assert registry.release(dead) is True
+        assert registry.release(dead) is True
+        assert registry.connections() == [alive]
+
+    def test_acquire_fresh_removes_dead_connection(self, registry):
+        dead = SimpleNamespace(_connection=SimpleNamespace(closed=True))
+        registry.acquire("key", lambda: dead)
+        fresh = registry.acquire("key", SimpleNamespace, fresh=True)
+        assert registry.connections() == [fresh]
+
+    def test_release_not_registered(self, registry):
+        assert registry.release(SimpleNamespace()) is True
+
+    def test_configure_forgets_connections(self, registry):
+        registry.acquire("key", SimpleNamespace)
+        registry.configure(enabled=False)
+        assert registry.connections() == []
+        assert registry.enabled is False
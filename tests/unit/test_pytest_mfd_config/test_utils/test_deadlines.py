@@ -0,0 +1,124 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test setup deadlines."""
+
+import threading
+
+import pytest
+
+from pytest_mfd_config.exceptions import SetupDeadlineExceededError
+from pytest_mfd_config.utils.deadlines import (
+    SetupDeadlines,
+    parse_setup_deadlines,
+    run_with_deadline,
+    run_concurrently,
+)
+
+
+class TestDeadlines:
+    def test_parse_setup_deadlines(self):
+        assert parse_setup_deadlines("RPyCConnection=60, switch=120,default=2.5") == {
+            "RPyCConnection": 60.0,
+            "switch": 120.0,
+            "default": 2.5,
+        }
+        assert parse_setup_deadlines(None) == {}
+
+    def test_parse_setup_deadlines_wrong_format(self):
+        with pytest.raises(ValueError, match="Cannot parse setup deadline 'switch:120'"):
+            parse_setup_deadlines("switch:120")
+
+    def test_setup_deadlines_get(self):
+        deadlines = SetupDeadlines({"switch": 120})
+        assert deadlines.get("switch") == 120
+        assert deadlines.get("SSHConnection") is None
+        deadlines.configure({"default": 10})
+        assert deadlines.get("switch") == 10
+        assert deadlines.get("SSHConnection") == 10
+
+    def test_run_with_deadline_without_deadline_calls_directly(self):
+        assert run_with_deadline(threading.current_thread, deadline=None, description="x") is threading.current_thread()
+
+    def test_run_with_deadline_returns_result(self):
+        assert run_with_deadline(lambda a, b: a + b, 1, b=2, deadline=1, description="x") == 3
+
+    def test_run_with_deadline_reraises_error(self):
+        def _fail():
+            raise ConnectionError("refused")
+
+        with pytest.raises(ConnectionError, match="refused"):
+            run_with_deadline(_fail, deadline=1, description="x")
+
+    def test_run_with_deadline_exceeded(self):
+        release = threading.Event()
+        try:
+            with pytest.raises(
+                SetupDeadlineExceededError,
+                match=r"Host 'sut' connection_id=1 \(SerialConnection\) phase 'connection' did not finish within",
+            ):
+                run_with_deadline(
+                    release.wait,
+                    deadline=0.05,
+                    description="Host 'sut' connection_id=1 (SerialConnection) phase 'connection'",
+                )
+        finally:
+            release.set()
+
+    def test_run_with_deadline_late_result(self):
+        release, cleaned = threading.Event(), threading.Event()
+        late_results = []
+
+        def _cleanup(result):
+            late_results.append(result)
+            cleaned.set()
+
+        with pytest.raises(SetupDeadlineExceededError):
+            run_with_deadline(
+                lambda: release.wait() and "connection", deadline=0.05, description="x", on_late_result=_cleanup
+            )
+        release.set()
+        assert cleaned.wait(1)
+        assert late_results == ["connection"]
+
+    def test_run_with_deadline_result_in_time_not_cleaned(self, mocker):
+        cleanup = mocker.Mock()
+        result = run_with_deadline(lambda: "connection", deadline=1, description="x", on_late_result=cleanup)
+        assert result == "connection"
+        cleanup.assert_not_called()
+
+    def test_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=1)
+
+        def _fail():
+            raise ConnectionError("refused")
+
+        outcomes = run_concurrently({"a": barrier.wait, "b": barrier.wait, "c": _fail}, deadline=1)
+        assert outcomes["a"].finished and outcomes["b"].finished
+        assert outcomes["a"].error is None and outcomes["b"].error is None
+        assert isinstance(outcomes["c"].error, ConnectionError)
+
+    def test_run_concurrently_deadline(self):
+        release = threading.Event()
+        try:
+            outcomes = run_concurrently({"hung": release.wait, "fast": lambda: 1}, deadline=0.05, name="probe")
+        finally:
+            release.set()
+        assert outcomes["fast"].result == 1
+        assert isinstance(outcomes["hung"].error, TimeoutError)
+        assert "probe of hung did not finish within deadline" in str(outcomes["hung"].error)
+
+    def test_run_concurrently_max_workers(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def _call():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            threading.Event().wait(0.01)
+            with lock:
+                running.pop()
+
+        run_concurrently({index: _call for index in range(6)}, max_workers=2)
+        assert max(peak) <= 2
@@ -0,0 +1,84 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test streaming of extra_data into JSON Lines file."""
+
+import json
+import threading
+
+from pytest_mfd_config.utils.extra_data_sink import ExtraDataSink
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _submit(sink, record):
+    sink.submit(*sink.serialize(record))
+
+
+class TestExtraDataSink:
+    def test_disabled_by_default(self):
+        sink = ExtraDataSink()
+        assert not sink.enabled
+        sink.submit('{"nodeid": "test_a"}\n')
+        sink.stop()
+
+    def test_records_written_in_order(self, tmp_path):
+        path = tmp_path / "extra_data.jsonl"
+        sink = ExtraDataSink()
+        sink.configure(str(path))
+        for index in range(50):
+            _submit(sink, {"nodeid": f"test_{index}", "extra_data": {"nvm": index, "path": tmp_path}})
+        sink.flush()
+        records = _read(path)
+        assert [record["nodeid"] for record in records] == [f"test_{index}" for index in range(50)]
+        assert records[0]["extra_data"] == {"nvm": 0, "path": str(tmp_path)}
+        assert sink.stats.written == 50
+        sink.stop()
+        assert not sink.enabled
+
+    def test_size_limits(self, tmp_path):
+        path = tmp_path / "extra_data.jsonl"
+        sink = ExtraDataSink()
+        sink.configure(str(path), max_record_size=100, max_file_size=150)
+        _submit(sink, {"nodeid": "test_small", "extra_data": {"nvm": 1}})
+        _submit(sink, {"nodeid": "test_big", "extra_data": {"log": "x" * 1000}})
+        _submit(sink, {"nodeid": "test_overflow", "extra_data": {"nvm": 2}})
+        sink.stop()
+        records = _read(path)
+        assert records[0] == {"nodeid": "test_small", "extra_data": {"nvm": 1}}
+        assert records[1]["nodeid"] == "test_big" and records[1]["extra_data_truncated"] > 1000
+        assert len(records) == 2
+        assert (sink.stats.written, sink.stats.truncated, sink.stats.dropped) == (2, 1, 1)
+
+    def test_bounded_queue_drops_records(self, tmp_path, mocker):
+        sink = ExtraDataSink(queue_size=1, put_timeout=0.01)
+        release = threading.Event()
+        mocker.patch.object(sink, "_write", side_effect=lambda line: release.wait(1))
+        sink.configure(str(tmp_path / "extra_data.jsonl"))
+        for index in range(5):
+            _submit(sink, {"nodeid": f"test_{index}"})
+        release.set()
+        sink.stop()
+        assert sink.stats.dropped >= 3
+
+    def test_record_serialized_by_caller(self, tmp_path):
+        path = tmp_path / "extra_data.jsonl"
+        sink = ExtraDataSink()
+        sink.configure(str(path))
+        data = {"nvm": 1}
+        _submit(sink, {"nodeid": "test_a", "extra_data": data})
+        data["teardown"] = True
+        sink.stop()
+        assert _read(path) == [{"nodeid": "test_a", "extra_data": {"nvm": 1}}]
+
+    def test_without_writer(self, tmp_path):
+        path = tmp_path / "extra_data.jsonl"
+        sink = ExtraDataSink()
+        sink.configure(str(path), writer=False)
+        assert sink.enabled and not sink.writing
+        line, truncated = sink.serialize({"nodeid": "test_a"})
+        assert json.loads(line) == {"nodeid": "test_a"} and not truncated
+        sink.submit(line)
+        sink.stop()
+        assert not path.exists()
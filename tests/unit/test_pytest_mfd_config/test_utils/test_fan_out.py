@@ -0,0 +1,68 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test running the same command or function on many hosts concurrently."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from pytest_mfd_config.utils.fan_out import FanOut, run_on_hosts, unique_hosts
+
+
+def _host(mocker, name):
+    return SimpleNamespace(name=name, connection=mocker.Mock())
+
+
+class TestFanOut:
+    def test_unique_hosts_from_pairs(self, mocker):
+        sut, client, client2 = _host(mocker, "sut"), _host(mocker, "client"), _host(mocker, "client2")
+        assert unique_hosts([(sut, client), (sut, client2)]) == [sut, client, client2]
+        assert unique_hosts({"sut": sut}) == [sut]
+
+    def test_command_run_concurrently(self, mocker):
+        barrier = threading.Barrier(2, timeout=1)
+        hosts = {"sut": _host(mocker, "sut"), "client": _host(mocker, "client")}
+        for host in hosts.values():
+            host.connection.execute_command.side_effect = lambda command, **kwargs: barrier.wait()
+
+        results = FanOut(hosts).run("ip link show", shell=True)
+
+        assert all(result.ok for result in results.values())
+        hosts["sut"].connection.execute_command.assert_called_once_with("ip link show", shell=True)
+
+    def test_errors_collected(self, mocker):
+        sut, client = _host(mocker, "sut"), _host(mocker, "client")
+
+        def _check(host, expected):
+            if host.name == "client":
+                raise ValueError(f"{expected} not found")
+            return expected
+
+        results = run_on_hosts([sut, client], _check, expected="eth1")
+        assert results["sut"].result == "eth1"
+        assert isinstance(results["client"].error, ValueError) and not results["client"].ok
+
+    def test_deadline_per_host(self, mocker):
+        sut, client = _host(mocker, "sut"), _host(mocker, "client")
+        results = run_on_hosts([sut, client], lambda host: time.sleep(0.5 if host is client else 0), deadline=0.1)
+        assert results["sut"].ok
+        assert isinstance(results["client"].error, TimeoutError)
+        assert results["client"].duration == 0.1
+
+    def test_timeout_passed_to_execute_command(self, mocker):
+        hosts = {"sut": _host(mocker, "sut")}
+        FanOut(hosts).run("ping -c 3 10.0.0.1", deadline=60, timeout=30)
+        hosts["sut"].connection.execute_command.assert_called_once_with("ping -c 3 10.0.0.1", timeout=30)
+
+    def test_results_not_changed_by_abandoned_host(self, mocker):
+        finished = threading.Event()
+        client = _host(mocker, "client")
+
+        def _slow(host):
+            time.sleep(0.2)
+            finished.set()
+
+        results = run_on_hosts([client], _slow, deadline=0.05)
+        assert finished.wait(timeout=1)
+        time.sleep(0.05)
+        assert results["client"].duration == 0.05
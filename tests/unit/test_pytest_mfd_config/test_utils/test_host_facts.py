@@ -0,0 +1,138 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test session cache of host facts."""
+
+from types import SimpleNamespace
+
+import pytest
+from mfd_typing import OSType
+
+from pytest_mfd_config.utils.host_facts import (
+    HostFacts,
+    invalidate_host_facts,
+    invalidate_on_power_actions,
+    parse_facts,
+)
+from pytest_mfd_config.utils.power_mng import LazyPowerManagement
+
+OUTPUT = (
+    "os_name=Linux\nkernel_version=6.8.0\ncpu_count=16\nhostname=sut\n"
+    "driver.eth1=ice\ndriver_version.eth1=1.14.9\ndriver.eth2=\n"
+)
+
+
+class _Connection:
+    def __init__(self, os_type=OSType.POSIX):
+        self.os_type = os_type
+        self.commands = []
+
+    def get_os_type(self):
+        return self.os_type
+
+    def execute_command(self, command, **kwargs):
+        self.commands.append(command)
+        return SimpleNamespace(stdout=OUTPUT, stderr="", return_code=0)
+
+    def execute_powershell(self, command, **kwargs):
+        return self.execute_command(command, **kwargs)
+
+
+class _PowerMng:
+    def __init__(self):
+        self.cycles = 0
+
+    def power_cycle(self):
+        self.cycles += 1
+        return True
+
+
+def _host(name="sut", connection=None):
+    topology = SimpleNamespace(network_interfaces=[SimpleNamespace(interface_name="eth1")])
+    return SimpleNamespace(name=name, connection=connection or _Connection(), topology=topology)
+
+
+class TestHostFacts:
+    def test_parse_facts(self):
+        facts = parse_facts(OUTPUT + "garbage\ncpu_count_extra=1\n")
+        assert facts == {
+            "os_name": "Linux",
+            "kernel_version": "6.8.0",
+            "cpu_count": 16,
+            "hostname": "sut",
+            "drivers": {"eth1": {"driver": "ice", "version": "1.14.9"}},
+        }
+        assert parse_facts("cpu_count=unknown\n")["cpu_count"] is None
+
+    @pytest.mark.parametrize("os_type", [OSType.POSIX, OSType.WINDOWS])
+    def test_gathered_once(self, os_type):
+        host = _host(connection=_Connection(os_type))
+        facts = HostFacts(host, owner="sut")
+        assert not facts.cached
+        assert facts.os_name == "Linux"
+        assert facts.cpu_count == 16
+        assert facts.drivers["eth1"]["driver"] == "ice"
+        assert facts.hostname == "sut" and facts.kernel_version == "6.8.0"
+        assert len(host.connection.commands) == 1
+        assert "eth1" in host.connection.commands[0]
+        assert facts.cached
+
+    def test_unsupported_os(self):
+        facts = HostFacts(_host(connection=_Connection(OSType.SWITCH)), owner="sut")
+        with pytest.raises(NotImplementedError):
+            facts.all()
+
+    def test_invalidated_when_connection_replaced(self):
+        host = _host()
+        facts = HostFacts(host, owner="sut")
+        facts.all()
+        host.connection = _Connection()
+        assert not facts.cached
+        facts.all()
+        assert len(host.connection.commands) == 1
+
+    def test_invalidate_and_refresh(self):
+        host = _host()
+        facts = HostFacts(host, owner="sut")
+        facts.all()
+        invalidate_host_facts(_Connection())
+        assert facts.cached
+        invalidate_host_facts(host.connection)
+        assert not facts.cached
+        facts.refresh()
+        assert len(host.connection.commands) == 2
+
+    def test_invalidate_hosts_with_same_name(self):
+        first, second = _host(), _host()
+        second.connections = [first.connection]
+        first_facts, second_facts = HostFacts(first, owner="sut"), HostFacts(second, owner="sut")
+        first_facts.all()
+        second_facts.all()
+        invalidate_host_facts(first.connection)
+        assert not first_facts.cached and not second_facts.cached
+
+    def test_invalidated_on_power_action(self):
+        host = _host()
+        facts = HostFacts(host, owner="sut")
+        power_mng = _PowerMng()
+        invalidate_on_power_actions(power_mng, facts.invalidate)
+        facts.all()
+        assert power_mng.power_cycle() is True
+        assert power_mng.cycles == 1
+        assert not facts.cached
+
+    def test_lazy_power_mng_not_created_by_wrapping(self):
+        created = []
+
+        def _factory():
+            created.append(_PowerMng())
+            return created[-1]
+
+        host = _host()
+        facts = HostFacts(host, owner="sut")
+        power_mng = LazyPowerManagement(_PowerMng, _factory)
+        invalidate_on_power_actions(power_mng, facts.invalidate)
+        assert not power_mng.created
+        facts.all()
+        power_mng.power_cycle()
+        assert created[0].cycles == 1
+        assert not facts.cached
@@ -0,0 +1,119 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test routing of log records into per-host log files."""
+
+import gzip
+import logging
+
+import pytest
+from mfd_common_libs import log_levels
+
+from pytest_mfd_config.utils.deadlines import run_concurrently
+from pytest_mfd_config.utils.host_logs import HostLogRouter, log_owner
+from pytest_mfd_config.utils.queued_logging import queued_logging
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(level=1)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record.getMessage())
+
+
+def _record(msg, level=log_levels.CMD, name="mfd_connect.ssh", **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def router(tmp_path):
+    main = _ListHandler()
+    main.setFormatter(logging.Formatter("%(levelno)s %(message)s"))
+    router = HostLogRouter()
+    router.configure(str(tmp_path / "hosts"), main)
+    yield router, main
+    router.configure(None)
+
+
+class TestHostLogRouter:
+    def test_records_routed_by_owner(self, router, tmp_path):
+        router, main = router
+        router.register_address("10.10.10.1", "sut")
+        router.register_address("10.10.10.11", "client")
+        main.handle(_record("Executing >10.10.10.11> 'uname'"))
+        main.handle(_record("Linux", level=log_levels.OUT))
+        main.handle(_record("Executing >10.10.10.1> 'uname'"))
+        main.handle(_record("Link down", level=logging.WARNING, name="tests", host_log_owner="client"))
+        main.handle(_record("Session started", level=logging.INFO, name="tests"))
+        with log_owner("Cisco_NX_1"):
+            run_concurrently({"switch": lambda: main.handle(_record("show vlan", name="mfd_switchmanagement"))})
+        router.stop()
+
+        assert main.records == ["Link down", "Session started"]
+        assert (tmp_path / "hosts" / "client.log").read_text().splitlines() == [
+            "12 Executing >10.10.10.11> 'uname'",
+            "11 Linux",
+            "30 Link down",
+        ]
+        assert (tmp_path / "hosts" / "sut.log").read_text() == "12 Executing >10.10.10.1> 'uname'\n"
+        assert (tmp_path / "hosts" / "Cisco_NX_1.log").read_text() == "12 show vlan\n"
+        assert {owner: stats.records for owner, stats in router.stats.items()} == {
+            "client": 3,
+            "sut": 1,
+            "Cisco_NX_1": 1,
+        }
+        assert main.filters == []
+
+    def test_rotated_files_compressed(self, tmp_path):
+        main = _ListHandler()
+        router = HostLogRouter()
+        router.configure(str(tmp_path), main, max_bytes=100, backup_count=2)
+        with log_owner("sut"):
+            for index in range(30):
+                main.handle(_record(f"command {index:02}"))
+        router.stop()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["sut.log", "sut.log.1.gz", "sut.log.2.gz"]
+        assert "command 29" in (tmp_path / "sut.log").read_text()
+        assert gzip.decompress((tmp_path / "sut.log.1.gz").read_bytes()).decode().startswith("command")
+
+    def test_last_owner_forgotten_after_log_owner(self, router, tmp_path):
+        router, main = router
+        router.register_address("10.10.10.1", "sut")
+        main.handle(_record("Executing >10.10.10.1> 'uname'"))
+        main.handle(_record("Linux", level=log_levels.OUT))
+        with log_owner("client"):
+            main.handle(_record("Executing 'ip a'"))
+        main.handle(_record("Not attributed", level=log_levels.OUT))
+        router.stop()
+        assert main.records == ["Not attributed"]
+        assert (tmp_path / "hosts" / "sut.log").read_text().splitlines() == [
+            "12 Executing >10.10.10.1> 'uname'",
+            "11 Linux",
+        ]
+
+    def test_worker_id_in_file_names(self, tmp_path):
+        main = _ListHandler()
+        router = HostLogRouter()
+        router.configure(str(tmp_path), main, worker_id="gw0")
+        with log_owner("Cisco NX 1"):
+            main.handle(_record("show vlan"))
+        router.stop()
+        assert [path.name for path in tmp_path.iterdir()] == ["Cisco_NX_1.gw0.log"]
+        assert router.stats["Cisco NX 1"].path == str(tmp_path / "Cisco_NX_1.gw0.log")
+
+    def test_routed_records_queued(self, router, tmp_path):
+        router, main = router
+        queued_logging.configure([main])
+        try:
+            with log_owner("sut"):
+                main.handle(_record("ip link show"))
+            main.handle(_record("not attributed", level=log_levels.MODULE_DEBUG, name="tests"))
+            queued_logging.flush()
+        finally:
+            queued_logging.stop()
+        router.stop()
+        assert main.records[0] == "not attributed"
+        assert (tmp_path / "hosts" / "sut.log").read_text() == "12 ip link show\n"
@@ -0,0 +1,154 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test keepalive of connections."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_mfd_config.utils.keepalive import KeepaliveMonitor, get_reconnect, send_keepalive
+
+
+class RPyCLike:
+    def __init__(self):
+        self.closed = False
+        self.pings = 0
+
+    def ping(self, timeout):
+        if self.closed:
+            raise EOFError("stream has been closed")
+        self.pings += 1
+
+
+class Connection:
+    def __init__(self, inner=None):
+        self._connection = inner
+        self.reconnects = 0
+
+    def _reconnect(self):
+        self.reconnects += 1
+        self._connection = RPyCLike()
+
+
+class TestKeepalive:
+    def test_send_keepalive_rpyc(self):
+        connection = Connection(RPyCLike())
+        send_keepalive(connection)
+        assert connection._connection.pings == 1
+        connection._connection.closed = True
+        with pytest.raises(ConnectionError, match="RPyC connection is closed"):
+            send_keepalive(connection)
+
+    def test_send_keepalive_ssh(self, mocker):
+        transport = mocker.Mock(**{"is_active.return_value": True})
+        send_keepalive(Connection(SimpleNamespace(get_transport=lambda: transport)))
+        transport.send_ignore.assert_called_once()
+        transport.is_active.return_value = False
+        with pytest.raises(ConnectionError, match="SSH transport is not active"):
+            send_keepalive(Connection(SimpleNamespace(get_transport=lambda: transport)))
+
+    def test_send_keepalive_switch(self, mocker):
+        transport = mocker.Mock(**{"is_active.return_value": True})
+        netmiko = SimpleNamespace(remote_conn_pre=SimpleNamespace(get_transport=lambda: transport))
+        switch = SimpleNamespace(_connection=SimpleNamespace(_connection=netmiko))
+        send_keepalive(switch)
+        transport.send_ignore.assert_called_once()
+
+    def test_get_reconnect(self):
+        connection = Connection()
+        get_reconnect(connection)(connection)
+        assert connection.reconnects == 1
+        switch = SimpleNamespace(_connection=Connection())
+        get_reconnect(switch)(switch)
+        assert switch._connection.reconnects == 1
+        assert get_reconnect(SimpleNamespace(_connection=None)) is None
+
+    def test_register_disabled(self):
+        monitor = KeepaliveMonitor()
+        connection = Connection(RPyCLike())
+        assert monitor.register(connection, owner="sut", kind="RPyCConnection") is connection
+        assert monitor._live_targets() == []
+
+    def test_register_not_reconnectable(self):
+        monitor = KeepaliveMonitor(interval=3600)
+        monitor.register(SimpleNamespace(_connection=None), owner="sut", kind="SerialConnection")
+        assert monitor._live_targets() == []
+
+    def test_dropped_connection_is_reconnected(self, mocker):
+        monitor = KeepaliveMonitor(interval=3600)
+        connection = Connection(RPyCLike())
+        facts = mocker.Mock(**{"uses.side_effect": lambda obj: obj is connection})
+        mocker.patch("pytest_mfd_config.utils.host_facts._all_facts", {facts})
+        monitor.register(connection, owner="sut", kind="RPyCConnection")
+        try:
+            connection._connection.closed = True
+            monitor.check()
+            assert monitor._live_targets()[0].dead
+            monitor.reconnect_dead()
+        finally:
+            monitor.stop()
+        assert connection.reconnects == 1
+        facts.invalidate.assert_called_once()
+        assert not monitor._live_targets()[0].dead
+        stats = monitor.stats[("sut", "RPyCConnection")]
+        assert (stats.reconnects, stats.failures) == (1, 0)
+        assert stats.average_latency == stats.total_latency
+
+    def test_reconnect_failure_is_recorded(self, mocker):
+        monitor = KeepaliveMonitor(interval=3600)
+        connection = Connection(RPyCLike())
+        connection._reconnect = mocker.Mock(side_effect=ConnectionRefusedError("refused"))
+        monitor.register(connection, owner="sut", kind="RPyCConnection")
+        try:
+            connection._connection.closed = True
+            monitor.reconnect_dead()
+        finally:
+            monitor.stop()
+        assert monitor.stats[("sut", "RPyCConnection")].failures == 1
+        assert monitor._live_targets()[0].obj is connection
+
+    def test_slow_ping_does_not_block_reconnect_of_other_connection(self):
+        monitor = KeepaliveMonitor(interval=3600)
+        hung, dropped = Connection(RPyCLike()), Connection(RPyCLike())
+        pinging, release, pinged = threading.Event(), threading.Event(), threading.Event()
+
+        def _slow_ping(timeout):
+            pinging.set()
+            release.wait(5)
+            pinged.set()
+
+        hung._connection.ping = _slow_ping
+        monitor.register(hung, owner="client", kind="RPyCConnection")
+        monitor.register(dropped, owner="sut", kind="RPyCConnection")
+        checker = threading.Thread(target=monitor.check)
+        checker.start()
+        try:
+            assert pinging.wait(1)
+            dropped._connection.closed = True
+            monitor.reconnect_dead()
+            assert dropped.reconnects == 1 and hung.reconnects == 0
+            assert not pinged.is_set()
+        finally:
+            release.set()
+            checker.join()
+            monitor.stop()
+
+    def test_background_keepalive(self):
+        monitor = KeepaliveMonitor(interval=0.01)
+        connection = Connection(RPyCLike())
+        sent = threading.Event()
+        connection._connection.ping = lambda timeout: sent.set()
+        monitor.register(connection, owner="sut", kind="RPyCConnection")
+        try:
+            assert sent.wait(1)
+        finally:
+            monitor.stop()
+
+    def test_unregister(self):
+        monitor = KeepaliveMonitor(interval=3600)
+        connection = Connection(RPyCLike())
+        monitor.register(connection, owner="sut", kind="RPyCConnection")
+        monitor.unregister(connection)
+        monitor.stop()
+        assert monitor._live_targets() == []
@@ -0,0 +1,89 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test leak tracker."""
+
+from types import SimpleNamespace
+
+from pytest_mfd_config.utils.leak_tracker import LeakTracker, format_open_counts, weak_reference
+
+
+class Resource:
+    def __init__(self, name, connection=None):
+        self.name = name
+        self._connection = connection
+
+    def __str__(self):
+        return self.name
+
+
+class TestLeakTracker:
+    def test_track_disabled(self):
+        tracker = LeakTracker()
+        resource = Resource("rpyc")
+        assert tracker.track(resource, owner="sut", kind="RPyCConnection") is resource
+        assert tracker.open_objects() == []
+
+    def test_track_records_creation_stack(self):
+        tracker = LeakTracker(enabled=True)
+        resource = tracker.track(Resource("rpyc"), owner="sut", kind="RPyCConnection")
+        [entry] = tracker.open_objects()
+        assert (entry.owner, entry.kind, entry.description, entry.obj) == ("sut", "RPyCConnection", "rpyc", resource)
+        assert "test_track_records_creation_stack" in entry.stack
+
+    def test_track_same_object_once(self):
+        tracker = LeakTracker(enabled=True)
+        resource = Resource("rpyc")
+        tracker.track(resource, owner="sut", kind="RPyCConnection")
+        tracker.track(resource, owner="sut", kind="RPyCConnection")
+        assert tracker.open_counts() == {("sut", "RPyCConnection"): 1}
+
+    def test_open_counts(self):
+        tracker = LeakTracker(enabled=True)
+        resources = [
+            tracker.track(Resource("rpyc"), owner="sut", kind="RPyCConnection"),
+            tracker.track(Resource("ssh-1"), owner="sut", kind="SSHConnection"),
+            tracker.track(Resource("ssh-2"), owner="sut", kind="SSHConnection"),
+            tracker.track(Resource("switch"), owner="switch-1", kind="switch Cisco_NXOS"),
+        ]
+        assert tracker.open_counts() == {
+            ("sut", "RPyCConnection"): 1,
+            ("sut", "SSHConnection"): 2,
+            ("switch-1", "switch Cisco_NXOS"): 1,
+        }
+        tracker.mark_closed(resources[1])
+        assert tracker.open_counts()[("sut", "SSHConnection")] == 1
+
+    def test_garbage_collected_and_dropped_objects_are_not_open(self):
+        tracker = LeakTracker(enabled=True)
+        tracker.track(Resource("collected"), owner="sut", kind="SSHConnection")
+        dropped = tracker.track(
+            Resource("dropped", connection=SimpleNamespace(closed=True)), owner="sut", kind="RPyCConnection"
+        )
+        assert tracker.open_objects(collect=True) == []
+        assert dropped is not None
+
+    def test_power_mng_follows_state_of_its_connection(self):
+        tracker = LeakTracker(enabled=True)
+        connection = tracker.track(Resource("ssh"), owner="sut", kind="SSHConnection")
+        power_mng = tracker.track(Resource("ipmi", connection=connection), owner="sut", kind="power_mng Ipmi")
+        assert len(tracker.open_objects()) == 2
+        tracker.mark_closed(connection)
+        assert tracker.open_objects() == []
+        assert power_mng is not None
+
+    def test_format_open_counts(self):
+        assert format_open_counts({}) == "none"
+        assert (
+            format_open_counts(
+                {("sut", "SSHConnection"): 2, ("sut", "RPyCConnection"): 1, ("switch-1", "switch Cisco_NXOS"): 1}
+            )
+            == "sut: RPyCConnection=1, SSHConnection=2; switch-1: switch Cisco_NXOS=1"
+        )
+
+    def test_weak_reference(self):
+        resource = Resource("ssh")
+        reference = weak_reference(resource)
+        assert reference() is resource
+        del resource
+        assert reference() is None
+        assert weak_reference(1)() == 1
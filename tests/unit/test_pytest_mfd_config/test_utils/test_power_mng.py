@@ -0,0 +1,78 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test helpers for power management."""
+
+import functools
+
+from mfd_powermanagement import APC, Ipmi
+
+from pytest_mfd_config.models.topology import PowerMngModel
+from pytest_mfd_config.utils.power_mng import (
+    LazyPowerManagement,
+    build_power_mng_kwargs,
+    get_init_parameters,
+    get_missing_init_parameters,
+)
+
+
+def _decorator(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        local_variable = kwargs  # noqa: F841
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class Decorated:
+    @_decorator
+    def __init__(self, ip, /, username=None, *args, password=None, **kwargs):
+        pass
+
+
+class TestPowerMng:
+    def test_get_init_parameters_unwraps_decorated_constructor(self):
+        assert get_init_parameters(Decorated) == {"username", "password"}
+        assert get_init_parameters(APC) == {"ip", "udp_port", "community_string", "outlet_number"}
+        assert "local_variable" not in get_init_parameters(Decorated)
+
+    def test_get_init_parameters_cached(self):
+        get_init_parameters.cache_clear()
+        get_init_parameters(Ipmi)
+        get_init_parameters(Ipmi)
+        assert get_init_parameters.cache_info().hits == 1
+
+    def test_build_power_mng_kwargs(self):
+        model = PowerMngModel(power_mng_type="Ipmi", ip="10.10.10.10", username="root", password="***", outlet_number=3)
+        kwargs = build_power_mng_kwargs(Ipmi, model)
+        assert set(kwargs) == {"ip", "username", "password"}
+        assert kwargs["ip"] == "10.10.10.10"
+        assert kwargs["password"].get_secret_value() == "***"
+
+    def test_build_power_mng_kwargs_pdu(self):
+        model = PowerMngModel(power_mng_type="APC", ip="10.10.10.10", outlet_number=3, community_string="private")
+        assert build_power_mng_kwargs(APC, model) == {
+            "ip": "10.10.10.10",
+            "outlet_number": 3,
+            "community_string": "private",
+        }
+
+    def test_get_missing_init_parameters(self):
+        assert get_missing_init_parameters(Decorated, ["username"]) == set()
+        assert get_missing_init_parameters(APC, []) == {"ip"}
+
+    def test_lazy_power_mng_created_on_first_use(self, mocker):
+        power_mng = mocker.create_autospec(Ipmi, instance=True, _connection="connection")
+        factory = mocker.Mock(return_value=power_mng)
+        lazy_power_mng = LazyPowerManagement(Ipmi, factory)
+        assert isinstance(lazy_power_mng, Ipmi)
+        assert not lazy_power_mng.created
+        assert lazy_power_mng._connection is None
+        factory.assert_not_called()
+        lazy_power_mng.powercycle()
+        lazy_power_mng.power_down()
+        factory.assert_called_once()
+        assert lazy_power_mng.created
+        assert lazy_power_mng._connection == "connection"
+        power_mng.powercycle.assert_called_once()
+        assert "Ipmi (created)" in repr(lazy_power_mng)
@@ -0,0 +1,131 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test concurrent power operations."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+from mfd_powermanagement import APC, DLI, Ipmi
+
+from pytest_mfd_config.exceptions import PyTestMFDConfigException
+from pytest_mfd_config.utils.config_utils import Connections
+from pytest_mfd_config.utils.power_operations import (
+    BulkPower,
+    call_power_action,
+    get_host_connections,
+    power_group_key,
+    run_power_action,
+)
+
+
+def _host(mocker, name, power_mng_class=Ipmi, ip=None, connections=None, outlet_number=None):
+    connection = mocker.Mock(__str__=lambda _: "rpyc")
+    return SimpleNamespace(
+        name=name,
+        connection=connection,
+        connections=Connections(_connections=connections or [connection]),
+        power_mng=mocker.create_autospec(power_mng_class, instance=True),
+        topology=SimpleNamespace(
+            power_mng=SimpleNamespace(
+                power_mng_type=power_mng_class.__name__,
+                ip=ip or f"{name}-bmc",
+                host=None,
+                outlet_number=outlet_number,
+            )
+        ),
+    )
+
+
+class TestPowerOperations:
+    def test_call_power_action(self, mocker):
+        ipmi = mocker.create_autospec(Ipmi, instance=True)
+        call_power_action(ipmi, "cycle")
+        ipmi.powercycle.assert_called_once()
+        apc = mocker.create_autospec(APC, instance=True)
+        call_power_action(apc, "off")
+        apc.power_off.assert_called_once()
+        with pytest.raises(NotImplementedError, match="Power action 'on' is not supported by SimpleNamespace"):
+            call_power_action(SimpleNamespace(), "on")
+
+    def test_call_power_action_with_model_parameters(self, mocker):
+        dli = mocker.create_autospec(DLI, instance=True)
+        model = SimpleNamespace(outlet_number=3)
+        call_power_action(dli, "cycle", model, time_delay=5)
+        dli.power_cycle.assert_called_once_with(outlet_number=3, time_delay=5)
+        call_power_action(dli, "off", model)
+        dli.power_off.assert_called_once_with(outlet_number=3)
+        with pytest.raises(PyTestMFDConfigException, match="DLI.power_on requires parameters .*: outlet_number"):
+            call_power_action(dli, "on", SimpleNamespace(outlet_number=None))
+        apc = mocker.create_autospec(APC, instance=True)
+        call_power_action(apc, "on", SimpleNamespace(outlet_number=None))
+        apc.power_on.assert_called_once_with()
+
+    def test_power_group_key(self, mocker):
+        assert power_group_key(_host(mocker, "sut-1", APC, ip="10.10.10.1")) == ("outlets", "APC", "10.10.10.1")
+        assert power_group_key(_host(mocker, "sut-1", DLI, ip="10.10.10.2")) == ("outlets", "DLI", "10.10.10.2")
+        assert power_group_key(_host(mocker, "sut-1", Ipmi, ip="10.10.10.1")) == ("host", "sut-1")
+
+    def test_get_host_connections(self, mocker):
+        rpyc, ssh = mocker.Mock(__str__=lambda _: "rpyc"), mocker.Mock(__str__=lambda _: "ssh")
+        host = _host(mocker, "sut", connections=[rpyc, ssh])
+        host.connection = rpyc
+        assert get_host_connections(host) == [rpyc, ssh]
+
+    def test_run_power_action_concurrently(self, mocker):
+        barrier = threading.Barrier(2, timeout=1)
+        hosts = [_host(mocker, "sut-1"), _host(mocker, "sut-2")]
+        for host in hosts:
+            host.power_mng.powercycle.side_effect = lambda: barrier.wait()
+        results = run_power_action(hosts, "cycle")
+        assert all(result.ok for result in results.values())
+        for host in hosts:
+            host.connection.wait_for_host.assert_called_once_with(timeout=600)
+
+    @pytest.mark.parametrize("power_mng_class", [APC, DLI])
+    def test_run_power_action_serializes_shared_pdu(self, mocker, power_mng_class):
+        running = []
+        overlapped = []
+
+        def _power_off(**kwargs):
+            running.append(1)
+            overlapped.append(len(running) > 1)
+            threading.Event().wait(0.01)
+            running.pop()
+
+        hosts = [
+            _host(mocker, f"sut-{index}", power_mng_class, ip="10.10.10.1", outlet_number=index) for index in range(3)
+        ]
+        for host in hosts:
+            host.power_mng.power_off.side_effect = _power_off
+        results = run_power_action(hosts, "off")
+        assert not any(overlapped)
+        assert all(result.ok for result in results.values())
+        hosts[0].connection.wait_for_host.assert_not_called()
+        hosts[2].power_mng.power_off.assert_called_once_with(outlet_number=2)
+
+    def test_run_power_action_failures(self, mocker):
+        broken, not_waking, without_power_mng = _host(mocker, "broken"), _host(mocker, "late"), _host(mocker, "none")
+        broken.power_mng.power_up.side_effect = ConnectionError("BMC unreachable")
+        not_waking.connection.wait_for_host.side_effect = TimeoutError("Host does not wake up in 600 seconds")
+        without_power_mng.power_mng = None
+        results = run_power_action([broken, not_waking, without_power_mng], "on")
+        assert results["broken"].error == "ConnectionError: BMC unreachable"
+        broken.connection.wait_for_host.assert_not_called()
+        assert results["late"].wait_error == "TimeoutError: Host does not wake up in 600 seconds"
+        assert results["none"].error == "Host has no power management"
+
+    def test_run_power_action_unknown_action(self, mocker):
+        with pytest.raises(ValueError, match="Unknown power action 'reset'"):
+            run_power_action([_host(mocker, "sut")], "reset")
+
+    def test_bulk_power(self, mocker):
+        hosts = {"sut-1": _host(mocker, "sut-1"), "sut-2": _host(mocker, "sut-2")}
+        bulk_power = BulkPower(hosts, wait_timeout=30)
+        assert set(bulk_power.off(["sut-2"])) == {"sut-2"}
+        hosts["sut-1"].power_mng.power_down.assert_not_called()
+        bulk_power.on()
+        hosts["sut-1"].connection.wait_for_host.assert_called_once_with(timeout=30)
+        hosts["sut-2"].power_mng.powercycle.side_effect = ConnectionError("BMC unreachable")
+        with pytest.raises(PyTestMFDConfigException, match=r"Power cycle failed for hosts: sut-2 \(ConnectionError"):
+            bulk_power.cycle()
@@ -0,0 +1,127 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test preflight probe."""
+
+import socket
+
+import pytest
+
+from pytest_mfd_config.models.topology import TopologyModel
+from pytest_mfd_config.utils.preflight import (
+    Endpoint,
+    ProbeResult,
+    collect_endpoints,
+    probe_endpoint,
+    probe_endpoints,
+    format_probe_table,
+    get_unreachable_required,
+)
+
+TOPOLOGY = {
+    "metadata": {"version": "2.5"},
+    "hosts": [
+        {
+            "name": "sut",
+            "role": "sut",
+            "connections": [
+                {"ip_address": "10.10.10.10", "connection_type": "RPyCConnection"},
+                {
+                    "ip_address": "10.10.10.11",
+                    "connection_type": "TunneledSSHConnection",
+                    "connection_options": {"jump_host_ip": "10.10.10.1"},
+                },
+            ],
+            "power_mng": {"power_mng_type": "Raritan", "ip": "10.10.10.12", "community_string": "private"},
+        },
+        {
+            "name": "client",
+            "role": "client",
+            "instantiate": False,
+            "connections": [
+                {"ip_address": "10.10.10.20", "connection_type": "SSHConnection", "connection_options": {"port": 2222}}
+            ],
+        },
+    ],
+    "switches": [
+        {
+            "name": "switch",
+            "switch_type": "Cisco_NXOS",
+            "connection_type": "SSHSwitchConnection",
+            "mng_ip_address": "10.10.10.30",
+        }
+    ],
+}
+
+
+class TestPreflight:
+    @pytest.fixture()
+    def listening_port(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        yield server.getsockname()[1]
+        server.close()
+
+    @pytest.fixture()
+    def closed_port(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        port = server.getsockname()[1]
+        server.close()
+        return port
+
+    def test_collect_endpoints(self):
+        endpoints = collect_endpoints(TopologyModel(**TOPOLOGY))
+        assert endpoints == [
+            Endpoint("sut", "RPyCConnection(id=0)", "10.10.10.10", 18816, True),
+            Endpoint("sut", "TunneledSSHConnection(id=0)", "10.10.10.1", 22, True),
+            Endpoint("sut", "power_mng(Raritan)", "10.10.10.12", None, True),
+            Endpoint("client", "SSHConnection(id=0)", "10.10.10.20", 2222, False),
+            Endpoint("switch", "switch(SSHSwitchConnection)", "10.10.10.30", 22, True),
+        ]
+
+    def test_probe_endpoint_reachable(self, listening_port):
+        result = probe_endpoint(Endpoint("sut", "rpyc", "127.0.0.1", listening_port), timeout=1)
+        assert result.reachable is True
+        assert result.latency is not None
+        assert result.status == "OK"
+
+    def test_probe_endpoint_unreachable(self, closed_port):
+        result = probe_endpoint(Endpoint("sut", "rpyc", "127.0.0.1", closed_port), timeout=1)
+        assert result.reachable is False
+        assert result.error
+        assert result.status == "UNREACHABLE"
+
+    def test_probe_endpoint_without_port(self, mocker):
+        create_connection = mocker.patch("pytest_mfd_config.utils.preflight.socket.create_connection")
+        result = probe_endpoint(Endpoint("sut", "power_mng(Raritan)", "10.10.10.12", None), timeout=1)
+        assert result.reachable is None
+        assert result.status == "NOT PROBED"
+        create_connection.assert_not_called()
+
+    def test_probe_endpoints_keeps_order(self, listening_port, closed_port):
+        endpoints = [
+            Endpoint("a", "rpyc", "127.0.0.1", closed_port),
+            Endpoint("b", "rpyc", "127.0.0.1", listening_port),
+        ]
+        results = probe_endpoints(endpoints, timeout=1)
+        assert [result.endpoint for result in results] == endpoints
+        assert [result.reachable for result in results] == [False, True]
+
+    def test_get_unreachable_required(self):
+        required = ProbeResult(Endpoint("a", "rpyc", "1.1.1.1", 1), reachable=False)
+        optional = ProbeResult(Endpoint("b", "rpyc", "1.1.1.2", 1, required=False), reachable=False)
+        not_probed = ProbeResult(Endpoint("c", "rpyc", "1.1.1.3", None), reachable=None)
+        assert get_unreachable_required([required, optional, not_probed]) == [required]
+
+    def test_format_probe_table(self):
+        table = format_probe_table(
+            [
+                ProbeResult(Endpoint("sut", "rpyc", "1.1.1.1", 18816), reachable=True, latency=0.0012),
+                ProbeResult(Endpoint("client", "ssh", "1.1.1.2", 22), reachable=False, error="timed out"),
+            ]
+        )
+        lines = table.splitlines()
+        assert lines[0].split() == ["OWNER", "ENDPOINT", "ADDRESS", "REQUIRED", "STATUS", "LATENCY"]
+        assert lines[1].split() == ["sut", "rpyc", "1.1.1.1:18816", "yes", "OK", "1.2", "ms"]
+        assert lines[2].split() == ["client", "ssh", "1.1.1.2:22", "yes", "UNREACHABLE", "timed", "out"]
@@ -0,0 +1,101 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test emitting of chatty log records from background thread."""
+
+import logging
+import sys
+import threading
+import time
+
+import pytest
+from mfd_common_libs import log_levels
+
+from pytest_mfd_config.utils.queued_logging import QueuedLogging
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__(level=1)
+        self.records = []
+        self.formatted = []
+        self.threads = []
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None and threading.current_thread().name == "queued logging":
+            self.gate.wait(timeout=5)
+        self.records.append(record.getMessage())
+        self.formatted.append(self.format(record))
+        self.threads.append(threading.current_thread().name)
+
+
+def _record(level, msg):
+    return logging.LogRecord("mfd", level, __file__, 1, msg, None, None)
+
+
+class TestQueuedLogging:
+    def test_queued_levels_emitted_by_background_thread(self):
+        handler = _ListHandler()
+        queued = QueuedLogging()
+        queued.configure([handler])
+        handler.handle(_record(log_levels.CMD, "ip link show"))
+        handler.handle(_record(logging.INFO, "info"))
+        queued.flush()
+        assert dict(zip(handler.records, handler.threads)) == {
+            "ip link show": "queued logging",
+            "info": threading.current_thread().name,
+        }
+        queued.stop()
+        assert not queued.enabled and not handler.filters
+        handler.handle(_record(log_levels.OUT, "output"))
+        assert handler.threads[-1] == threading.current_thread().name
+
+    @pytest.mark.parametrize("policy, expected", [("new", ["first", "second"]), ("old", ["first", "third"])])
+    def test_drop_policy(self, policy, expected):
+        gate = threading.Event()
+        handler = _ListHandler(gate)
+        queued = QueuedLogging()
+        queued.configure([handler], queue_size=1, policy=policy)
+        handler.handle(_record(log_levels.CMD, "first"))
+        while not queued._queue.empty():
+            time.sleep(0.001)  # wait until background thread takes first record and waits in handler
+        handler.handle(_record(log_levels.CMD, "second"))
+        handler.handle(_record(log_levels.CMD, "third"))
+        gate.set()
+        queued.stop()
+        assert handler.records == expected
+        assert queued.dropped == 1
+
+    def test_block_policy_keeps_all_records(self):
+        handler = _ListHandler()
+        queued = QueuedLogging()
+        queued.configure([handler], queue_size=1, policy="block")
+        for index in range(100):
+            handler.handle(_record(log_levels.MODULE_DEBUG, str(index)))
+        queued.stop()
+        assert handler.records == [str(index) for index in range(100)]
+        assert queued.dropped == 0
+
+    def test_record_prepared_in_caller(self):
+        gate = threading.Event()
+        handler = _ListHandler(gate)
+        queued = QueuedLogging()
+        queued.configure([handler])
+        interfaces = ["eth0"]
+        record = logging.LogRecord("mfd", log_levels.OUT, __file__, 1, "interfaces: %s", (interfaces,), None)
+        try:
+            raise RuntimeError("broken pipe")
+        except RuntimeError:
+            record.exc_info = sys.exc_info()
+        handler.handle(record)
+        interfaces.append("eth1")
+        gate.set()
+        queued.stop()
+        assert handler.records == ["interfaces: ['eth0']"]
+        formatted = handler.formatted[0]
+        assert formatted.startswith("interfaces: ['eth0']\nTraceback") and "RuntimeError: broken pipe" in formatted
+        assert record.args == (interfaces,) and record.exc_info is not None
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="Unknown drop policy 'random'"):
+            QueuedLogging().configure([], policy="random")
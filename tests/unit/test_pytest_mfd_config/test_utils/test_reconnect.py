@@ -0,0 +1,94 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test re-establishing connections of hosts."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_mfd_config.exceptions import PyTestMFDConfigException
+from pytest_mfd_config.utils.config_utils import Connections
+from pytest_mfd_config.utils.reconnect import HostReconnector, poll_with_backoff, reconnect_hosts
+
+
+def _connection(mocker, kind):
+    return mocker.Mock(__str__=lambda _: kind)
+
+
+def _host(mocker, name, network_interfaces=None):
+    rpyc, ssh = _connection(mocker, "rpyc"), _connection(mocker, "ssh")
+    host = SimpleNamespace(
+        name=name,
+        connection=rpyc,
+        connections=Connections(_connections=[rpyc, ssh]),
+        power_mng=None,
+        topology=SimpleNamespace(name=name, network_interfaces=network_interfaces),
+        network_interfaces=["stale interface"],
+        refresh_network_interfaces=mocker.Mock(),
+        _network="network bound to previous connection",
+    )
+    return host, rpyc, ssh
+
+
+class TestReconnect:
+    def test_poll_with_backoff(self, mocker):
+        sleep = mocker.patch("pytest_mfd_config.utils.reconnect.time.sleep")
+        func = mocker.Mock(side_effect=[ConnectionError("refused"), ConnectionError("refused"), ConnectionError(), 7])
+        assert poll_with_backoff(func, timeout=60, initial_delay=1, max_delay=3) == (7, 4)
+        assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 3]
+
+    def test_poll_with_backoff_timeout(self, mocker):
+        func = mocker.Mock(side_effect=ConnectionError("refused"))
+        with pytest.raises(TimeoutError, match="Connecting to sut did not succeed after .* error: ConnectionError"):
+            poll_with_backoff(func, timeout=0.05, initial_delay=0.01, description="Connecting to sut")
+        assert func.call_count > 1
+
+    def test_reconnect_hosts_swaps_connections_in_place(self, mocker):
+        host, rpyc, ssh = _host(mocker, "sut", network_interfaces=["eth1"])
+        connections = host.connections
+        new_rpyc = _connection(mocker, "rpyc")
+        create_connections = mocker.Mock(side_effect=[ConnectionError("host is booting"), [new_rpyc]])
+
+        results = reconnect_hosts([host], create_connections, initial_delay=0.01)
+
+        assert results["sut"].ok and results["sut"].attempts == 2
+        rpyc.disconnect.assert_called_once()
+        ssh.disconnect.assert_called_once()
+        create_connections.assert_called_with(host.topology)
+        assert host.connection is new_rpyc
+        assert host.connections is connections
+        assert (connections.rpyc, connections.ssh) == (new_rpyc, None)
+        assert host._network is None
+        assert host.network_interfaces == []
+        host.refresh_network_interfaces.assert_called_once_with()
+
+    def test_reconnect_hosts_concurrently(self, mocker):
+        barrier = threading.Barrier(2, timeout=1)
+
+        def _create_connections(host_model):
+            barrier.wait()
+            return [_connection(mocker, "rpyc")]
+
+        hosts = [_host(mocker, "sut")[0], _host(mocker, "client")[0]]
+        results = reconnect_hosts(hosts, _create_connections)
+        assert all(result.ok for result in results.values())
+        hosts[0].refresh_network_interfaces.assert_not_called()
+
+    def test_reconnect_hosts_failure(self, mocker):
+        host, rpyc, _ = _host(mocker, "sut")
+        rpyc.disconnect.side_effect = EOFError("connection closed by peer")
+        results = reconnect_hosts(
+            [host], mocker.Mock(side_effect=ConnectionError("refused")), timeout=0.05, initial_delay=0.01
+        )
+        assert results["sut"].error.startswith("TimeoutError: Connecting to sut did not succeed")
+        assert host.connection is rpyc
+
+    def test_host_reconnector(self, mocker):
+        hosts = {"sut": _host(mocker, "sut")[0], "client": _host(mocker, "client")[0]}
+        create_connections = mocker.Mock(side_effect=lambda host_model: [_connection(mocker, "rpyc")])
+        reconnector = HostReconnector(hosts, create_connections, timeout=0.05)
+        assert set(reconnector.reconnect(["client"])) == {"client"}
+        create_connections.side_effect = ConnectionError("refused")
+        with pytest.raises(PyTestMFDConfigException, match=r"Reconnecting failed for hosts: sut \(TimeoutError"):
+            reconnector.reconnect(["sut"], initial_delay=0.01)
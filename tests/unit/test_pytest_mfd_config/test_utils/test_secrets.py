@@ -0,0 +1,89 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test lazy decryption of secrets."""
+
+import threading
+
+import pytest
+from cryptography.fernet import Fernet
+
+from pytest_mfd_config.models.test_config import SecretModel
+from pytest_mfd_config.utils.secrets import DecryptedModelCache, LazySecrets, get_cipher, is_fernet_token
+
+KEY = Fernet.generate_key()
+
+
+def _secrets(**values):
+    cipher = Fernet(KEY)
+    return [{"name": name, "value": cipher.encrypt(value.encode()).decode()} for name, value in values.items()]
+
+
+class TestSecrets:
+    def test_get_cipher_cached_per_key(self):
+        assert get_cipher(KEY) is get_cipher(KEY)
+        assert get_cipher(KEY) is not get_cipher(Fernet.generate_key())
+
+    def test_lazy_secrets_decrypt_on_first_access(self, mocker):
+        cipher = mocker.Mock(wraps=get_cipher(KEY))
+        get = mocker.Mock(return_value=cipher)
+        secrets = LazySecrets(_secrets(first="value1", second="value2"), get)
+
+        assert len(secrets) == 2
+        assert list(secrets) == ["first", "second"]
+        assert "first" in secrets and "third" not in secrets
+        get.assert_not_called()
+
+        assert secrets["first"] == SecretModel(name="first", value="value1")
+        assert secrets["first"] is secrets["first"]
+        assert cipher.decrypt.call_count == 1
+        with pytest.raises(KeyError):
+            secrets["third"]
+
+    def test_lazy_secrets_read_only(self):
+        secrets = LazySecrets(_secrets(first="value1"), lambda: get_cipher(KEY))
+        with pytest.raises(TypeError):
+            secrets["first"] = SecretModel(name="first", value="other")
+        assert dict(secrets) == {"first": SecretModel(name="first", value="value1")}
+
+    def test_lazy_secrets_decrypted_once_in_threads(self, mocker):
+        cipher = mocker.Mock(wraps=get_cipher(KEY))
+        secrets = LazySecrets(_secrets(first="value1"), lambda: cipher)
+        threads = [threading.Thread(target=secrets.__getitem__, args=("first",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert cipher.decrypt.call_count == 1
+
+    def test_is_fernet_token(self):
+        assert is_fernet_token(Fernet(KEY).encrypt(b"password").decode())
+        assert is_fernet_token(Fernet(KEY).encrypt(b"x" * 40).decode().rstrip("="))
+        assert not is_fernet_token("password")
+        assert not is_fernet_token("gAAAAAB")
+        assert not is_fernet_token("pässwörd")
+
+    def test_decrypted_model_cache(self, mocker):
+        cache = DecryptedModelCache()
+        model, other = object(), object()
+        barrier = threading.Barrier(4, timeout=1)
+
+        def _decrypt(obj):
+            return ("decrypted", obj)
+
+        decrypt = mocker.Mock(side_effect=_decrypt)
+
+        def _get():
+            barrier.wait()
+            cache.get(model, decrypt)
+
+        threads = [threading.Thread(target=_get) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert cache.get(model, decrypt) == ("decrypted", model)
+        assert cache.get(other, decrypt) == ("decrypted", other)
+        assert decrypt.call_count == 2
+        cache.clear()
+        cache.get(model, decrypt)
+        assert decrypt.call_count == 3
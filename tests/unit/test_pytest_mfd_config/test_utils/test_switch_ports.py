@@ -0,0 +1,176 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test reading of switch port details."""
+
+import threading
+from types import SimpleNamespace
+
+from pytest_mfd_config.utils.switch_ports import (
+    PortStatus,
+    SwitchPortInfo,
+    collect_switch_port_details,
+    fetch_switch_port_details,
+    group_interfaces_by_switch,
+    interface_id,
+    parse_ports_status,
+)
+
+
+def _interface(**kwargs):
+    fields = dict(interface_name=None, pci_address=None, mac_address=None, switch_name=None, switch_port=None)
+    fields.update(kwargs)
+    return SimpleNamespace(**fields)
+
+
+TOPOLOGY = SimpleNamespace(
+    hosts=[
+        SimpleNamespace(
+            name="sut",
+            network_interfaces=[
+                _interface(interface_name="eth1", switch_name="switch-1", switch_port="Ethernet1/1"),
+                _interface(pci_address="0000:18:00.1", switch_name="switch-1", mac_address="00:00:00:00:00:02"),
+                _interface(interface_name="eth3"),
+            ],
+        ),
+        SimpleNamespace(
+            name="client",
+            network_interfaces=[
+                _interface(switch_name="switch-2", mac_address="00:00:00:00:00:03", switch_port="Ethernet1/3"),
+                _interface(interface_name="eth2", switch_name="switch-1", switch_port="Ethernet1/1"),
+            ],
+        ),
+        SimpleNamespace(name="no-interfaces", network_interfaces=None),
+    ]
+)
+
+CISCO_STATUS = """
+--------------------------------------------------------------------------------
+Port          Name               Status    Vlan      Duplex  Speed   Type
+--------------------------------------------------------------------------------
+Eth1/1        sut eth1           connected trunk     full    100G    QSFP-100G-CR4
+Eth1/2        --                 notconnec 10        auto    auto    10Gbase-SR
+Gi1/0/3       client             connected 20        a-full  a-1000  10/100/1000BaseTX
+"""
+
+MELLANOX_STATUS = """
+Port                   Operational state           Speed                  Negotiation
+----                   -----------------           -----                  -----------
+Eth1/1                 Up                          100G                   No-Negotiation
+Eth1/2                 Down                        Unknown                Auto
+"""
+
+
+class TestSwitchPorts:
+    def test_interface_id(self):
+        assert interface_id(_interface(interface_name="eth1", pci_address="0000:18:00.0"), 0) == "eth1"
+        assert interface_id(_interface(pci_address="0000:18:00.0"), 0) == "0000:18:00.0"
+        assert interface_id(_interface(mac_address="00:00:00:00:00:01"), 0) == "00:00:00:00:00:01"
+        assert interface_id(_interface(), 4) == "#4"
+
+    def test_group_interfaces_by_switch(self):
+        groups = group_interfaces_by_switch(TOPOLOGY)
+        assert {name: [key for key, _ in group] for name, group in groups.items()} == {
+            "switch-1": [("sut", "eth1"), ("sut", "0000:18:00.1"), ("client", "eth2")],
+            "switch-2": [("client", "00:00:00:00:00:03")],
+        }
+
+    def test_collect_switch_port_details(self, mocker):
+        switch_1 = mocker.Mock(
+            **{
+                "get_port_by_mac.return_value": "Ethernet1/2",
+                "get_vlan_by_mac.return_value": 10,
+                "get_port_speed.return_value": 100000,
+                "is_port_linkup.return_value": True,
+            }
+        )
+        switch_2 = mocker.Mock(
+            **{
+                "get_vlan_by_mac.side_effect": NotImplementedError("not supported"),
+                "get_port_speed.return_value": 25000,
+                "is_port_linkup.return_value": False,
+            }
+        )
+        barrier = threading.Barrier(2, timeout=1)
+
+        def _get_switch(name):
+            barrier.wait()
+            return {"switch-1": switch_1, "switch-2": switch_2}[name]
+
+        details = collect_switch_port_details(TOPOLOGY, _get_switch)
+
+        assert details["sut", "eth1"] == SwitchPortInfo("switch-1", port="Ethernet1/1", speed=100000, link_up=True)
+        assert details["sut", "0000:18:00.1"] == SwitchPortInfo(
+            "switch-1", port="Ethernet1/2", vlan=10, speed=100000, link_up=True
+        )
+        assert details["client", "00:00:00:00:00:03"] == SwitchPortInfo(
+            "switch-2",
+            port="Ethernet1/3",
+            speed=25000,
+            link_up=False,
+            errors={"vlan": "NotImplementedError: not supported"},
+        )
+        assert len(details) == 4
+        assert switch_1.get_port_speed.call_count == 2
+        assert switch_1.is_port_linkup.call_count == 2
+        assert set(details.for_host("sut")) == {"eth1", "0000:18:00.1"}
+        assert details.interfaces_on_port("switch-1", "Ethernet1/1") == [("sut", "eth1"), ("client", "eth2")]
+
+    def test_collect_switch_port_details_unavailable_switch(self, mocker):
+        switch_1 = mocker.Mock()
+
+        def _get_switch(name):
+            if name == "switch-2":
+                raise KeyError(name)
+            return switch_1
+
+        details = collect_switch_port_details(TOPOLOGY, _get_switch)
+        assert details["client", "00:00:00:00:00:03"] == SwitchPortInfo(
+            "switch-2", port="Ethernet1/3", errors={"switch": "KeyError: 'switch-2'"}
+        )
+        assert details["sut", "eth1"].errors == {}
+
+    def test_parse_ports_status(self):
+        assert parse_ports_status(CISCO_STATUS) == {
+            "et1/1": PortStatus(vlan=None, speed=100000, link_up=True),
+            "et1/2": PortStatus(vlan=10, speed=None, link_up=False),
+            "gi1/0/3": PortStatus(vlan=20, speed=1000, link_up=True),
+        }
+        assert parse_ports_status(MELLANOX_STATUS) == {
+            "et1/1": PortStatus(speed=100000, link_up=True),
+            "et1/2": PortStatus(link_up=False),
+        }
+        assert parse_ports_status("% Invalid command") == {}
+
+    def test_fetch_switch_port_details_single_status_query(self, mocker):
+        switch = mocker.Mock(
+            **{
+                "show_ports_status.return_value": CISCO_STATUS,
+                "get_port_by_mac.return_value": "Ethernet1/2",
+                "get_vlan_by_mac.return_value": 30,
+                "get_port_speed.return_value": 25000,
+                "is_port_linkup.return_value": True,
+            }
+        )
+        interfaces = [
+            (("sut", "eth1"), _interface(switch_port="Ethernet1/1", mac_address="00:00:00:00:00:01")),
+            (("sut", "eth2"), _interface(mac_address="00:00:00:00:00:02")),
+            (("client", "eth1"), _interface(switch_port="GigabitEthernet1/0/3")),
+            (("client", "eth2"), _interface(switch_port="Ethernet1/9")),
+        ]
+
+        details = fetch_switch_port_details(switch, "switch-1", interfaces)
+
+        assert details["sut", "eth1"] == SwitchPortInfo(
+            "switch-1", port="Ethernet1/1", vlan=30, speed=100000, link_up=True
+        )
+        assert details["sut", "eth2"] == SwitchPortInfo(
+            "switch-1", port="Ethernet1/2", vlan=10, speed=25000, link_up=False
+        )
+        assert details["client", "eth1"] == SwitchPortInfo(
+            "switch-1", port="GigabitEthernet1/0/3", vlan=20, speed=1000, link_up=True
+        )
+        assert details["client", "eth2"] == SwitchPortInfo("switch-1", port="Ethernet1/9", speed=25000, link_up=True)
+        switch.show_ports_status.assert_called_once_with()
+        switch.get_vlan_by_mac.assert_called_once_with("00:00:00:00:00:01")
+        assert [call.args for call in switch.get_port_speed.call_args_list] == [("Ethernet1/2",), ("Ethernet1/9",)]
+        switch.is_port_linkup.assert_called_once_with("Ethernet1/9")
@@ -0,0 +1,77 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test lazy creation of switches and device types cache."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_mfd_config.utils.switches import (
+    DEVICE_TYPES_CACHE_KEY,
+    LazySwitches,
+    SwitchDeviceTypeCache,
+    device_type_key,
+)
+
+
+class FakeCache(dict):
+    def set(self, key, value):
+        self[key] = dict(value)
+
+
+class TestSwitches:
+    models = [SimpleNamespace(name="switch-1"), SimpleNamespace(name="switch-2")]
+
+    def test_lazy_switches_created_on_first_access(self, mocker):
+        factory = mocker.Mock(side_effect=lambda model: f"switch of {model.name}")
+        lazy_switches = LazySwitches(self.models, factory)
+        assert list(lazy_switches) == ["switch-1", "switch-2"]
+        assert len(lazy_switches) == 2
+        assert lazy_switches.created() == []
+        factory.assert_not_called()
+        assert lazy_switches["switch-2"] == "switch of switch-2"
+        assert lazy_switches["switch-2"] == "switch of switch-2"
+        factory.assert_called_once_with(self.models[1])
+        assert lazy_switches.created() == ["switch of switch-2"]
+        with pytest.raises(KeyError):
+            lazy_switches["switch-3"]
+
+    def test_create_all_serial(self, mocker):
+        lazy_switches = LazySwitches(self.models, lambda model: model.name)
+        assert lazy_switches.create_all() == ["switch-1", "switch-2"]
+
+    def test_create_all_concurrent(self):
+        barrier = threading.Barrier(2, timeout=1)
+
+        def _factory(model):
+            barrier.wait()
+            return model.name
+
+        assert LazySwitches(self.models, _factory).create_all(concurrent=True) == ["switch-1", "switch-2"]
+
+    def test_create_all_concurrent_error(self):
+        def _factory(model):
+            if model.name == "switch-2":
+                raise ConnectionError("refused")
+            return model.name
+
+        lazy_switches = LazySwitches(self.models, _factory)
+        with pytest.raises(ConnectionError, match="refused"):
+            lazy_switches.create_all(concurrent=True)
+        assert lazy_switches.created() == ["switch-1"]
+
+    def test_device_type_cache(self):
+        pytest_cache = FakeCache({DEVICE_TYPES_CACHE_KEY: {"Cisco_NXOS@10.10.10.10": "cisco_nxos"}})
+        cache = SwitchDeviceTypeCache()
+        cache.configure(pytest_cache)
+        assert cache.get("Cisco_NXOS@10.10.10.10") == "cisco_nxos"
+        cache.set("Mellanox@10.10.10.11", "mellanox_mlnxos")
+        cache.forget("Cisco_NXOS@10.10.10.10")
+        assert pytest_cache[DEVICE_TYPES_CACHE_KEY] == {"Mellanox@10.10.10.11": "mellanox_mlnxos"}
+        cache.configure(None)
+        assert cache.get("Mellanox@10.10.10.11") is None
+
+    def test_device_type_key(self):
+        model = SimpleNamespace(switch_type="Cisco_NXOS", mng_ip_address="10.10.10.10")
+        assert device_type_key(model) == "Cisco_NXOS@10.10.10.10"
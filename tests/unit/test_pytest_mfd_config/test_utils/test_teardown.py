@@ -0,0 +1,77 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test teardown of connections."""
+
+import threading
+from types import SimpleNamespace
+
+from mfd_connect import LocalConnection
+
+from pytest_mfd_config.utils.config_utils import Connections
+from pytest_mfd_config.utils.connection_registry import connection_registry
+from pytest_mfd_config.utils.teardown import Resource, close_resources, host_resources, switch_resources
+
+
+class TestTeardown:
+    def test_host_resources(self, mocker):
+        rpyc = mocker.Mock(__str__=lambda _: "rpyc")
+        ssh = mocker.Mock(__str__=lambda _: "ssh")
+        power_mng_connection = mocker.Mock()
+        host = SimpleNamespace(
+            name="sut",
+            connection=rpyc,
+            connections=Connections(_connections=[rpyc, ssh]),
+            power_mng=SimpleNamespace(_connection=power_mng_connection),
+        )
+        resources = host_resources(host)
+        assert [(resource.description, resource.obj) for resource in resources] == [
+            ("rpyc", rpyc),
+            ("ssh", ssh),
+            ("power_mng SimpleNamespace", power_mng_connection),
+        ]
+        assert all(resource.owner == "sut" for resource in resources)
+
+    def test_host_resources_skips_local_power_mng_connection(self, mocker):
+        rpyc = mocker.Mock()
+        host = SimpleNamespace(
+            name="sut",
+            connection=rpyc,
+            connections=None,
+            power_mng=SimpleNamespace(_connection=mocker.create_autospec(LocalConnection, instance=True)),
+        )
+        assert [resource.obj for resource in host_resources(host)] == [rpyc]
+
+    def test_switch_resources(self, mocker):
+        switch = mocker.Mock(topology=SimpleNamespace(name="switch-1"))
+        assert switch_resources(switch) == [
+            Resource(owner="switch-1", description=f"switch {type(switch).__name__}", obj=switch)
+        ]
+
+    def test_close_resources(self, mocker):
+        clean = mocker.Mock()
+        broken = mocker.Mock(**{"disconnect.side_effect": OSError("socket closed")})
+        failures = close_resources([Resource("sut", "rpyc", clean), Resource("client", "ssh", broken)], deadline=1)
+        clean.disconnect.assert_called_once()
+        assert [(failure.owner, failure.description, failure.error) for failure in failures] == [
+            ("client", "ssh", "OSError: socket closed")
+        ]
+
+    def test_close_resources_deadline(self, mocker):
+        release = threading.Event()
+        hung = mocker.Mock(**{"disconnect.side_effect": lambda: release.wait()})
+        try:
+            failures = close_resources([Resource("sut", "serial", hung)], deadline=0.05)
+        finally:
+            release.set()
+        assert len(failures) == 1
+        assert failures[0].error.startswith("TimeoutError: teardown of 0 did not finish within deadline")
+
+    def test_close_resources_shared_connection(self, mocker):
+        shared = mocker.Mock(_connection=SimpleNamespace(closed=False))
+        mocker.patch.object(connection_registry, "_entries", {})
+        connection_registry.acquire("key", lambda: shared)
+        connection_registry.acquire("key", lambda: shared)
+        assert close_resources([Resource("sut", "rpyc", shared)], deadline=1) == []
+        shared.disconnect.assert_not_called()
+        close_resources([Resource("sut", "rpyc", shared)], deadline=1)
+        shared.disconnect.assert_called_once()